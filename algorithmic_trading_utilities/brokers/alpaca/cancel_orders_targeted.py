@@ -5,41 +5,179 @@ Only cancels orders for symbols that are about to receive new trades,
 preserving existing protective stops on other positions.
 """
 
-from algorithmic_trading_utilities.brokers.alpaca.orders import get_orders
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
+from alpaca.common.enums import Sort
+from alpaca.trading.enums import QueryOrderStatus
+from alpaca.trading.requests import GetOrdersRequest
 
-def cancel_orders_for_symbols(symbols, trading_client):
+# Symbols per server-side filter, keeping the request URL well within limits
+SYMBOLS_PER_REQUEST = 100
+# Maximum page size accepted by the orders endpoint
+ORDERS_PAGE_LIMIT = 500
+
+
+def get_open_orders_for_symbols(
+    symbols, trading_client, chunk_size=SYMBOLS_PER_REQUEST
+):
+    """Fetch open orders for the given symbols using server-side filters.
+
+    Long symbol lists are split into chunks of ``chunk_size`` symbols, so
+    only matching orders are transferred. Each chunk is paged as in
+    :func:`get_all_open_orders`, so no open order is left out however many
+    there are.
+
+    Args:
+        symbols: Iterable of ticker symbols.
+        trading_client: Alpaca TradingClient instance.
+        chunk_size: Maximum symbols per request.
+
+    Returns:
+        A tuple ``(orders, requests)`` of the matching open orders and the
+        number of requests made.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    symbols_set = set(symbols)
+    orders = []
+    requests = 0
+    seen = set()
+    for i in range(0, len(symbols), chunk_size):
+        page_orders, page_requests = _page_open_orders(
+            trading_client, symbols[i : i + chunk_size], seen
+        )
+        orders.extend(page_orders)
+        requests += page_requests
+    # The filter is applied server-side; this only guards against extra rows
+    return [o for o in orders if o.symbol in symbols_set], requests
+
+
+def get_all_open_orders(trading_client):
+    """Fetch every open order on the account.
+
+    Orders are paged newest first with ``until`` set to the oldest
+    ``submitted_at`` of the previous page, until a page comes back shorter
+    than ``ORDERS_PAGE_LIMIT``.
+
+    Args:
+        trading_client: Alpaca TradingClient instance.
+
+    Returns:
+        A tuple ``(orders, requests)`` of the open orders and the number of
+        requests made.
+    """
+    return _page_open_orders(trading_client, None, set())
+
+
+def _page_open_orders(trading_client, symbols, seen):
+    """Page through the open orders for ``symbols`` (None for all), skipping ``seen`` ids."""
+    orders = []
+    requests = 0
+    until = None
+    while True:
+        page = trading_client.get_orders(
+            filter=GetOrdersRequest(
+                status=QueryOrderStatus.OPEN,
+                symbols=symbols,
+                limit=ORDERS_PAGE_LIMIT,
+                direction=Sort.DESC,
+                until=until,
+            )
+        )
+        requests += 1
+        new = [o for o in page if o.id not in seen]
+        seen.update(o.id for o in new)
+        orders.extend(new)
+        if len(page) < ORDERS_PAGE_LIMIT:
+            break
+        if not new:
+            print(
+                f"Warning: more than {ORDERS_PAGE_LIMIT} open orders share one "
+                "submission time; some may not have been fetched."
+            )
+            break
+        # ``until`` is exclusive: step just past the oldest order so ones
+        # submitted at the same instant are fetched again (and deduplicated)
+        until = min(o.submitted_at for o in page) + timedelta(microseconds=1)
+    return orders, requests
+
+
+def _cancel_order(order, trading_client):
+    """Cancel one order and return its result record."""
+    start = time.perf_counter()
+    result = {
+        "order_id": str(order.id),
+        "symbol": order.symbol,
+        "type": str(getattr(order.type, "value", order.type)),
+        "status": "cancelled",
+        "error": None,
+    }
+    try:
+        trading_client.cancel_order_by_id(order.id)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = str(e)
+    result["latency_seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def cancel_orders_for_symbols(
+    symbols, trading_client, max_workers=8, chunk_size=SYMBOLS_PER_REQUEST
+):
     """Cancel open orders only for the specified symbols.
 
     Unlike blanket cancellation, this preserves trailing stop orders on
     positions not being re-entered, preventing the self-defeating pattern
     where protective stops are removed before new trades are placed.
 
+    Only the requested symbols are queried (chunked server-side filters)
+    and the matching orders are cancelled concurrently.
+
     Args:
         symbols: List of ticker symbols to cancel orders for. If empty,
             no orders are cancelled.
-        trading_client: Alpaca TradingClient instance used to cancel
-            individual orders.
+        trading_client: Alpaca TradingClient instance used to query and
+            cancel orders.
+        max_workers: Maximum cancellations in flight at once.
+        chunk_size: Maximum symbols per order query.
 
     Returns:
-        The number of orders successfully cancelled.
+        A dict with ``cancelled`` and ``failed`` counts, ``results`` (one
+        record per order with ``order_id``, ``symbol``, ``type``, ``status``,
+        ``error`` and ``latency_seconds``), ``requests`` (order queries made)
+        and ``fetch_seconds``, ``cancel_seconds`` and ``elapsed_seconds``.
     """
+    start = time.perf_counter()
+    report = {
+        "cancelled": 0,
+        "failed": 0,
+        "results": [],
+        "requests": 0,
+        "fetch_seconds": 0.0,
+        "cancel_seconds": 0.0,
+        "elapsed_seconds": 0.0,
+    }
     if not symbols:
-        return 0
+        return report
 
-    symbols_set = set(symbols)
-    orders = get_orders()
-    cancelled = 0
-
-    for order in orders:
-        if order.symbol in symbols_set:
-            try:
-                trading_client.cancel_order_by_id(order.id)
-                print(
-                    f"Cancelled {order.type} order for {order.symbol} (ID: {order.id})"
-                )
-                cancelled += 1
-            except Exception as e:
-                print(f"Failed to cancel order for {order.symbol}: {e}")
-
-    return cancelled
+    orders, report["requests"] = get_open_orders_for_symbols(
+        symbols, trading_client, chunk_size=chunk_size
+    )
+    fetched = time.perf_counter()
+
+    if orders:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(orders)))
+        ) as pool:
+            report["results"] = list(
+                pool.map(lambda o: _cancel_order(o, trading_client), orders)
+            )
+    done = time.perf_counter()
+
+    report["cancelled"] = sum(r["status"] == "cancelled" for r in report["results"])
+    report["failed"] = len(report["results"]) - report["cancelled"]
+    report["fetch_seconds"] = round(fetched - start, 4)
+    report["cancel_seconds"] = round(done - fetched, 4)
+    report["elapsed_seconds"] = round(done - start, 4)
+    return report
@@ -104,26 +104,39 @@ def place_order(
             return None
 
 
-def get_orders():
+def get_orders(state=None):
     """
     Retrieve all open orders.
 
+    Parameters:
+        state (TradeStateCache, optional): Stream-fed state to read from
+            instead of querying the REST API.
+
     Returns:
         list: A list of open orders.
     """
+    if state is not None:
+        return state.open_orders()
     orders = trading_client.get_orders(
         filter=GetOrdersRequest(status=QueryOrderStatus.OPEN)
     )
     return orders
 
 
-def get_current_trailing_stop_orders():
+def get_current_trailing_stop_orders(state=None):
     """
     Retrieve active trailing stop orders for both long and short positions.
 
+    Parameters:
+        state (TradeStateCache, optional): Stream-fed state to read from
+            instead of querying the REST API.
+
     Returns:
         list: A list of trailing stop orders with a status of OPEN (includes both BUY and SELL orders).
     """
+    if state is not None:
+        return state.open_orders(order_type="trailing_stop")
+
     # Get all open orders and filter for trailing stop type
     # This includes both SELL trailing stops (for long positions) and BUY trailing stops (for short positions)
     all_open_orders = trading_client.get_orders(
@@ -8,13 +8,15 @@ manager-facing reports from snapshot files.
 from __future__ import annotations
 
 import ast
+import itertools
 import json
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-
 # Keep import style consistent with the rest of this package.
 try:
     from common.config import trading_client
@@ -156,13 +158,16 @@ def save_strategy_snapshot(
             Path: Path to the saved JSON file.
     """
 
-    output_dir = (
-        Path(output_dir) if output_dir is not None else Path("strategy_snapshots")
-    )
-    output_dir.mkdir(parents=True, exist_ok=True)
+    state = _fetch_snapshot_state(timeframe, date_start, date_end)
+    return _write_strategy_snapshot(strategy_name, state, output_dir)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"{strategy_name}_snapshot_{timestamp}.json"
+
+def _fetch_snapshot_state(
+    timeframe: str = "1D",
+    date_start: Optional[str] = None,
+    date_end: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Fetch the account state a snapshot records, already serialized."""
 
     positions = trading_client.get_all_positions()
     orders = api.list_orders(status="all")
@@ -176,9 +181,7 @@ def save_strategy_snapshot(
         portfolio_kwargs["date_end"] = date_end
     equity_performance = api.get_portfolio_history(**portfolio_kwargs)
 
-    snapshot = {
-        "strategy": strategy_name,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+    return {
         "positions": _to_serializable(positions),
         "equity_performance": _to_serializable(equity_performance),
         "orders": _to_serializable(orders),
@@ -186,6 +189,26 @@ def save_strategy_snapshot(
         "balances": _to_serializable(balances),
     }
 
+
+def _write_strategy_snapshot(
+    strategy_name: str, state: Dict[str, Any], output_dir: Optional[Path] = None
+) -> Path:
+    """Write fetched account state as ``strategy_name``'s snapshot JSON."""
+
+    output_dir = (
+        Path(output_dir) if output_dir is not None else Path("strategy_snapshots")
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    output_path = output_dir / f"{strategy_name}_snapshot_{timestamp}.json"
+
+    snapshot = {
+        "strategy": strategy_name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        **state,
+    }
+
     output_path.write_text(
         json.dumps(snapshot, indent=2, default=str), encoding="utf-8"
     )
@@ -460,14 +483,125 @@ def _compute_performance_metrics(
         }
 
 
+def _snapshot_attribution(
+    normalized: Dict[str, Any],
+    starting_equity: Optional[float] = None,
+    fills: Any = None,
+) -> Any:
+    """Per-symbol attribution from a normalized snapshot.
+
+    Fills come from the snapshot activities; open positions are marked at
+    the snapshot positions' current price (or market value / qty), and at
+    the last fill price otherwise.
+
+    Args:
+            normalized: Output of `normalize_snapshot`.
+            starting_equity: Equity at the start of the period, for
+                    contribution to return.
+            fills: Optional `fills_frame` of the snapshot activities, when
+                    already built.
+
+    Returns:
+            Any: DataFrame from `compute_position_attribution`, or None when
+            pandas is unavailable.
+    """
+
+    if _get_pandas() is None:
+        return None
+    try:
+        from common.attribution import compute_position_attribution
+    except ImportError:  # pragma: no cover
+        from algorithmic_trading_utilities.common.attribution import (
+            compute_position_attribution,
+        )
+
+    marks = {}
+    for pos in normalized.get("positions", []):
+        symbol = pos.get("symbol")
+        price = _to_float(pos.get("current_price"))
+        if price is None:
+            market_value = _to_float(pos.get("market_value"))
+            qty = _to_float(pos.get("qty") or pos.get("quantity"))
+            if market_value is not None and qty:
+                price = abs(market_value / qty)
+        if symbol and price is not None:
+            marks[str(symbol)] = price
+
+    return compute_position_attribution(
+        fills if fills is not None else normalized.get("activities", []),
+        marks=marks,
+        starting_equity=starting_equity,
+        as_of=_to_datetime(normalized.get("timestamp")),
+    )
+
+
+def _snapshot_trades(fills: Any, lot_method: str = "fifo") -> Optional[Dict[str, Any]]:
+    """Round-trip trade section from a snapshot's fills.
+
+    Args:
+            fills: `fills_frame` of the snapshot activities.
+            lot_method: Lot relief order, `fifo` or `lifo`.
+
+    Returns:
+            Optional[dict]: Trade statistics, the largest winners and losers,
+            realized P/L per symbol and open lot count, or None when pandas
+            is unavailable.
+    """
+
+    if fills is None:
+        return None
+    try:
+        from common.trade_ledger import match_trades, trade_statistics
+    except ImportError:  # pragma: no cover
+        from algorithmic_trading_utilities.common.trade_ledger import (
+            match_trades,
+            trade_statistics,
+        )
+
+    trades = match_trades(fills, method=lot_method)
+    by_pnl = trades.sort_values("pnl", ascending=False, kind="stable")
+    by_symbol = (
+        trades.groupby("symbol")
+        .agg(trades=("pnl", "size"), realized_pnl=("pnl", "sum"))
+        .sort_values("realized_pnl", ascending=False)
+    )
+    return {
+        "lot_method": lot_method,
+        "statistics": trade_statistics(trades),
+        "open_lots": len(trades.attrs["open_lots"]),
+        "best_trades": _table_records(by_pnl[by_pnl["pnl"] > 0].head(5)),
+        "worst_trades": _table_records(by_pnl[by_pnl["pnl"] < 0].iloc[::-1].head(5)),
+        "by_symbol": _table_records(by_symbol.reset_index()),
+    }
+
+
+def _table_records(table: Any) -> list:
+    """Convert a DataFrame into JSON-friendly row dicts.
+
+    Timestamps become ISO-8601 strings and missing values None.
+    """
+
+    if table is None or table.empty:
+        return []
+    rows = table.copy()
+    for column in rows.columns[rows.dtypes.map(lambda d: d.kind == "M")]:
+        rows[column] = rows[column].map(lambda ts: ts.isoformat())
+    rows = rows.astype(object).where(rows.notna(), None)
+    return rows.to_dict(orient="records")
+
+
 def generate_strategy_report_data(
-    snapshot: Dict[str, Any], include_benchmark: bool = False
+    snapshot: Dict[str, Any],
+    include_benchmark: bool = False,
+    lot_method: str = "fifo",
 ) -> Dict[str, Any]:
     """Compute report aggregates from a snapshot dict.
 
     Args:
             snapshot: Raw snapshot dictionary.
             include_benchmark: Whether to compute benchmark-relative metrics.
+            lot_method: Lot relief order for round-trip trade matching,
+                    `fifo` or `lifo`.
 
     Returns:
             dict: Structured report data for rendering.
@@ -595,6 +729,22 @@ def generate_strategy_report_data(
     if not performance["available"] and performance.get("reason"):
         warnings.append(performance["reason"])
 
+    fills = None
+    if _get_pandas() is not None:
+        try:
+            from common.attribution import fills_frame
+        except ImportError:  # pragma: no cover
+            from algorithmic_trading_utilities.common.attribution import fills_frame
+        fills = fills_frame(activities)
+    attribution = _snapshot_attribution(
+        normalized,
+        starting_equity=(
+            float(equity_series.iloc[0]) if equity_series is not None else None
+        ),
+        fills=fills,
+    )
+    trades = _snapshot_trades(fills, lot_method=lot_method)
+
     if equity_series is None:
         equity_window = None
     else:
@@ -655,6 +805,16 @@ def generate_strategy_report_data(
                 max(activity_timestamps).isoformat() if activity_timestamps else None
             ),
         },
+        "trades": trades,
+        "attribution": {
+            "symbols_traded": 0 if attribution is None else len(attribution),
+            "total_pnl": (
+                None if attribution is None else attribution.attrs["total_pnl"]
+            ),
+            "symbols": _table_records(
+                None if attribution is None else attribution.reset_index()
+            ),
+        },
         "equity_performance": {
             "window": equity_window,
             "metrics_available": performance["available"],
@@ -681,6 +841,8 @@ def _render_markdown_report(report_data: Dict[str, Any]) -> str:
     pos = report_data.get("positions", {})
     ords = report_data.get("orders", {})
     acts = report_data.get("activities", {})
+    trades = report_data.get("trades") or {}
+    attr = report_data.get("attribution", {})
     eq = report_data.get("equity_performance", {})
     warnings = report_data.get("warnings", [])
 
@@ -734,6 +896,69 @@ def _render_markdown_report(report_data: Dict[str, Any]) -> str:
     lines.append(f"- Activity window: {acts.get('start')} -> {acts.get('end')}")
     lines.append("")
 
+    lines.append("## Round-Trip Trades")
+    if trades:
+        stats = trades.get("statistics", {})
+        lines.append(f"- Lot matching: {str(trades.get('lot_method')).upper()}")
+        lines.append(f"- Closed trades: {stats.get('trades')}")
+        lines.append(
+            f"- Winners: {stats.get('winners')}, Losers: {stats.get('losers')}, "
+            f"Win rate: {stats.get('win_rate')}"
+        )
+        lines.append(f"- Realized P/L: {stats.get('realized_pnl')}")
+        lines.append(f"- Profit factor: {stats.get('profit_factor')}")
+        lines.append(
+            f"- Average win: {stats.get('average_win')}, "
+            f"Average loss: {stats.get('average_loss')}"
+        )
+        lines.append(f"- Expectancy per trade: {stats.get('expectancy')}")
+        lines.append(
+            f"- Average holding days: {stats.get('average_holding_days')} "
+            f"(median {stats.get('median_holding_days')})"
+        )
+        lines.append(f"- Open lots: {trades.get('open_lots')}")
+        lines.append("")
+        for heading, key in (
+            ("Largest winning trades:", "best_trades"),
+            ("Largest losing trades:", "worst_trades"),
+        ):
+            if not trades.get(key):
+                continue
+            lines.append(heading)
+            lines.append("")
+            lines.append(
+                "| Symbol | Side | Qty | Entry | Exit | Entry Price | Exit Price | P/L | Holding Days |"
+            )
+            lines.append("| --- | --- | ---: | --- | --- | ---: | ---: | ---: | ---: |")
+            for item in trades[key]:
+                lines.append(
+                    f"| {item.get('symbol')} | {item.get('side')} | {item.get('qty')} | "
+                    f"{item.get('entry_time')} | {item.get('exit_time')} | "
+                    f"{item.get('entry_price')} | {item.get('exit_price')} | "
+                    f"{item.get('pnl')} | {item.get('holding_days')} |"
+                )
+            lines.append("")
+    else:
+        lines.append("- Trade matching unavailable (pandas is not installed)")
+        lines.append("")
+
+    lines.append("## Per-Symbol Attribution")
+    lines.append(f"- Symbols traded: {attr.get('symbols_traded')}")
+    lines.append(f"- Total trading P/L: {attr.get('total_pnl')}")
+    lines.append("")
+    if attr.get("symbols"):
+        lines.append(
+            "| Symbol | Fills | Open Qty | Mark | P/L | Contribution | Share of P/L | Holding Days |"
+        )
+        lines.append("| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: |")
+        for item in attr["symbols"]:
+            lines.append(
+                f"| {item.get('symbol')} | {item.get('fills')} | {item.get('open_qty')} | "
+                f"{item.get('mark_price')} | {item.get('pnl')} | {item.get('contribution')} | "
+                f"{item.get('pnl_share')} | {item.get('holding_days')} |"
+            )
+        lines.append("")
+
     lines.append("## Equity Performance")
     lines.append(f"- Window: {eq.get('window')}")
     if eq.get("metrics_available"):
@@ -762,6 +987,7 @@ def generate_strategy_report(
     output_path: Optional[Path] = None,
     format: str = "md",
     include_benchmark: bool = False,
+    lot_method: str = "fifo",
 ) -> Path:
     """Generate a portfolio-manager report from a strategy snapshot file.
 
@@ -770,6 +996,7 @@ def generate_strategy_report(
             output_path: Optional destination path. If omitted, saved next to snapshot.
             format: Output format, `md` or `json`.
             include_benchmark: Whether to attempt benchmark-relative performance metrics.
+            lot_method: Lot relief order for round-trip trades, `fifo` or `lifo`.
 
     Returns:
             Path: Output report file path.
@@ -778,7 +1005,7 @@ def generate_strategy_report(
     snapshot_path = Path(snapshot_path)
     snapshot = load_strategy_snapshot(snapshot_path)
     report_data = generate_strategy_report_data(
-        snapshot, include_benchmark=include_benchmark
+        snapshot, include_benchmark=include_benchmark, lot_method=lot_method
     )
 
     fmt = format.lower().strip()
@@ -831,6 +1058,9 @@ def generate_performance_report(
     date_end: Optional[str] = None,
     include_benchmark: bool = True,
     show_plots: bool = False,
+    render_workers: Optional[int] = None,
+    render_format: str = "png",
+    include_attribution: bool = True,
 ):
     """End-to-end performance reporting: snapshot JSON + metrics + PDF.
 
@@ -846,6 +1076,15 @@ def generate_performance_report(
         date_end: Optional end date YYYY-MM-DD for snapshot equity.
         include_benchmark: Fetch and align an S&P 500 benchmark series.
         show_plots: Display plots interactively in addition to the PDF.
+            Ignored when rendering in parallel.
+        render_workers: If set, render the plots in a process pool with this
+            many workers (see ``render_performance_pages``) instead of
+            in-process.
+        render_format: Page payload format for parallel rendering: ``"png"``
+            (rasterized in the workers) or ``"pickle"`` (vector figures).
+        include_attribution: Append per-symbol attribution pages built from
+            the snapshot's fills (see ``iter_attribution_figures``), one table
+            row per traded symbol.
 
     Returns:
         Tuple[Path, Path, dict]: ``(snapshot_path, pdf_path, metrics)``.
@@ -856,7 +1095,12 @@ def generate_performance_report(
             PerformanceMetrics,
             fetch_normalized_benchmark,
         )
-        from common.viz_ops import PerformanceViz, build_performance_figures
+        from common.viz_ops import (
+            PerformanceViz,
+            iter_attribution_figures,
+            iter_performance_figures,
+            render_performance_pages,
+        )
         from common.report_ops import write_performance_pdf
     except ImportError:  # pragma: no cover
         from algorithmic_trading_utilities.common.portfolio_ops import (
@@ -865,7 +1109,9 @@ def generate_performance_report(
         )
         from algorithmic_trading_utilities.common.viz_ops import (
             PerformanceViz,
-            build_performance_figures,
+            iter_attribution_figures,
+            iter_performance_figures,
+            render_performance_pages,
         )
         from algorithmic_trading_utilities.common.report_ops import (
             write_performance_pdf,
@@ -893,7 +1139,18 @@ def generate_performance_report(
     metrics = pm.calculate_all()
 
     viz = PerformanceViz(pm=pm, benchmark_equity=benchmark_equity)
-    figs = build_performance_figures(viz, show=show_plots)
+    if render_workers is not None:
+        figs = render_performance_pages(
+            viz, fmt=render_format, max_workers=render_workers
+        )["pages"]
+    else:
+        figs = iter_performance_figures(viz, show=show_plots)
+    if include_attribution:
+        attribution = _snapshot_attribution(
+            normalize_snapshot(load_strategy_snapshot(snapshot_path)),
+            starting_equity=float(portfolio_equity.iloc[0]),
+        )
+        figs = itertools.chain(figs, iter_attribution_figures(attribution))
 
     pdf_path = snapshot_path.with_name(snapshot_path.stem + "_report.pdf")
     period_text = (
@@ -909,3 +1166,300 @@ def generate_performance_report(
     )
 
     return snapshot_path, pdf_path, metrics
+
+
+def generate_multi_strategy_report(
+    strategies,
+    output_dir: Path = Path("strategy_snapshots"),
+    timeframe: str = "1D",
+    date_start: str = "1970-01-01",
+    date_end: Optional[str] = None,
+    include_benchmark: bool = True,
+    snapshot_workers: Optional[int] = None,
+    render_workers: Optional[int] = None,
+    title: str = "Strategy Comparison - Performance Report",
+):
+    """Performance reports for many strategies in one pass.
+
+    Does the work of :func:`generate_performance_report` for every strategy
+    while sharing what can be shared:
+
+    - the Alpaca account state (positions, orders, activities, balances and
+      portfolio history) and the account equity are fetched once and written
+      as a snapshot for every strategy that uses the account, concurrently
+      with the other strategies' equity sources;
+    - the S&P 500 benchmark is downloaded once;
+    - metrics for all strategies come from one ``calculate_panel_metrics``
+      pass per distinct date index;
+    - each strategy's plots are drawn and its PDF written as one job in a
+      process pool, alongside a consolidated comparison PDF (metrics table,
+      growth of $1, drawdowns and headline metric bars). Snapshot-backed
+      strategies also get per-symbol attribution pages, one table row per
+      traded symbol.
+
+    Only the fetches and the metrics are shared; every strategy's PDF is
+    still drawn in full (about 1.5 s for ten years of daily data), so on a
+    single CPU the total stays roughly N times one report's drawing cost
+    plus one fetch, not far below N separate reports. The saving is the
+    N-1 repeated account and benchmark round trips; the drawing only
+    divides across ``render_workers`` on multi-core hosts.
+
+    Example:
+        >>> generate_multi_strategy_report(["momentum", "mean_reversion"])
+        >>> generate_multi_strategy_report(
+        ...     {"live": None, "paper_b": get_account_b_equity, "backtest": equity}
+        ... )
+
+    Args:
+        strategies: Strategy names, or a mapping of strategy name -> equity
+            source. A source of ``None`` uses the Alpaca account equity and
+            saves a snapshot, as :func:`generate_performance_report` does; a
+            ``pd.Series`` or a zero-argument callable returning one (e.g.
+            another account's history) is used as the equity curve.
+        output_dir: Directory for snapshot JSON files and PDF reports.
+        timeframe: Portfolio history timeframe for the snapshots.
+        date_start: Start date YYYY-MM-DD for snapshots, benchmark and equity.
+        date_end: Optional end date YYYY-MM-DD for snapshot equity.
+        include_benchmark: Fetch and align an S&P 500 benchmark series.
+        snapshot_workers: Threads for snapshots and equity fetches.
+            Defaults to ``ThreadPoolExecutor``'s default.
+        render_workers: Processes drawing and writing the PDFs; defaults to
+            the CPU count, 1 writes them in-process.
+        title: Cover title of the consolidated PDF.
+
+    Returns:
+        dict: ``snapshots`` (name -> snapshot Path, account-backed strategies
+        only), ``pdfs`` (name -> PDF Path), ``consolidated_pdf`` (Path),
+        ``metrics`` (pd.DataFrame, one row per strategy) and ``timings``
+        (seconds per stage, and ``report_seconds`` per strategy PDF).
+    """
+
+    import pandas as pd
+
+    try:
+        from common.portfolio_ops import (
+            PerformanceMetrics,
+            calculate_panel_metrics,
+            fetch_normalized_benchmark,
+        )
+        from common.viz_ops import PerformanceViz, _use_agg_backend
+        from data.yfinance_ops import get_sp500_prices
+    except ImportError:  # pragma: no cover
+        from algorithmic_trading_utilities.common.portfolio_ops import (
+            PerformanceMetrics,
+            calculate_panel_metrics,
+            fetch_normalized_benchmark,
+        )
+        from algorithmic_trading_utilities.common.viz_ops import (
+            PerformanceViz,
+            _use_agg_backend,
+        )
+        from algorithmic_trading_utilities.data.yfinance_ops import get_sp500_prices
+
+    if not isinstance(strategies, dict):
+        strategies = {name: None for name in strategies}
+    if not strategies:
+        raise ValueError("strategies must not be empty")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timings = {}
+
+    # 1. Snapshots, the account equity and the benchmark, concurrently
+    start = time.perf_counter()
+    account_names = [name for name, source in strategies.items() if source is None]
+    with ThreadPoolExecutor(max_workers=snapshot_workers) as pool:
+        state_future = (
+            pool.submit(_fetch_snapshot_state, timeframe, date_start, date_end)
+            if account_names
+            else None
+        )
+        account_future = (
+            pool.submit(get_portfolio_equity_series) if account_names else None
+        )
+        source_futures = {
+            name: pool.submit(source)
+            for name, source in strategies.items()
+            if callable(source)
+        }
+        benchmark_future = (
+            pool.submit(get_sp500_prices, date_start) if include_benchmark else None
+        )
+        state = state_future.result() if state_future else None
+        snapshots = {
+            name: _write_strategy_snapshot(name, state, output_dir)
+            for name in account_names
+        }
+        account_equity = account_future.result() if account_future else None
+        raw_equity = {}
+        for name, source in strategies.items():
+            if source is None:
+                raw_equity[name] = account_equity
+            elif callable(source):
+                raw_equity[name] = source_futures[name].result()
+            else:
+                raw_equity[name] = source
+        benchmark_data = benchmark_future.result() if benchmark_future else None
+    timings["fetch_seconds"] = time.perf_counter() - start
+
+    # 2. Align to the benchmark and score each group of identical dates at once
+    start = time.perf_counter()
+    equities, benchmarks = {}, {}
+    for name, equity in raw_equity.items():
+        if include_benchmark:
+            equity, benchmarks[name] = fetch_normalized_benchmark(
+                equity, date_start, benchmark_data=benchmark_data
+            )
+        else:
+            benchmarks[name] = None
+        equities[name] = equity
+
+    groups = []
+    for name, equity in equities.items():
+        for index, names in groups:
+            if index.equals(equity.index):
+                names.append(name)
+                break
+        else:
+            groups.append((equity.index, [name]))
+    metrics = pd.concat(
+        [
+            calculate_panel_metrics(
+                pd.DataFrame({name: equities[name] for name in names}),
+                benchmarks[names[0]],
+            )
+            for _, names in groups
+        ]
+    ).loc[list(equities)]
+    timings["metrics_seconds"] = time.perf_counter() - start
+
+    # 3. One PDF job per strategy plus the comparison, in one process pool
+    start = time.perf_counter()
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    jobs = []
+    for name, equity in equities.items():
+        # An empty benchmark (not None) keeps PerformanceMetrics from fetching one
+        benchmark = benchmarks[name]
+        pm = PerformanceMetrics(
+            equity, benchmark if benchmark is not None else pd.Series(dtype=float)
+        )
+        attribution = None
+        if name in snapshots:
+            pdf_path = snapshots[name].with_name(snapshots[name].stem + "_report.pdf")
+            attribution = _snapshot_attribution(
+                normalize_snapshot(load_strategy_snapshot(snapshots[name])),
+                starting_equity=float(equity.iloc[0]),
+            )
+        else:
+            pdf_path = output_dir / f"{name}_{stamp}_report.pdf"
+        strategy_metrics = metrics.loc[name].to_dict()
+        strategy_metrics["drawdown_duration"] = int(
+            strategy_metrics["drawdown_duration"]
+        )
+        jobs.append(
+            {
+                "kind": "strategy",
+                "viz": PerformanceViz(pm=pm),
+                "attribution": attribution,
+                "pdf_path": pdf_path,
+                "title": f"{str(name).capitalize()} Strategy - Performance Report",
+                "metrics": strategy_metrics,
+                "period_text": (
+                    f"Period: {equity.index.min().date()} "
+                    f"to {equity.index.max().date()}"
+                ),
+            }
+        )
+
+    combined = pd.DataFrame(equities)
+    jobs.append(
+        {
+            "kind": "comparison",
+            "equity": combined,
+            "benchmark": next((b for b in benchmarks.values() if b is not None), None),
+            "pdf_path": output_dir / f"strategy_comparison_{stamp}_report.pdf",
+            "title": title,
+            "metrics": metrics,
+            "period_text": (
+                f"Period: {combined.index.min().date()} "
+                f"to {combined.index.max().date()}"
+            ),
+        }
+    )
+
+    if render_workers == 1:
+        results = [_write_report_pdf(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=render_workers, initializer=_use_agg_backend
+        ) as pool:
+            results = list(pool.map(_write_report_pdf, jobs))
+    timings["render_seconds"] = time.perf_counter() - start
+    timings["report_seconds"] = {
+        name: seconds for name, (_, seconds) in zip(equities, results)
+    }
+
+    pdfs = {name: path for name, (path, _) in zip(equities, results)}
+    consolidated_pdf = results[-1][0]
+
+    return {
+        "snapshots": snapshots,
+        "pdfs": pdfs,
+        "consolidated_pdf": consolidated_pdf,
+        "metrics": metrics,
+        "timings": timings,
+    }
+
+
+def _write_report_pdf(job: Dict[str, Any]):
+    """Draw one report's figures and write its PDF.
+
+    Runs in pool workers and, for ``render_workers=1``, in the caller's
+    process, so it leaves the matplotlib backend alone. Figure pages skip the
+    ``bbox_inches="tight"`` crop, which is the largest single cost of
+    writing each strategy's PDF; the library's figures fit their page size.
+    """
+    try:
+        from common.viz_ops import (
+            build_comparison_figures,
+            iter_attribution_figures,
+            iter_performance_figures,
+        )
+        from common.report_ops import write_comparison_pdf, write_performance_pdf
+    except ImportError:  # pragma: no cover
+        from algorithmic_trading_utilities.common.viz_ops import (
+            build_comparison_figures,
+            iter_attribution_figures,
+            iter_performance_figures,
+        )
+        from algorithmic_trading_utilities.common.report_ops import (
+            write_comparison_pdf,
+            write_performance_pdf,
+        )
+
+    start = time.perf_counter()
+    if job["kind"] == "comparison":
+        figs = build_comparison_figures(
+            job["equity"], benchmark=job["benchmark"], metrics=job["metrics"]
+        )
+        path = write_comparison_pdf(
+            job["pdf_path"],
+            job["title"],
+            job["metrics"],
+            figs,
+            job["period_text"],
+            bbox_inches=None,
+        )
+    else:
+        figs = iter_performance_figures(job["viz"])
+        if job.get("attribution") is not None:
+            figs = itertools.chain(figs, iter_attribution_figures(job["attribution"]))
+        path = write_performance_pdf(
+            job["pdf_path"],
+            job["title"],
+            job["metrics"],
+            figs,
+            job["period_text"],
+            bbox_inches=None,
+        )
+    return path, time.perf_counter() - start
@@ -1,24 +1,26 @@
 # TODO replace with specific import rather than *
 from alpaca.trading.client import *
-
+from alpaca.trading.requests import StopOrderRequest, TrailingStopOrderRequest
+from concurrent.futures import ThreadPoolExecutor
+import time
 
 # TODO research if there's a more elegant solution to this
 # Try different import approaches for data modules
 try:
     from common.config import trading_client
-    from brokers.alpaca.orders import (
-        get_current_trailing_stop_orders,
-        cancel_order_by_symbol,
-    )
+    from brokers.alpaca.orders import get_current_trailing_stop_orders
+    from brokers.alpaca.cancel_orders_targeted import get_open_orders_for_symbols
 except ImportError:
     from algorithmic_trading_utilities.common.config import trading_client
     from algorithmic_trading_utilities.brokers.alpaca.orders import (
         get_current_trailing_stop_orders,
-        cancel_order_by_symbol,
+    )
+    from algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted import (
+        get_open_orders_for_symbols,
     )
 
 
-def get_open_positions():
+def get_open_positions(state=None):
     """
     Retrieve and return a list of open positions with their symbols, quantities, and corresponding buy/sell sides. Adjust the side mapping based on the position's side ('long' or 'short').
 
@@ -27,10 +29,16 @@ def get_open_positions():
     - Quantity
     - Side (buy/sell, mapped from long/short)
 
+    Parameters:
+        state (TradeStateCache, optional): Stream-fed state to read from
+            instead of querying the REST API.
+
     Returns:
         list: A list of dictionaries representing open positions.
     """
-    open_positions = trading_client.get_all_positions()
+    open_positions = (
+        state.positions() if state is not None else trading_client.get_all_positions()
+    )
 
     positions_list = []
     for position in open_positions:
@@ -47,18 +55,22 @@ def get_open_positions():
     return positions_list
 
 
-def get_positions_without_trailing_stop_loss():
+def get_positions_without_trailing_stop_loss(state=None):
     """
     Identify positions without trailing stop loss orders.
 
     Compares open positions to the list of trailing stop loss orders and
     returns positions that are not associated with any trailing stop loss orders.
 
+    Parameters:
+        state (TradeStateCache, optional): Stream-fed state to read from
+            instead of querying the REST API.
+
     Returns:
         list: A list of dictionaries representing positions without trailing stop loss orders.
     """
-    open_positions = get_open_positions()
-    trailing_stop_orders = get_current_trailing_stop_orders()
+    open_positions = get_open_positions(state=state)
+    trailing_stop_orders = get_current_trailing_stop_orders(state=state)
     positions_without_trailing_stop_loss = []
     for position in open_positions:
         found = False
@@ -87,48 +99,203 @@ def get_positions_symbol_list(positions):
     return position_symbols
 
 
-def close_positions_below_threshold(threshold):
+def _protective_order_request(order):
     """
-    Close positions with unrealized P/L below the specified threshold.
+    Build a request that re-submits a cancelled stop order.
+
+    Parameters:
+        order: The cancelled order.
+
+    Returns:
+        TrailingStopOrderRequest | StopOrderRequest | None: The request, or
+        None for orders that do not protect the position (e.g. limits).
+    """
+    order_type = str(getattr(order.type, "value", order.type))
+    fields = {
+        "symbol": order.symbol,
+        "qty": float(order.qty),
+        "side": order.side,
+        "time_in_force": order.time_in_force,
+    }
+    if order_type == "trailing_stop":
+        if order.trail_percent is not None:
+            return TrailingStopOrderRequest(
+                **fields, trail_percent=float(order.trail_percent)
+            )
+        return TrailingStopOrderRequest(**fields, trail_price=float(order.trail_price))
+    if order_type == "stop":
+        return StopOrderRequest(**fields, stop_price=float(order.stop_price))
+    return None
+
+
+def _liquidate_symbol(position, orders, retries, retry_delay):
+    """
+    Cancel a symbol's open orders, then close its position.
+
+    If the close still fails after all retries, the cancelled stop and
+    trailing stop orders are submitted again so the position is not left
+    unprotected; a stop that cannot be restored marks the result
+    ``unprotected``.
+
+    Parameters:
+        position: The position to close.
+        orders (list): Open orders for the symbol that would block the close.
+        retries (int): Extra close attempts if the first one fails, e.g.
+            while a cancellation is still pending.
+        retry_delay (float): Seconds to wait between close attempts.
+
+    Returns:
+        dict: Per-symbol outcome with latency.
+    """
+    start = time.perf_counter()
+    symbol = position.symbol
+    result = {
+        "symbol": symbol,
+        "unrealized_plpc": float(position.unrealized_plpc),
+        "cancelled_orders": [],
+        "restored_orders": [],
+        "unprotected": False,
+        "attempts": 0,
+        "status": "failed",
+        "error": None,
+    }
+    cancelled = []
+    for order in orders:
+        try:
+            trading_client.cancel_order_by_id(order.id)
+            result["cancelled_orders"].append(str(order.id))
+            cancelled.append(order)
+        except Exception as e:
+            result["error"] = f"cancel {order.id}: {e}"
+
+    for attempt in range(retries + 1):
+        result["attempts"] = attempt + 1
+        try:
+            trading_client.close_position(symbol)
+            result["status"] = "closed"
+            result["error"] = None
+            break
+        except Exception as e:
+            result["error"] = str(e)
+            if attempt < retries:
+                time.sleep(retry_delay)
+
+    if result["status"] != "closed":
+        for order in cancelled:
+            try:
+                request = _protective_order_request(order)
+                if request is not None:
+                    restored = trading_client.submit_order(order_data=request)
+                    result["restored_orders"].append(str(restored.id))
+            except Exception as e:
+                result["unprotected"] = True
+                result["error"] = f"{result['error']}; restore {order.id}: {e}"
+
+    result["latency_seconds"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def liquidate_positions_below_threshold(
+    threshold, max_workers=8, retries=2, retry_delay=0.25, state=None
+):
+    """
+    Close every position with unrealized P/L below the threshold, concurrently.
+
+    Breaching positions are found in one pass, the open orders for all of them
+    (e.g. trailing stops holding the shares) are fetched with the chunked,
+    paginated :func:`get_open_orders_for_symbols` lookup, and each symbol's
+    cancels and close are then submitted in parallel with bounded concurrency.
+    When a close fails, the symbol's cancelled stops are submitted again.
 
     Parameters:
         threshold (float): The P/L percentage threshold (e.g., 0.05 for 5%).
+        max_workers (int): Maximum symbols liquidated in parallel.
+        retries (int): Extra close attempts per symbol after a failure.
+        retry_delay (float): Seconds between close attempts for a symbol.
+        state (TradeStateCache, optional): Stream-fed state to read positions
+            and orders from instead of querying the REST API.
 
     Returns:
-        int: The total number of positions closed.
+        dict: ``results`` (one dict per symbol with ``status``, ``attempts``,
+        ``cancelled_orders``, ``restored_orders``, ``unprotected``, ``error``
+        and ``latency_seconds``), ``closed``, ``failed``, ``unprotected``
+        (symbols left open without their stop) and ``elapsed_seconds``.
     """
-    # Change the sign of the threshold to be negative
+    start = time.perf_counter()
     threshold = -abs(threshold)
-    closed_positions_count = 0  # Counter for closed positions
-    try:
-        open_positions = (
-            trading_client.get_all_positions()
-        )  # Retrieve all open positions
+    open_positions = (
+        state.positions() if state is not None else trading_client.get_all_positions()
+    )
+    breaching = [p for p in open_positions if float(p.unrealized_plpc) <= threshold]
 
-        for position in open_positions:
-            # Check the unrealized P/L percentage (unrealized_plpc is a float between 0 and 1)
-            unrealized_plpc = float(position.unrealized_plpc)
+    results = []
+    if breaching:
+        symbols = [p.symbol for p in breaching]
+        if state is not None:
+            open_orders = state.open_orders(symbols=symbols)
+        else:
+            open_orders, _ = get_open_orders_for_symbols(symbols, trading_client)
+        orders_by_symbol = {}
+        for order in open_orders:
+            orders_by_symbol.setdefault(order.symbol, []).append(order)
 
-            if unrealized_plpc <= threshold:
-                symbol = position.symbol
+        for position in breaching:
+            print(
+                f"Closing position for {position.symbol} with unrealized P/L: "
+                f"{float(position.unrealized_plpc) * 100:.2f}%"
+            )
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(breaching)))
+        ) as pool:
+            results = list(
+                pool.map(
+                    lambda p: _liquidate_symbol(
+                        p, orders_by_symbol.get(p.symbol, []), retries, retry_delay
+                    ),
+                    breaching,
+                )
+            )
+        for result in results:
+            if result["status"] == "closed":
                 print(
-                    f"Closing position for {symbol} with unrealized P/L: {unrealized_plpc * 100:.2f}%"
+                    f"Position for {result['symbol']} closed "
+                    f"in {result['latency_seconds']:.2f}s."
                 )
-                try:
-                    trading_client.close_position(symbol)
-                    print(f"Position for {symbol} closed.")
-                except Exception as close_error:
-                    print(f"Failed to close position for {symbol}: {close_error}")
-                    try:
-                        cancel_order_by_symbol(symbol)
-                        print(f"Canceled trailing order for {symbol} as fallback.")
-                        trading_client.close_position(symbol)
-                        print(f"Position for {symbol} closed.")
-                    except Exception as cancel_error:
-                        print(f"Failed to cancel order for {symbol}: {cancel_error}")
-                closed_positions_count += 1
-
-        print(f"Total positions closed: {closed_positions_count}")
-        return closed_positions_count
+            else:
+                print(
+                    f"Failed to close position for {result['symbol']}: {result['error']}"
+                )
+                if result["unprotected"]:
+                    print(f"Warning: {result['symbol']} is open without its stop.")
+
+    closed = sum(r["status"] == "closed" for r in results)
+    return {
+        "results": results,
+        "closed": closed,
+        "failed": len(results) - closed,
+        "unprotected": [r["symbol"] for r in results if r["unprotected"]],
+        "elapsed_seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+def close_positions_below_threshold(threshold, state=None):
+    """
+    Close positions with unrealized P/L below the specified threshold.
+
+    Uses :func:`liquidate_positions_below_threshold`, so conflicting orders
+    are cancelled and positions closed concurrently.
+
+    Parameters:
+        threshold (float): The P/L percentage threshold (e.g., 0.05 for 5%).
+        state (TradeStateCache, optional): Stream-fed state to read positions
+            from instead of querying the REST API.
+
+    Returns:
+        int: The total number of positions closed.
+    """
+    try:
+        report = liquidate_positions_below_threshold(threshold, state=state)
+        print(f"Total positions closed: {report['closed']}")
+        return report["closed"]
     except Exception as e:
         print(f"Error while closing positions: {e}")
@@ -0,0 +1,314 @@
+"""
+Event-driven trading state.
+
+Keeps open positions and open orders in memory, updated from the Alpaca
+``trade_updates`` WebSocket stream instead of polling REST. The state is
+seeded from REST and re-seeded on every (re)connect, so events missed while
+the stream was down cannot leave it stale.
+"""
+
+import asyncio
+import threading
+import time
+
+from alpaca.trading.enums import OrderStatus, PositionSide, TradeEvent
+from alpaca.trading.stream import TradingStream
+
+try:
+    from brokers.alpaca.cancel_orders_targeted import get_all_open_orders
+    from common.config import trading_client, api_key, secret_key, paper
+except ImportError:
+    from algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted import (
+        get_all_open_orders,
+    )
+    from algorithmic_trading_utilities.common.config import (
+        trading_client,
+        api_key,
+        secret_key,
+        paper,
+    )
+
+# Orders in these states still rest on the book
+OPEN_ORDER_STATUSES = {
+    OrderStatus.NEW,
+    OrderStatus.PARTIALLY_FILLED,
+    OrderStatus.ACCEPTED,
+    OrderStatus.PENDING_NEW,
+    OrderStatus.ACCEPTED_FOR_BIDDING,
+    OrderStatus.PENDING_CANCEL,
+    OrderStatus.PENDING_REPLACE,
+    OrderStatus.PENDING_REVIEW,
+    OrderStatus.HELD,
+    OrderStatus.CALCULATED,
+}
+
+
+class _ResyncingTradingStream(TradingStream):
+    """TradingStream that calls back after every successful (re)connect."""
+
+    def __init__(self, *args, on_connect=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_connect = on_connect
+
+    async def _start_ws(self):
+        await super()._start_ws()
+        if self._on_connect is not None:
+            # Subscribed first, so events during the REST resync are queued
+            # on the socket and applied on top of the fresh snapshot.
+            await asyncio.get_running_loop().run_in_executor(None, self._on_connect)
+
+
+class TradeStateCache:
+    """
+    In-memory positions and open orders fed by the trade updates stream.
+
+    Example:
+        >>> state = TradeStateCache()
+        >>> state.start()
+        >>> close_positions_below_threshold(0.05, state=state)
+        >>> get_current_trailing_stop_orders(state=state)
+        >>> state.stop()
+    """
+
+    def __init__(self, client=None, url_override=None, stream=None):
+        """Initialize an empty cache.
+
+        Args:
+            client (TradingClient, optional): REST client used for (re)syncs.
+                Defaults to ``config.trading_client``.
+            url_override (str, optional): WebSocket endpoint, e.g. a local
+                test server. Defaults to the paper/live endpoint from config.
+            stream (TradingStream, optional): Pre-built stream. By default a
+                stream that resyncs from REST on every connect is created.
+        """
+        self.client = client or trading_client
+        self.stream = stream or _ResyncingTradingStream(
+            api_key,
+            secret_key,
+            paper=paper,
+            url_override=url_override,
+            on_connect=self.resync,
+        )
+        self._lock = threading.RLock()
+        self._positions = {}
+        self._orders = {}
+        self._thread = None
+        self.last_sync = None
+        self.last_event = None
+        self.sync_count = 0
+        self.event_count = 0
+
+    @property
+    def is_synced(self):
+        """bool: True once the state has been seeded from REST."""
+        return self.last_sync is not None
+
+    def resync(self):
+        """Replace the state with a fresh REST snapshot of positions and orders.
+
+        Open orders are paged, so accounts with more than one page of them
+        are seeded in full.
+        """
+        positions = self.client.get_all_positions()
+        orders, _ = get_all_open_orders(self.client)
+        with self._lock:
+            self._positions = {p.symbol: p for p in positions}
+            self._orders = {str(o.id): o for o in orders}
+            self.last_sync = time.time()
+            self.sync_count += 1
+
+    def ensure_synced(self):
+        """Seed the state from REST if no snapshot has been taken yet."""
+        if not self.is_synced:
+            self.resync()
+
+    def positions(self):
+        """
+        Returns the current open positions.
+
+        Returns:
+            list[Position]: Positions, in the shape returned by
+            ``trading_client.get_all_positions()``.
+        """
+        self.ensure_synced()
+        with self._lock:
+            return list(self._positions.values())
+
+    def position(self, symbol):
+        """
+        Returns the open position for a symbol.
+
+        Args:
+            symbol (str): Ticker symbol.
+
+        Returns:
+            Position | None: The position, or None if flat.
+        """
+        self.ensure_synced()
+        with self._lock:
+            return self._positions.get(symbol)
+
+    def open_orders(self, symbols=None, order_type=None):
+        """
+        Returns the open orders, optionally filtered.
+
+        Args:
+            symbols (Iterable[str], optional): Only orders for these symbols.
+            order_type (str, optional): Only orders of this type, e.g.
+                ``"trailing_stop"``.
+
+        Returns:
+            list[Order]: Open orders, in the shape returned by
+            ``trading_client.get_orders()``.
+        """
+        self.ensure_synced()
+        symbols = set(symbols) if symbols is not None else None
+        with self._lock:
+            return [
+                o
+                for o in self._orders.values()
+                if (symbols is None or o.symbol in symbols)
+                and (order_type is None or o.order_type == order_type)
+            ]
+
+    def apply_trade_update(self, update):
+        """
+        Apply one trade update event to the state.
+
+        Args:
+            update (TradeUpdate): Event from the ``trade_updates`` stream.
+        """
+        self.ensure_synced()
+        order = update.order
+        with self._lock:
+            self.last_event = update.timestamp
+            self.event_count += 1
+            if order.status in OPEN_ORDER_STATUSES:
+                self._orders[str(order.id)] = order
+            else:
+                self._orders.pop(str(order.id), None)
+
+        if update.event in (TradeEvent.FILL, TradeEvent.PARTIAL_FILL):
+            self._apply_fill(update)
+
+    def _apply_fill(self, update):
+        """Update the position for a fill using the event's position size."""
+        symbol = update.order.symbol
+        if update.position_qty is None:
+            self._refresh_position(symbol)
+            return
+
+        new_qty = float(update.position_qty)
+        with self._lock:
+            current = self._positions.get(symbol)
+            if new_qty == 0:
+                self._positions.pop(symbol, None)
+                return
+            if current is not None:
+                self._positions[symbol] = _position_after_fill(
+                    current, new_qty, update.price
+                )
+                return
+        # A new position: fetch the full record once rather than guess fields
+        self._refresh_position(symbol)
+
+    def _refresh_position(self, symbol):
+        """Reload one position from REST, dropping it if it no longer exists."""
+        try:
+            position = self.client.get_open_position(symbol)
+        except Exception as e:
+            print(f"Could not refresh position for {symbol}: {e}")
+            position = None
+        with self._lock:
+            if position is None:
+                self._positions.pop(symbol, None)
+            else:
+                self._positions[symbol] = position
+
+    def update_prices(self, prices):
+        """
+        Mark positions to new prices, recomputing unrealized P/L.
+
+        Trade updates only carry fills, so unrealized P/L drifts from the last
+        REST snapshot as prices move; feed last prices here (e.g. from a
+        market data stream) to keep threshold checks current.
+
+        Args:
+            prices (Mapping[str, float]): Symbol -> last price.
+        """
+        self.ensure_synced()
+        with self._lock:
+            for symbol, price in prices.items():
+                position = self._positions.get(symbol)
+                if position is not None:
+                    self._positions[symbol] = _mark_position(position, float(price))
+
+    async def _handle_trade_update(self, update):
+        """Stream handler; state changes (and any REST refresh) run off the loop."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, self.apply_trade_update, update
+        )
+
+    def start(self):
+        """Seed from REST and start consuming the stream in a daemon thread."""
+        self.stream.subscribe_trade_updates(self._handle_trade_update)
+        self._thread = threading.Thread(target=self.stream.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        """Stop the stream and wait for its thread to finish.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread. Defaults to 10.
+        """
+        if self._thread is None:
+            return
+        if self.stream._loop is not None:
+            self.stream.stop()
+        self._thread.join(timeout)
+        self._thread = None
+
+
+def _position_after_fill(position, new_qty, fill_price):
+    """Return a copy of ``position`` resized to ``new_qty`` (signed) after a fill."""
+    old_qty = float(position.qty) * (-1 if position.side == PositionSide.SHORT else 1)
+    avg_entry = float(position.avg_entry_price)
+    if fill_price is not None:
+        if old_qty * new_qty < 0:
+            # Flipped sides: the remainder was opened at the fill price
+            avg_entry = float(fill_price)
+        elif abs(new_qty) > abs(old_qty):
+            added = abs(new_qty) - abs(old_qty)
+            avg_entry = (abs(old_qty) * avg_entry + added * float(fill_price)) / abs(
+                new_qty
+            )
+
+    updated = position.model_copy(
+        update={
+            "qty": str(abs(new_qty)),
+            "qty_available": str(abs(new_qty)),
+            "side": PositionSide.LONG if new_qty > 0 else PositionSide.SHORT,
+            "avg_entry_price": str(avg_entry),
+            "cost_basis": str(abs(new_qty) * avg_entry),
+        }
+    )
+    if fill_price is not None:
+        updated = _mark_position(updated, float(fill_price))
+    return updated
+
+
+def _mark_position(position, price):
+    """Return a copy of ``position`` marked to ``price``."""
+    qty = float(position.qty)
+    avg_entry = float(position.avg_entry_price)
+    direction = -1 if position.side == PositionSide.SHORT else 1
+    unrealized_pl = direction * (price - avg_entry) * qty
+    cost_basis = avg_entry * qty
+    return position.model_copy(
+        update={
+            "current_price": str(price),
+            "market_value": str(direction * price * qty),
+            "unrealized_pl": str(unrealized_pl),
+            "unrealized_plpc": str(unrealized_pl / cost_basis if cost_basis else 0.0),
+        }
+    )
@@ -0,0 +1,177 @@
+"""
+Per-symbol P&L attribution from fills.
+
+Rebuilds each symbol's trading P&L, holding period and contribution to
+return from FILL activities, marking open positions at the latest known
+price. All symbols are computed together with one sort and a handful of
+grouped reductions over a single fills DataFrame, so the cost grows with
+the number of fills rather than with one pass per symbol.
+"""
+
+import numpy as np
+import pandas as pd
+
+FILL_COLUMNS = ["symbol", "time", "side", "qty", "price", "signed_qty"]
+
+ATTRIBUTION_COLUMNS = [
+    "fills",
+    "bought_qty",
+    "sold_qty",
+    "avg_buy_price",
+    "avg_sell_price",
+    "open_qty",
+    "mark_price",
+    "market_value",
+    "pnl",
+    "holding_days",
+    "first_fill",
+    "last_fill",
+    "contribution",
+    "pnl_share",
+]
+
+
+def fills_frame(activities):
+    """
+    Collects the FILL activities of an activity list into one DataFrame.
+
+    Quantities are made positive and signed by side: ``buy`` adds shares,
+    ``sell`` and ``sell_short`` remove them. Rows with a missing symbol,
+    time, quantity or price are dropped.
+
+    Args:
+        activities (Iterable[dict]): Account activities, e.g. the
+            ``activities`` of a strategy snapshot.
+
+    Returns:
+        pd.DataFrame: ``symbol``, ``time`` (UTC), ``side``, ``qty``, ``price``
+        and ``signed_qty``, sorted by symbol then time.
+    """
+    records = [
+        a for a in activities if str(a.get("activity_type") or "").upper() == "FILL"
+    ]
+    if not records:
+        return pd.DataFrame(columns=FILL_COLUMNS)
+
+    raw = pd.DataFrame.from_records(records)
+
+    def column(name):
+        return raw[name] if name in raw else pd.Series(None, index=raw.index)
+
+    time = column("transaction_time").fillna(column("date"))
+    side = column("side").astype(str).str.lower()
+    fills = pd.DataFrame(
+        {
+            "symbol": column("symbol"),
+            "time": pd.to_datetime(time, utc=True, errors="coerce", format="mixed"),
+            "side": np.where(side.str.contains("buy"), "buy", "sell"),
+            "qty": pd.to_numeric(column("qty"), errors="coerce").abs().astype(float),
+            "price": pd.to_numeric(column("price"), errors="coerce").astype(float),
+        }
+    )
+    fills = fills.dropna(subset=["symbol", "time", "qty", "price"])
+    fills["symbol"] = fills["symbol"].astype(str)
+    fills["signed_qty"] = np.where(fills["side"] == "buy", fills["qty"], -fills["qty"])
+    return fills.sort_values(["symbol", "time"], kind="stable", ignore_index=True)
+
+
+def compute_position_attribution(
+    fills,
+    marks=None,
+    bars=None,
+    starting_equity=None,
+    as_of=None,
+):
+    """
+    Computes P&L, holding period and contribution to return for every symbol.
+
+    P&L is sell proceeds minus buy cost plus the open quantity marked at the
+    latest price, so it covers realized and unrealized P&L without matching
+    lots. A symbol is held while its running position after a fill is
+    non-zero; open positions are held until ``as_of``.
+
+    Marks are taken, in order of preference, from ``marks``, from the last
+    close in ``bars`` and from the symbol's last fill price.
+
+    Example:
+        >>> fills = fills_frame(snapshot["activities"])
+        >>> table = compute_position_attribution(fills, marks={"AAPL": 190.0}, starting_equity=100_000)
+        >>> table.head()
+
+    Args:
+        fills (pd.DataFrame | Iterable[dict]): Output of :func:`fills_frame`,
+            or raw activities to pass through it.
+        marks (Mapping[str, float] | pd.Series, optional): Symbol -> current
+            price, e.g. from ``get_last_prices`` or the open positions.
+        bars (pd.DataFrame, optional): Cached close prices, dates x symbols.
+        starting_equity (float, optional): Equity at the start of the period;
+            without it ``contribution`` is NaN.
+        as_of (datetime, optional): End of the period for open positions.
+            Defaults to now (UTC).
+
+    Returns:
+        pd.DataFrame: One row per symbol with the ``ATTRIBUTION_COLUMNS``,
+        sorted by P&L, best first. ``attrs["total_pnl"]`` holds the sum.
+    """
+    if not isinstance(fills, pd.DataFrame):
+        fills = fills_frame(fills)
+    if fills.empty:
+        table = pd.DataFrame(columns=ATTRIBUTION_COLUMNS).rename_axis("symbol")
+        table.attrs["total_pnl"] = 0.0
+        return table
+
+    fills = fills.sort_values(["symbol", "time"], kind="stable", ignore_index=True)
+    as_of = pd.Timestamp.now(tz="UTC") if as_of is None else pd.Timestamp(as_of)
+    if as_of.tzinfo is None:
+        as_of = as_of.tz_localize("UTC")
+
+    buy = fills["signed_qty"] > 0
+    notional = fills["qty"] * fills["price"]
+    by_symbol = fills.groupby("symbol", sort=True)
+
+    # Time from each fill to the next fill of the same symbol (or as_of),
+    # counted while the position after the fill is open
+    position = by_symbol["signed_qty"].cumsum()
+    next_time = by_symbol["time"].shift(-1).fillna(as_of)
+    held = (next_time - fills["time"]).where(position.round(9) != 0)
+
+    frame = pd.DataFrame(
+        {
+            "symbol": fills["symbol"],
+            "bought_qty": fills["qty"].where(buy, 0.0),
+            "sold_qty": fills["qty"].where(~buy, 0.0),
+            "bought_value": notional.where(buy, 0.0),
+            "sold_value": notional.where(~buy, 0.0),
+            "held_seconds": held.dt.total_seconds().fillna(0.0),
+        }
+    )
+    table = frame.groupby("symbol", sort=True).sum()
+    table["fills"] = by_symbol.size()
+    table["first_fill"] = by_symbol["time"].min()
+    table["last_fill"] = by_symbol["time"].max()
+    table["open_qty"] = (table["bought_qty"] - table["sold_qty"]).round(9)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table["avg_buy_price"] = table["bought_value"] / table["bought_qty"]
+        table["avg_sell_price"] = table["sold_value"] / table["sold_qty"]
+
+    mark = pd.Series(np.nan, index=table.index)
+    if marks is not None:
+        mark = mark.fillna(pd.Series(marks, dtype=float).reindex(table.index))
+    if bars is not None:
+        mark = mark.fillna(bars.ffill().iloc[-1].reindex(table.index))
+    mark = mark.fillna(by_symbol["price"].last())
+    table["mark_price"] = mark
+    table["market_value"] = table["open_qty"] * mark
+    table["pnl"] = table["sold_value"] - table["bought_value"] + table["market_value"]
+    table["holding_days"] = table["held_seconds"] / 86_400.0
+
+    total_pnl = float(table["pnl"].sum())
+    table["contribution"] = (
+        table["pnl"] / float(starting_equity) if starting_equity else np.nan
+    )
+    table["pnl_share"] = table["pnl"] / total_pnl if total_pnl else np.nan
+
+    table = table[ATTRIBUTION_COLUMNS].sort_values("pnl", ascending=False)
+    table.attrs["total_pnl"] = total_pnl
+    return table
@@ -0,0 +1,303 @@
+"""
+Vectorized daily backtesting.
+
+Replays the live trading rules over a date x symbol price panel: entries are
+sized with the ATR position sizing rules, protected with adaptive trailing
+stops and filtered by the sector and gross exposure limits. Each day is one
+set of NumPy operations across all symbols, so a 10-year, 500-symbol panel
+runs in seconds. The equity curve is a date-indexed ``pd.Series`` that can be
+passed straight to ``PerformanceMetrics`` and ``PerformanceViz``.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from common.position_sizing import calculate_position_size_array
+    from common.trailing_stop_config import calculate_trailing_stop_pct_array
+    from common.portfolio_constraints import exposure_limit_mask
+except ImportError:
+    from algorithmic_trading_utilities.common.position_sizing import (
+        calculate_position_size_array,
+    )
+    from algorithmic_trading_utilities.common.trailing_stop_config import (
+        calculate_trailing_stop_pct_array,
+    )
+    from algorithmic_trading_utilities.common.portfolio_constraints import (
+        exposure_limit_mask,
+    )
+
+
+def compute_atr_panel(close, high=None, low=None, period=14):
+    """
+    Computes the Average True Range of every symbol in a price panel.
+
+    True range is max(high - low, |high - prev_close|, |low - prev_close|), as
+    in ``position_sizing.get_atr``, averaged over the trailing ``period`` days.
+    With close prices only, true range reduces to |close - prev_close|.
+
+    Args:
+        close (pd.DataFrame): Close prices, dates x symbols.
+        high (pd.DataFrame, optional): High prices, same shape.
+        low (pd.DataFrame, optional): Low prices, same shape.
+        period (int, optional): ATR window in days. Defaults to 14.
+
+    Returns:
+        pd.DataFrame: ATR in dollars, NaN until ``period + 1`` days exist.
+    """
+    prev_close = close.shift(1)
+    if high is None or low is None:
+        tr = (close - prev_close).abs()
+    else:
+        tr = np.maximum(
+            high - low,
+            np.maximum((high - prev_close).abs(), (low - prev_close).abs()),
+        )
+    tr = tr.where(prev_close.notna())
+    return tr.rolling(period, min_periods=period).mean()
+
+
+def run_backtest(
+    close,
+    entries,
+    high=None,
+    low=None,
+    exits=None,
+    scores=None,
+    initial_equity=100_000.0,
+    risk_per_trade=0.01,
+    atr_period=14,
+    atr_multiplier=2.0,
+    max_position_pct=0.03,
+    fallback_risk_pct=0.05,
+    stop_min_pct=0.05,
+    stop_max_pct=0.20,
+    stop_atr_multiplier=2.5,
+    sectors=None,
+    max_sector_pct=0.30,
+    max_gross_pct=0.80,
+    cost_bps=0.0,
+):
+    """
+    Runs a long-only daily backtest of the position sizing and trailing stop rules.
+
+    Each day, in order:
+
+    1. Held positions whose low (or close, without a low panel) reaches the
+       trailing stop exit at the stop level, then high-water marks are raised.
+    2. Positions flagged in ``exits`` are sold at the close.
+    3. Flat symbols flagged in ``entries`` are sized with
+       ``calculate_position_size`` rules from the day's ATR, ranked by
+       ``scores``, filtered by the sector/gross limits and available cash,
+       and bought at the close with a trailing stop from
+       ``calculate_trailing_stop_pct``.
+
+    Args:
+        close (pd.DataFrame): Close prices, dates x symbols.
+        entries (pd.DataFrame): Boolean entry signals, same shape as ``close``.
+        high (pd.DataFrame, optional): High prices, used for ATR and stops.
+        low (pd.DataFrame, optional): Low prices, used for ATR and stops.
+        exits (pd.DataFrame, optional): Boolean exit signals.
+        scores (pd.DataFrame, optional): Entry priority; higher is filled
+            first when limits bind. Defaults to column order.
+        initial_equity (float, optional): Starting cash. Defaults to 100,000.
+        risk_per_trade (float, optional): Fraction of equity risked per trade.
+        atr_period (int, optional): ATR window in days. Defaults to 14.
+        atr_multiplier (float, optional): ATRs of stop distance used for sizing.
+        max_position_pct (float, optional): Max position notional / equity.
+        fallback_risk_pct (float, optional): Stop distance as % of price when
+            ATR is unavailable.
+        stop_min_pct (float, optional): Minimum trailing stop percentage.
+        stop_max_pct (float, optional): Maximum trailing stop percentage.
+        stop_atr_multiplier (float, optional): ATRs used for the trailing stop.
+        sectors (Mapping[str, str], optional): Symbol -> sector. Without it
+            only the gross limit applies; "Unknown" sectors are not limited.
+        max_sector_pct (float, optional): Max sector exposure / equity.
+        max_gross_pct (float, optional): Max gross exposure / equity.
+        cost_bps (float, optional): Transaction cost per side in basis points.
+
+    Returns:
+        dict: ``equity`` (pd.Series), ``cash`` (pd.Series), ``gross_exposure``
+        (pd.Series), ``positions`` (pd.DataFrame of shares held at each close)
+        and ``trades`` (pd.DataFrame with date, symbol, side, quantity, price
+        and reason).
+    """
+    symbols = close.columns
+    dates = close.index
+    n_days, n_symbols = close.shape
+
+    close_values = close.to_numpy(dtype=float)
+    high_values = high.to_numpy(dtype=float) if high is not None else None
+    low_values = low.to_numpy(dtype=float) if low is not None else close_values
+    entry_values = entries.reindex_like(close).fillna(False).to_numpy(dtype=bool)
+    exit_values = (
+        exits.reindex_like(close).fillna(False).to_numpy(dtype=bool)
+        if exits is not None
+        else None
+    )
+    score_values = (
+        scores.reindex_like(close).to_numpy(dtype=float) if scores is not None else None
+    )
+    atr_values = compute_atr_panel(close, high, low, period=atr_period).to_numpy()
+    stop_pct_values = calculate_trailing_stop_pct_array(
+        atr_values,
+        close_values,
+        min_pct=stop_min_pct,
+        max_pct=stop_max_pct,
+        atr_multiplier=stop_atr_multiplier,
+    )
+
+    if sectors is not None:
+        labels = np.array([sectors.get(s, "Unknown") or "Unknown" for s in symbols])
+        names, sector_codes = np.unique(labels, return_inverse=True)
+        sector_codes = np.where(labels == "Unknown", -1, sector_codes)
+        n_sectors = len(names)
+    else:
+        sector_codes = None
+
+    cost_rate = cost_bps / 10_000.0
+    cash = float(initial_equity)
+    shares = np.zeros(n_symbols)
+    peak = np.zeros(n_symbols)
+    stop_pct = np.zeros(n_symbols)
+    last_price = np.zeros(n_symbols)
+
+    positions = np.zeros((n_days, n_symbols))
+    equity = np.empty(n_days)
+    cash_history = np.empty(n_days)
+    gross = np.empty(n_days)
+    trade_blocks = []
+
+    for t in range(n_days):
+        price = close_values[t]
+        priced = ~np.isnan(price)
+        last_price = np.where(priced, price, last_price)
+        held = shares > 0
+        bar_high = high_values[t] if high_values is not None else price
+
+        # 1. Trailing stops against the previous high-water mark
+        stop_level = peak * (1.0 - stop_pct)
+        stopped = held & priced & (low_values[t] <= stop_level)
+        if stopped.any():
+            idx = np.flatnonzero(stopped)
+            # A bar that gapped entirely below the stop fills at its high
+            fill = np.minimum(stop_level[idx], bar_high[idx])
+            cash += float(np.sum(shares[idx] * fill) * (1.0 - cost_rate))
+            trade_blocks.append((t, idx, -shares[idx], fill, "trailing_stop"))
+            shares[idx] = 0.0
+            held &= ~stopped
+
+        peak = np.where(held & priced, np.fmax(peak, bar_high), peak)
+
+        # 2. Signal exits at the close
+        if exit_values is not None:
+            leaving = held & priced & exit_values[t]
+            if leaving.any():
+                idx = np.flatnonzero(leaving)
+                cash += float(np.sum(shares[idx] * price[idx]) * (1.0 - cost_rate))
+                trade_blocks.append((t, idx, -shares[idx], price[idx], "exit_signal"))
+                shares[idx] = 0.0
+                held &= ~leaving
+
+        market_value = shares * last_price
+        current_gross = float(market_value.sum())
+        current_equity = cash + current_gross
+
+        # 3. Sized, ranked and limit-checked entries at the close
+        candidates = np.flatnonzero(entry_values[t] & ~held & priced & (price > 0))
+        if len(candidates) and current_equity > 0:
+            if score_values is not None:
+                ranking = np.argsort(
+                    -np.nan_to_num(score_values[t][candidates], nan=-np.inf),
+                    kind="stable",
+                )
+                candidates = candidates[ranking]
+            quantity, _ = calculate_position_size_array(
+                price[candidates],
+                current_equity,
+                risk_per_trade,
+                atr_values[t][candidates],
+                atr_multiplier=atr_multiplier,
+                max_position_pct=max_position_pct,
+                fallback_risk_pct=fallback_risk_pct,
+            )
+            notional = quantity * price[candidates]
+            keep = quantity > 0
+            candidates, quantity, notional = (
+                candidates[keep],
+                quantity[keep],
+                notional[keep],
+            )
+            cost = notional * (1.0 + cost_rate)
+            if sector_codes is not None:
+                sector_exposure = np.bincount(
+                    np.where(sector_codes >= 0, sector_codes, 0),
+                    weights=np.where(sector_codes >= 0, market_value, 0.0),
+                    minlength=n_sectors,
+                )
+                allowed = exposure_limit_mask(
+                    notional,
+                    current_equity,
+                    current_gross=current_gross,
+                    sector_codes=sector_codes[candidates],
+                    sector_exposure=sector_exposure,
+                    max_sector_pct=max_sector_pct,
+                    max_gross_pct=max_gross_pct,
+                    cash=cash,
+                    cost=cost,
+                )
+            else:
+                allowed = exposure_limit_mask(
+                    notional,
+                    current_equity,
+                    current_gross=current_gross,
+                    max_gross_pct=max_gross_pct,
+                    cash=cash,
+                    cost=cost,
+                )
+            if allowed.any():
+                idx = candidates[allowed]
+                cash -= float(cost[allowed].sum())
+                shares[idx] = quantity[allowed]
+                peak[idx] = price[idx]
+                stop_pct[idx] = stop_pct_values[t][idx]
+                trade_blocks.append(
+                    (t, idx, quantity[allowed].astype(float), price[idx], "entry")
+                )
+
+        positions[t] = shares
+        # Symbols without a price today are valued at their last close
+        current_gross = float(np.dot(shares, last_price))
+        gross[t] = current_gross
+        cash_history[t] = cash
+        equity[t] = cash + current_gross
+
+    return {
+        "equity": pd.Series(equity, index=dates, name="equity"),
+        "cash": pd.Series(cash_history, index=dates, name="cash"),
+        "gross_exposure": pd.Series(gross, index=dates, name="gross_exposure"),
+        "positions": pd.DataFrame(positions, index=dates, columns=symbols),
+        "trades": _trades_frame(trade_blocks, dates, symbols),
+    }
+
+
+def _trades_frame(blocks, dates, symbols):
+    """Concatenate per-day trade arrays into one DataFrame."""
+    columns = ["date", "symbol", "side", "quantity", "price", "reason"]
+    if not blocks:
+        return pd.DataFrame(columns=columns)
+    day = np.concatenate([np.full(len(b[1]), b[0]) for b in blocks])
+    idx = np.concatenate([b[1] for b in blocks])
+    quantity = np.concatenate([b[2] for b in blocks])
+    price = np.concatenate([b[3] for b in blocks])
+    reason = np.concatenate([np.full(len(b[1]), b[4], dtype=object) for b in blocks])
+    return pd.DataFrame(
+        {
+            "date": dates[day],
+            "symbol": np.asarray(symbols)[idx],
+            "side": np.where(quantity > 0, "buy", "sell"),
+            "quantity": np.abs(quantity),
+            "price": price,
+            "reason": reason,
+        }
+    )
@@ -41,5 +41,12 @@ trading_client = TradingClient(api_key=api_key, secret_key=secret_key, paper=pap
 model = "gemma3:1b"
 ollama_url = "http://localhost:11434/api/generate"
 sentiment_model = "mrm8488/distilroberta-finetuned-financial-news-sentiment-analysis"
+sentiment_backend = (
+    "pytorch"  # "pytorch" (FP32), "int8" (dynamic quantization) or "onnx"
+)
+sentiment_batch_size = 32  # Texts per forward pass in analyze_sentiment_batch
+sentiment_max_length = 512  # Token limit per text; longer texts are truncated
+sentiment_num_threads = None  # torch intra-op threads (None keeps the torch default)
+sentiment_cache_path = ".cache/sentiment_scores.json"  # Persistent score cache
 ## PROD ##
 # TODO
@@ -0,0 +1,358 @@
+"""NYSE trading calendar with a precomputed session index.
+
+Sessions (regular and extended hours) are generated once for a range of
+years, honouring US Eastern daylight saving time, exchange holidays and
+early closes, and stored as sorted UTC epoch-second arrays. Queries such as
+"is the market open", "when is the next open" and "how long until the close"
+are then a single binary search.
+"""
+
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+
+# Session boundaries in US Eastern local time, as (hour, minute)
+PRE_MARKET_OPEN = (4, 0)
+REGULAR_OPEN = (9, 30)
+REGULAR_CLOSE = (16, 0)
+EARLY_CLOSE = (13, 0)
+POST_MARKET_CLOSE = (20, 0)
+EARLY_POST_MARKET_CLOSE = (17, 0)
+
+# One-off closures not covered by the regular holiday rules
+SPECIAL_CLOSURES = (
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),  # Hurricane Sandy
+    date(2018, 12, 5),  # National Day of Mourning, George H.W. Bush
+    date(2025, 1, 9),  # National Day of Mourning, Jimmy Carter
+)
+
+
+def _nth_weekday(year, month, weekday, n):
+    """Return the n-th given weekday (Mon=0) of a month; n=-1 for the last."""
+    if n > 0:
+        first = date(year, month, 1)
+        offset = (weekday - first.weekday()) % 7
+        return first + timedelta(days=offset + 7 * (n - 1))
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year):
+    """Return Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day):
+    """Shift a fixed-date holiday falling on a weekend to the NYSE observed day."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def nyse_holidays(year):
+    """
+    Returns the NYSE full-day holidays for a year.
+
+    Args:
+        year (int): Calendar year.
+
+    Returns:
+        set[date]: Dates on which the exchange is closed (weekdays only).
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving Day
+        _observed(date(year, 12, 25)),  # Christmas Day
+    }
+    # New Year's Day on a Saturday is not observed on the prior Friday
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.update(d for d in SPECIAL_CLOSURES if d.year == year)
+    return holidays
+
+
+def nyse_early_closes(year):
+    """
+    Returns the NYSE 13:00 ET early-close days for a year.
+
+    Args:
+        year (int): Calendar year.
+
+    Returns:
+        set[date]: July 3 and Christmas Eve when they fall Monday-Thursday,
+        and the day after Thanksgiving.
+    """
+    early = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        if day.weekday() <= 3:
+            early.add(day)
+    return early
+
+
+def _eastern_utc_offset(day):
+    """
+    Returns the US Eastern UTC offset in hours for a trading day.
+
+    Uses the post-2007 rule (DST from the second Sunday of March to the first
+    Sunday of November). The 02:00 switch never falls inside a session, so a
+    per-day offset is exact for session boundaries.
+    """
+    dst_start = _nth_weekday(day.year, 3, 6, 2)
+    dst_end = _nth_weekday(day.year, 11, 6, 1)
+    return -4 if dst_start <= day < dst_end else -5
+
+
+def _to_epoch(when):
+    """Convert a datetime (naive = UTC), Timestamp or epoch seconds to epoch seconds."""
+    if when is None:
+        return time.time()
+    if isinstance(when, (int, float, np.integer, np.floating)):
+        return float(when)
+    if isinstance(when, datetime) and when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return pd.Timestamp(when).timestamp()
+
+
+class MarketCalendar:
+    """
+    Precomputed NYSE session index for a range of years.
+
+    Example:
+        >>> calendar = MarketCalendar()
+        >>> calendar.is_open()
+        >>> calendar.next_open(extended=True)
+        >>> calendar.sleep_until_open()
+    """
+
+    def __init__(self, start_year=None, end_year=None):
+        """Build the session index.
+
+        Args:
+            start_year (int, optional): First year to index. Defaults to last year.
+            end_year (int, optional): Last year to index. Defaults to five
+                years from now.
+        """
+        this_year = datetime.now(timezone.utc).year
+        self.start_year = start_year if start_year is not None else this_year - 1
+        self.end_year = end_year if end_year is not None else this_year + 5
+        if self.end_year < self.start_year:
+            raise ValueError("end_year must not be before start_year")
+
+        days = pd.bdate_range(
+            date(self.start_year, 1, 1), date(self.end_year, 12, 31)
+        ).date
+        holidays = set()
+        early_closes = set()
+        for year in range(self.start_year, self.end_year + 1):
+            holidays |= nyse_holidays(year)
+            early_closes |= nyse_early_closes(year)
+
+        self.trading_days = np.array([d for d in days if d not in holidays])
+        early = np.array([d in early_closes for d in self.trading_days], dtype=bool)
+        # Midnight UTC of each trading day, shifted to Eastern local midnight
+        midnight = pd.to_datetime(self.trading_days).values.astype(
+            "datetime64[s]"
+        ).astype(np.int64) - 3600 * np.array(
+            [_eastern_utc_offset(d) for d in self.trading_days], dtype=np.int64
+        )
+
+        def at(hour_minute):
+            return midnight + 3600 * hour_minute[0] + 60 * hour_minute[1]
+
+        self.pre_opens = at(PRE_MARKET_OPEN)
+        self.opens = at(REGULAR_OPEN)
+        self.closes = np.where(early, at(EARLY_CLOSE), at(REGULAR_CLOSE))
+        self.post_closes = np.where(
+            early, at(EARLY_POST_MARKET_CLOSE), at(POST_MARKET_CLOSE)
+        )
+        self.early_close = early
+
+    def __len__(self):
+        return len(self.trading_days)
+
+    def _bounds(self, extended):
+        """Return the (starts, ends) session arrays for the requested hours."""
+        if extended:
+            return self.pre_opens, self.post_closes
+        return self.opens, self.closes
+
+    def _check_range(self, t):
+        """Raise if ``t`` lies beyond the indexed years."""
+        first = datetime(self.start_year, 1, 1, tzinfo=timezone.utc).timestamp()
+        if len(self.opens) == 0 or not first <= t <= self.post_closes[-1]:
+            self._out_of_range(t)
+
+    def _out_of_range(self, t):
+        """Raise the error for a query past the indexed sessions."""
+        raise ValueError(
+            f"{datetime.fromtimestamp(t, timezone.utc)} is outside the calendar "
+            f"range {self.start_year}-{self.end_year}"
+        )
+
+    def sessions(self, extended=False):
+        """
+        Returns the session index as a DataFrame.
+
+        Args:
+            extended (bool, optional): Use pre/post-market bounds instead of
+                the regular session. Defaults to False.
+
+        Returns:
+            pd.DataFrame: ``open``, ``close`` (UTC timestamps) and
+            ``early_close`` columns indexed by trading date.
+        """
+        starts, ends = self._bounds(extended)
+        return pd.DataFrame(
+            {
+                "open": pd.to_datetime(starts, unit="s", utc=True),
+                "close": pd.to_datetime(ends, unit="s", utc=True),
+                "early_close": self.early_close,
+            },
+            index=pd.Index(self.trading_days, name="date"),
+        )
+
+    def is_trading_day(self, day):
+        """
+        Returns True if the exchange holds a session on the given date.
+
+        Args:
+            day (date | datetime | str): Calendar date.
+
+        Returns:
+            bool: True on trading days.
+        """
+        day = pd.Timestamp(day).date()
+        i = np.searchsorted(self.trading_days, day)
+        return bool(i < len(self.trading_days) and self.trading_days[i] == day)
+
+    def is_open(self, when=None, extended=False, buffer_seconds=0):
+        """
+        Returns True if the market is in session.
+
+        Args:
+            when (datetime | float, optional): Moment to check; naive
+                datetimes are UTC. Defaults to now.
+            extended (bool, optional): Include pre- and post-market sessions.
+                Defaults to False.
+            buffer_seconds (float, optional): Widen each session by this many
+                seconds on both ends. Defaults to 0.
+
+        Returns:
+            bool: True if within a session.
+        """
+        t = _to_epoch(when)
+        self._check_range(t)
+        starts, ends = self._bounds(extended)
+        i = np.searchsorted(starts, t + buffer_seconds, side="right") - 1
+        return bool(i >= 0 and t < ends[i] + buffer_seconds)
+
+    def next_open(self, when=None, extended=False):
+        """
+        Returns the start of the next session at or after ``when``.
+
+        Args:
+            when (datetime | float, optional): Reference moment. Defaults to now.
+            extended (bool, optional): Use the pre-market open. Defaults to False.
+
+        Returns:
+            datetime: Session start in UTC.
+        """
+        t = _to_epoch(when)
+        starts, _ = self._bounds(extended)
+        i = np.searchsorted(starts, t, side="left")
+        if i >= len(starts):
+            self._out_of_range(t)
+        return datetime.fromtimestamp(int(starts[i]), timezone.utc)
+
+    def next_close(self, when=None, extended=False):
+        """
+        Returns the end of the current session, or of the next one if closed.
+
+        Args:
+            when (datetime | float, optional): Reference moment. Defaults to now.
+            extended (bool, optional): Use the post-market close. Defaults to False.
+
+        Returns:
+            datetime: Session end in UTC.
+        """
+        t = _to_epoch(when)
+        _, ends = self._bounds(extended)
+        i = np.searchsorted(ends, t, side="right")
+        if i >= len(ends):
+            self._out_of_range(t)
+        return datetime.fromtimestamp(int(ends[i]), timezone.utc)
+
+    def seconds_until_open(self, when=None, extended=False):
+        """
+        Returns the seconds until the next session starts.
+
+        Args:
+            when (datetime | float, optional): Reference moment. Defaults to now.
+            extended (bool, optional): Use extended hours. Defaults to False.
+
+        Returns:
+            float: 0.0 if already in session, otherwise the wait in seconds.
+        """
+        t = _to_epoch(when)
+        if self.is_open(t, extended=extended):
+            return 0.0
+        return self.next_open(t, extended=extended).timestamp() - t
+
+    def seconds_until_close(self, when=None, extended=False):
+        """
+        Returns the seconds left in the current session.
+
+        Args:
+            when (datetime | float, optional): Reference moment. Defaults to now.
+            extended (bool, optional): Use extended hours. Defaults to False.
+
+        Returns:
+            float | None: Seconds until the close, or None if not in session.
+        """
+        t = _to_epoch(when)
+        if not self.is_open(t, extended=extended):
+            return None
+        return self.next_close(t, extended=extended).timestamp() - t
+
+    def sleep_until_open(self, extended=False, sleep=time.sleep):
+        """
+        Blocks until the next session starts; returns at once if in session.
+
+        Args:
+            extended (bool, optional): Wake for the pre-market session.
+                Defaults to False.
+            sleep (Callable[[float], None], optional): Sleep function, e.g. an
+                event's ``wait`` for interruptible schedulers. Defaults to
+                ``time.sleep``.
+
+        Returns:
+            float: Seconds slept.
+        """
+        wait = self.seconds_until_open(extended=extended)
+        if wait > 0:
+            sleep(wait)
+        return wait
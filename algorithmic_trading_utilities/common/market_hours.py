@@ -1,16 +1,32 @@
 """Market hours utilities for US equity exchanges."""
 
 from datetime import datetime, timezone, time as dtime
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    from algorithmic_trading_utilities.common.market_calendar import MarketCalendar
 
-def is_market_hours() -> bool:
+# Buffer around the regular session for the opening auction and close
+SESSION_BUFFER_SECONDS = 5 * 60
+
+
+def is_market_hours(calendar: Optional["MarketCalendar"] = None) -> bool:
     """Return True if current UTC time is within NYSE regular session.
 
     Covers 09:25-16:05 ET (13:25-20:05 UTC) to include the opening
     auction and a small buffer after close.
 
+    Args:
+        calendar: Optional ``MarketCalendar``. When given, the check uses its
+            session index, so daylight saving time, holidays and early closes
+            are honoured (with the same 5 minute buffer). Without it the fixed
+            UTC window above is used.
+
     Returns:
         True if within market hours, False otherwise.
     """
-    now_utc = datetime.now(timezone.utc).time()
+    now = datetime.now(timezone.utc)
+    if calendar is not None:
+        return calendar.is_open(now, buffer_seconds=SESSION_BUFFER_SECONDS)
+    now_utc = now.time()
     return dtime(13, 25) <= now_utc <= dtime(20, 5)
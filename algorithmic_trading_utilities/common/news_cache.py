@@ -0,0 +1,253 @@
+"""
+On-disk HTTP cache for scraped news pages.
+
+Stores each page's raw body and extracted text together with its ETag /
+Last-Modified validators so polling jobs can revalidate with a conditional GET
+and reuse the already-extracted text when the page has not changed. The cache
+is bounded by total size and evicts least recently used pages first.
+
+Access order is tracked in memory; the JSON index is only rewritten when
+pages are stored or evicted, validators change, or on :meth:`NewsPageCache.flush`
+/ :meth:`NewsPageCache.close`, so cache hits never touch the index file.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class NewsPageCache:
+    """
+    Size-bounded LRU cache of news page bodies and extracted text.
+
+    Example:
+        >>> with NewsPageCache(".cache/news_pages", max_bytes=64 * 1024 * 1024) as cache:
+        ...     text = scrape_with_beautifulsoup(url, cache=cache)
+    """
+
+    def __init__(self, cache_dir=".cache/news_pages", max_bytes=256 * 1024 * 1024):
+        """Initialize the cache, loading any existing index from ``cache_dir``.
+
+        Args:
+            cache_dir (str | Path): Directory holding page files and the index.
+            max_bytes (int): Maximum total size of cached bodies and texts.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._index_path = self.cache_dir / "index.json"
+        self._lock = threading.Lock()
+        # Ordered least to most recently used; recency changes are kept in
+        # memory until the next write
+        self._index = {}
+        self._dirty = False
+        if self._index_path.exists():
+            try:
+                index = json.loads(self._index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable news cache index: {e}")
+            else:
+                self._index = dict(
+                    sorted(index.items(), key=lambda item: item[1]["last_access"])
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _key(url):
+        """Return the file-name-safe cache key for a URL."""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def body_hash(body):
+        """Return the content hash used to detect unchanged bodies.
+
+        Args:
+            body (str): Page body.
+
+        Returns:
+            str: Hex SHA-256 digest of the body.
+        """
+        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def validator_headers(entry):
+        """Return the revalidation headers for a cache entry.
+
+        Args:
+            entry (dict | None): Entry from :meth:`get`.
+
+        Returns:
+            dict: ``If-None-Match`` / ``If-Modified-Since`` headers, empty if
+            there is no entry or it has no validators.
+        """
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    @property
+    def total_bytes(self):
+        """int: Total size of all cached bodies and texts."""
+        return sum(entry["size"] for entry in self._index.values())
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, url):
+        return self._key(url) in self._index
+
+    def conditional_headers(self, url):
+        """Return the revalidation headers for a cached URL.
+
+        Args:
+            url (str): Page URL.
+
+        Returns:
+            dict: ``If-None-Match`` / ``If-Modified-Since`` headers, empty if
+            the URL is not cached or has no validators.
+        """
+        return self.validator_headers(self._index.get(self._key(url)))
+
+    def get(self, url):
+        """Return the cached entry for a URL and mark it as recently used.
+
+        Recency is updated in memory only; the index is saved on the next
+        store, eviction or :meth:`flush`.
+
+        Args:
+            url (str): Page URL.
+
+        Returns:
+            dict | None: Entry with ``url``, ``etag``, ``last_modified``,
+            ``body_hash`` and ``text`` keys, or None on a miss.
+        """
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            try:
+                text = (self.cache_dir / f"{key}.txt").read_text(encoding="utf-8")
+            except OSError:
+                # Files were removed behind our back; treat as a miss
+                self._index.pop(key, None)
+                self._dirty = True
+                return None
+            self._mark_used(key)
+        return dict(entry, text=text)
+
+    def store(self, url, body, text, headers=None):
+        """Store a page body, its extracted text and its validators.
+
+        Args:
+            url (str): Page URL.
+            body (str): Raw page body.
+            text (str): Text extracted from the body.
+            headers (Mapping, optional): Response headers; ``ETag`` and
+                ``Last-Modified`` are kept for revalidation.
+        """
+        headers = headers or {}
+        key = self._key(url)
+        body_bytes = body.encode("utf-8")
+        text_bytes = text.encode("utf-8")
+        with self._lock:
+            (self.cache_dir / f"{key}.html").write_bytes(body_bytes)
+            (self.cache_dir / f"{key}.txt").write_bytes(text_bytes)
+            self._index.pop(key, None)
+            self._index[key] = {
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "body_hash": hashlib.sha256(body_bytes).hexdigest(),
+                "size": len(body_bytes) + len(text_bytes),
+                "last_access": time.time(),
+            }
+            self._evict()
+            self._write_index()
+
+    def touch(self, url, headers=None):
+        """Refresh recency (and validators, if supplied) after a 304 response.
+
+        The index is saved only when a validator changed.
+
+        Args:
+            url (str): Page URL.
+            headers (Mapping, optional): Response headers from the revalidation.
+        """
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return
+            headers = headers or {}
+            changed = False
+            for field, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+                if headers.get(header) and headers[header] != entry.get(field):
+                    entry[field] = headers[header]
+                    changed = True
+            self._mark_used(key)
+            if changed:
+                self._write_index()
+
+    def flush(self):
+        """Save the index if recency changed since it was last written."""
+        with self._lock:
+            if self._dirty:
+                self._write_index()
+
+    def close(self):
+        """Flush the index; the cache stays usable afterwards."""
+        self.flush()
+
+    def clear(self):
+        """Remove every cached page."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._write_index()
+
+    def _mark_used(self, key):
+        """Move a page to the most recently used end of the index."""
+        entry = self._index.pop(key)
+        entry["last_access"] = time.time()
+        self._index[key] = entry
+        self._dirty = True
+
+    def _evict(self):
+        """Drop least recently used pages until the cache fits in ``max_bytes``."""
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key in list(self._index):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]["size"]
+            self._remove(key)
+
+    def _remove(self, key):
+        """Delete a page's files and index entry."""
+        self._index.pop(key, None)
+        for suffix in (".html", ".txt"):
+            try:
+                (self.cache_dir / f"{key}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write_index(self):
+        """Atomically persist the index."""
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._index), encoding="utf-8")
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
@@ -1,20 +1,99 @@
+import queue
 import requests
 import re
-from datetime import datetime
+import threading
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import numpy as np
+import pandas as pd
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
+try:
+    from common.news_cache import NewsPageCache
+except ImportError:
+    from algorithmic_trading_utilities.common.news_cache import NewsPageCache
 
-def scrape_with_beautifulsoup(url):
+# One pattern for every relative-time format seen on news pages, e.g. "4m ago",
+# "16 hours ago", "a day ago". "a"/"an" count as 1.
+_RELATIVE_TIME_PATTERN = re.compile(r"^\s*(\d+|an?)\s*([a-z]+)")
+
+_UNIT_SECONDS = {
+    **dict.fromkeys(["s", "sec", "secs", "second", "seconds"], 1),
+    **dict.fromkeys(["m", "min", "mins", "minute", "minutes"], 60),
+    **dict.fromkeys(["h", "hr", "hrs", "hour", "hours"], 3600),
+    **dict.fromkeys(["d", "day", "days"], 86400),
+    **dict.fromkeys(["w", "week", "weeks"], 604800),
+}
+
+
+def _fetch_text_with_cache(get, url, cache, parser, slot=None, **kwargs):
+    """
+    Fetches a page's text, revalidating against the on-disk page cache.
+
+    Sends a conditional GET with the cached ETag/Last-Modified validators. On
+    ``304 Not Modified``, or a ``200`` whose body is byte-identical to the
+    cached one, the cached text is returned without re-parsing. The cache
+    entry is looked up once and only the request runs inside ``slot``;
+    hashing and parsing happen after it is released.
+
+    Args:
+        get (Callable): ``requests.get`` or a session's ``get`` method.
+        url (str): The URL to fetch.
+        cache (NewsPageCache): Page cache to revalidate against and update.
+        parser (str): BeautifulSoup parser name.
+        slot (ContextManager, optional): Held for the duration of the
+            request only, e.g. a per-host semaphore.
+        **kwargs: Extra arguments for ``get`` (e.g. ``timeout``).
+
+    Returns:
+        str: The text content of the page.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    cached = cache.get(url)
+    with slot if slot is not None else nullcontext():
+        response = get(url, headers=NewsPageCache.validator_headers(cached), **kwargs)
+        if response.status_code == 304 and cached is None:
+            # Not modified without a cached copy to serve: fetch unconditionally
+            response = get(url, **kwargs)
+        response.raise_for_status()
+
+    if response.status_code == 304 and cached is not None:
+        cache.touch(url, response.headers)
+        return cached["text"]
+    if cached is not None and cached["body_hash"] == NewsPageCache.body_hash(
+        response.text
+    ):
+        cache.touch(url, response.headers)
+        return cached["text"]
+
+    text = BeautifulSoup(response.text, parser).get_text()
+    cache.store(url, response.text, text, response.headers)
+    return text
+
+
+def scrape_with_beautifulsoup(url, cache=None):
     """
     Scrapes a website using requests and BeautifulSoup.
 
     Args:
         url (str): The URL of the website to scrape.
+        cache (NewsPageCache, optional): On-disk page cache. When given, the
+            page is revalidated with a conditional GET and unchanged pages are
+            served from the cache without re-parsing.
 
     Returns:
         str: The text content of the website, or None if an error occurs.
     """
     try:
+        if cache is not None:
+            return _fetch_text_with_cache(requests.get, url, cache, "html.parser")
+
         # Send a GET request to the specified URL
         response = requests.get(url)
         response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
@@ -29,6 +108,180 @@ def scrape_with_beautifulsoup(url):
         return None
 
 
+def _resolve_parser(parser):
+    """Return a BeautifulSoup parser name that is usable in this environment.
+
+    ``lxml`` is considerably faster than the pure-Python ``html.parser`` but is
+    an optional dependency, so fall back to ``html.parser`` when it is missing.
+
+    Args:
+        parser (str): Requested parser name (e.g. "lxml" or "html.parser").
+
+    Returns:
+        str: The parser name to pass to BeautifulSoup.
+    """
+    if parser == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            return "html.parser"
+    return parser
+
+
+class _HostSlot:
+    """One claimed per-host request slot, released at most once.
+
+    Used as the ``slot`` of a fetch so the slot is handed back as soon as the
+    request finishes, before the page is parsed.
+    """
+
+    def __init__(self, release):
+        self._release = release
+        self._held = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    def release(self):
+        if self._held:
+            self._held = False
+            self._release()
+
+
+def create_scraping_session(pool_size=32):
+    """
+    Creates a requests Session with a connection pool sized for bulk scraping.
+
+    Args:
+        pool_size (int): Maximum number of pooled connections per host.
+
+    Returns:
+        requests.Session: A session that reuses TCP/TLS connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def scrape_many(
+    urls,
+    max_workers=16,
+    timeout=10,
+    per_host_limit=4,
+    parser="html.parser",
+    session=None,
+    cache=None,
+):
+    """
+    Scrapes many URLs concurrently and yields their text as each one completes.
+
+    Requests share a pooled session, every request has a timeout, and at most
+    ``per_host_limit`` requests are in flight to the same host at once. A URL
+    is only handed to the pool once its host has a free slot, taking hosts in
+    turn, so workers never sit blocked on a busy host and a burst of URLs
+    from one host cannot starve the others. Results are yielded in
+    completion order, so consumers can start working on the first pages
+    while slower ones are still downloading.
+
+    Args:
+        urls (Iterable[str]): URLs to scrape.
+        max_workers (int): Number of concurrent download threads.
+        timeout (float): Per-request timeout in seconds.
+        per_host_limit (int): Maximum concurrent requests to a single host.
+        parser (str): BeautifulSoup parser, e.g. "html.parser" or "lxml"
+            (falls back to "html.parser" if lxml is not installed).
+        session (requests.Session, optional): Session to use. Defaults to a
+            new pooled session that is closed when the generator finishes.
+        cache (NewsPageCache, optional): On-disk page cache used to revalidate
+            pages with conditional GETs and skip re-parsing unchanged ones.
+
+    Yields:
+        Tuple[str, Optional[str]]: ``(url, text)`` pairs, where ``text`` is
+        None if the page could not be fetched.
+    """
+    urls = list(urls)
+    if not urls:
+        return
+
+    parser = _resolve_parser(parser)
+    owns_session = session is None
+    if owns_session:
+        session = create_scraping_session(pool_size=max_workers)
+
+    # Per-host queues in first-seen order; a host's next URL is submitted
+    # when one of its slots frees up
+    pending = {}
+    for url in urls:
+        pending.setdefault(urlsplit(url).netloc, deque()).append(url)
+    in_flight = dict.fromkeys(pending, 0)
+    lock = threading.Lock()
+    done = queue.SimpleQueue()
+    futures = []
+    stopped = False
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def _submit(host):
+        # Caller holds ``lock``
+        url = pending[host].popleft()
+        in_flight[host] += 1
+        future = executor.submit(_fetch, url, host)
+        future.add_done_callback(lambda f, url=url: done.put((url, f)))
+        futures.append(future)
+
+    def _release(host):
+        with lock:
+            in_flight[host] -= 1
+            if pending[host] and not stopped:
+                _submit(host)
+
+    def _fetch(url, host):
+        slot = _HostSlot(lambda: _release(host))
+        try:
+            if cache is not None:
+                return _fetch_text_with_cache(
+                    session.get, url, cache, parser, slot=slot, timeout=timeout
+                )
+            with slot:
+                response = session.get(url, timeout=timeout)
+                response.raise_for_status()
+            # Parse outside the host slot so the next request can start
+            return BeautifulSoup(response.text, parser).get_text()
+        except requests.exceptions.RequestException as e:
+            print(f"An error occurred while fetching {url}: {e}")
+            return None
+        finally:
+            slot.release()
+
+    try:
+        with lock:
+            # Fill the initial slots one URL per host per round
+            for _ in range(per_host_limit):
+                for host in pending:
+                    if pending[host]:
+                        _submit(host)
+        for _ in urls:
+            url, future = done.get()
+            yield url, future.result()
+    finally:
+        # Stop dispatching and drop queued downloads if the consumer stops
+        # iterating early; requests already running are left to finish
+        with lock:
+            stopped = True
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if owns_session:
+            session.close()
+        if cache is not None:
+            # Persist the recency updates of this batch's cache hits
+            cache.flush()
+
+
 def is_within_one_day(post_time_list: list) -> bool:
     """Checks if the post time is within one day."""
     if not post_time_list:
@@ -145,3 +398,132 @@ def calculate_time_ago(pub_date_str):
 
     except (ValueError, AttributeError):
         return ""
+
+
+def parse_relative_ages(time_strings):
+    """
+    Converts relative time strings to ages in seconds for a whole batch.
+
+    All strings are parsed with a single compiled pattern in one vectorized
+    pass, instead of one regex/substring scan per article.
+
+    Args:
+        time_strings (Iterable[str]): Strings like "4m ago", "16 hours ago" or
+            "a day ago". None and unparseable entries are allowed.
+
+    Returns:
+        np.ndarray: Float ages in seconds, NaN where a string could not be parsed.
+    """
+    strings = pd.Series(list(time_strings), dtype=object)
+    if strings.empty:
+        return np.array([], dtype=float)
+
+    parts = strings.str.lower().str.extract(_RELATIVE_TIME_PATTERN)
+    values = pd.to_numeric(parts[0].replace({"a": "1", "an": "1"}), errors="coerce")
+    unit_seconds = parts[1].map(_UNIT_SECONDS)
+    return (values * unit_seconds).to_numpy(dtype=float)
+
+
+def is_within_15_mins_batch(time_strings):
+    """
+    Vectorized version of :func:`is_within_15_mins`.
+
+    Args:
+        time_strings (Iterable[str]): Relative time strings like "4m ago".
+
+    Returns:
+        np.ndarray: Boolean mask, True where the article is at most 15 minutes old.
+    """
+    return parse_relative_ages(time_strings) <= 15 * 60
+
+
+def is_within_one_day_batch(post_times):
+    """
+    Vectorized version of :func:`is_within_one_day`.
+
+    Each element may be a relative time string or, as for the scalar version,
+    a list of strings of which the first containing "ago" is used. Freshness is
+    decided on the parsed age (at most 24 hours) rather than substring checks.
+
+    Args:
+        post_times (Iterable[str | list]): Relative time strings or lists of them.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the article is at most one day old.
+    """
+    time_strings = [
+        (
+            next((s for s in item if s and "ago" in s), None)
+            if isinstance(item, (list, tuple))
+            else item
+        )
+        for item in post_times
+    ]
+    return parse_relative_ages(time_strings) <= 86400
+
+
+def article_ages(pub_dates, now=None):
+    """
+    Computes article ages in seconds against a single reference time.
+
+    Args:
+        pub_dates (Iterable[str]): ISO format timestamps like
+            "2025-10-11T19:27:39Z". Naive timestamps are treated as UTC.
+        now (datetime, optional): Reference time. Defaults to the current UTC
+            time, read once for the whole batch.
+
+    Returns:
+        np.ndarray: Float ages in seconds, NaN where a timestamp is missing or invalid.
+    """
+    timestamps = pd.to_datetime(
+        pd.Series(list(pub_dates), dtype=object),
+        utc=True,
+        errors="coerce",
+        format="ISO8601",
+    )
+    reference = pd.Timestamp(now if now is not None else datetime.now(timezone.utc))
+    if reference.tzinfo is None:
+        reference = reference.tz_localize("UTC")
+    return (reference - timestamps).dt.total_seconds().to_numpy(dtype=float)
+
+
+def age_buckets(ages):
+    """
+    Buckets ages into the units used by :func:`calculate_time_ago`.
+
+    Args:
+        ages (array-like): Ages in seconds (NaN allowed).
+
+    Returns:
+        np.ndarray: One of "s", "m", "h", "d", "w" per age, or "" for NaN.
+    """
+    ages = np.asarray(ages, dtype=float)
+    return np.select(
+        [np.isnan(ages), ages < 60, ages < 3600, ages < 86400, ages < 604800],
+        ["", "s", "m", "h", "d"],
+        default="w",
+    )
+
+
+def calculate_time_ago_batch(pub_dates, now=None):
+    """
+    Vectorized version of :func:`calculate_time_ago`.
+
+    Args:
+        pub_dates (Iterable[str]): ISO format timestamps like "2025-10-11T19:27:39Z".
+        now (datetime, optional): Reference time. Defaults to the current UTC
+            time, read once for the whole batch.
+
+    Returns:
+        np.ndarray: Relative time strings like "4h ago", "" where a timestamp
+        is missing or invalid.
+    """
+    ages = article_ages(pub_dates, now=now)
+    buckets = age_buckets(ages)
+    divisors = pd.Series(buckets).map(
+        {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+    )
+    whole_seconds = np.trunc(ages)
+    values = np.maximum(whole_seconds // divisors.to_numpy(dtype=float), 1)
+    labels = pd.Series(values).astype("Int64").astype(str) + buckets + " ago"
+    return np.where(buckets == "", "", labels.to_numpy(dtype=object))
@@ -0,0 +1,241 @@
+"""
+Parallel parameter sweeps over the backtester.
+
+Evaluates a grid or random sample of trailing stop and position sizing
+parameters with ``run_backtest`` in a process pool. The price panels are
+copied once into shared memory and attached read-only by every worker, so
+per-task overhead is only the parameter dict and the returned equity curve.
+All runs are then scored together with ``calculate_panel_metrics``.
+"""
+
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+try:
+    from common.backtest import run_backtest
+    from common.portfolio_ops import calculate_panel_metrics
+except ImportError:
+    from algorithmic_trading_utilities.common.backtest import run_backtest
+    from algorithmic_trading_utilities.common.portfolio_ops import (
+        calculate_panel_metrics,
+    )
+
+# Parameters of run_backtest that map to calculate_trailing_stop_pct and
+# calculate_position_size
+SWEEPABLE_PARAMETERS = (
+    "stop_min_pct",
+    "stop_max_pct",
+    "stop_atr_multiplier",
+    "risk_per_trade",
+    "atr_multiplier",
+    "max_position_pct",
+)
+
+_PANEL_NAMES = ("close", "entries", "high", "low", "exits", "scores")
+
+# Worker-side state, set by _attach_panels
+_worker_panels = {}
+_worker_blocks = []
+
+
+def parameter_grid(**ranges):
+    """
+    Returns every combination of the given parameter values.
+
+    Example:
+        >>> parameter_grid(stop_atr_multiplier=[2.0, 2.5, 3.0], risk_per_trade=[0.005, 0.01])
+
+    Args:
+        **ranges: Parameter name -> iterable of values.
+
+    Returns:
+        list[dict]: One parameter dict per combination.
+    """
+    names = list(ranges)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(list(ranges[n]) for n in names))
+    ]
+
+
+def sample_parameters(n, seed=None, **ranges):
+    """
+    Returns ``n`` random parameter sets.
+
+    Args:
+        n (int): Number of parameter sets.
+        seed (int, optional): Random seed.
+        **ranges: Parameter name -> ``(low, high)`` tuple for a uniform draw,
+            or a list of values to choose from.
+
+    Returns:
+        list[dict]: ``n`` parameter dicts.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, spec in ranges.items():
+        if isinstance(spec, tuple) and len(spec) == 2:
+            columns[name] = rng.uniform(spec[0], spec[1], n)
+        else:
+            columns[name] = rng.choice(list(spec), n)
+    return [
+        {name: values[i].item() for name, values in columns.items()} for i in range(n)
+    ]
+
+
+def _share_panels(panels):
+    """Copy each panel's values into a new shared memory block."""
+    blocks, specs = [], {}
+    for name, frame in panels.items():
+        values = frame.to_numpy(dtype=bool if name in ("entries", "exits") else float)
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, values.dtype, buffer=block.buf)[:] = values
+        blocks.append(block)
+        specs[name] = (block.name, values.shape, values.dtype.str)
+    return blocks, specs
+
+
+def _attach_panels(specs, index, columns):
+    """Pool initializer: rebuild the panels as views on shared memory."""
+    for name, (block_name, shape, dtype) in specs.items():
+        # Workers share the parent's resource tracker; the parent unlinks
+        block = shared_memory.SharedMemory(name=block_name)
+        values = np.ndarray(shape, dtype, buffer=block.buf)
+        values.flags.writeable = False
+        _worker_blocks.append(block)
+        _worker_panels[name] = pd.DataFrame(values, index=index, columns=columns)
+
+
+def _run_one(task):
+    """Run one backtest on the attached panels."""
+    run_id, params, fixed = task
+    start = time.perf_counter()
+    result = run_backtest(**_worker_panels, **fixed, **params)
+    return (
+        run_id,
+        result["equity"].to_numpy(),
+        len(result["trades"]),
+        time.perf_counter() - start,
+    )
+
+
+def run_parameter_sweep(
+    close,
+    entries,
+    parameters,
+    high=None,
+    low=None,
+    exits=None,
+    scores=None,
+    benchmark_equity=None,
+    max_workers=None,
+    chunksize=1,
+    sort_by="annualised_sharpe",
+    ascending=False,
+    **backtest_kwargs,
+):
+    """
+    Backtests every parameter set in parallel and ranks the results.
+
+    Example:
+        >>> grid = parameter_grid(stop_atr_multiplier=[2, 2.5, 3], stop_min_pct=[0.03, 0.05])
+        >>> table = run_parameter_sweep(close, entries, grid, high=high, low=low)
+        >>> table.head()
+
+    Args:
+        close (pd.DataFrame): Close prices, dates x symbols.
+        entries (pd.DataFrame): Boolean entry signals, same shape as ``close``.
+        parameters (Iterable[dict]): Parameter sets, e.g. from
+            :func:`parameter_grid` or :func:`sample_parameters`. Keys are
+            ``run_backtest`` arguments such as those in ``SWEEPABLE_PARAMETERS``.
+        high, low, exits, scores (pd.DataFrame, optional): Extra panels passed
+            to ``run_backtest``; they must share the ``close`` index and columns.
+        benchmark_equity (pd.Series, optional): Benchmark for alpha/beta.
+        max_workers (int, optional): Worker processes. Defaults to the CPU
+            count; 1 runs in-process without a pool.
+        chunksize (int, optional): Parameter sets sent to a worker at once.
+        sort_by (str, optional): Metric column to sort by. Defaults to
+            ``"annualised_sharpe"``.
+        ascending (bool, optional): Sort order. Defaults to False (best first).
+        **backtest_kwargs: Fixed ``run_backtest`` arguments for every run,
+            e.g. ``initial_equity`` or ``sectors``.
+
+    Returns:
+        pd.DataFrame: One row per run with ``run_id``, the parameters, every
+        ``calculate_all()`` metric, ``n_trades`` and ``run_seconds``, sorted by
+        ``sort_by``. ``attrs["equity"]`` holds the equity curves (dates x
+        run_id) and ``attrs["elapsed_seconds"]`` the wall time.
+    """
+    parameters = [dict(p) for p in parameters]
+    panels = {
+        name: frame
+        for name, frame in zip(_PANEL_NAMES, (close, entries, high, low, exits, scores))
+        if frame is not None
+    }
+    panels = {
+        name: frame.reindex_like(close) if name != "close" else frame
+        for name, frame in panels.items()
+    }
+    # Reindexing leaves NaN gaps, which to_numpy(dtype=bool) would turn into
+    # signals; fill them as run_backtest does so pooled and in-process runs
+    # see the same inputs
+    for name in ("entries", "exits"):
+        if name in panels:
+            panels[name] = panels[name].fillna(False).astype(bool)
+    tasks = [(i, params, backtest_kwargs) for i, params in enumerate(parameters)]
+
+    start = time.perf_counter()
+    if max_workers == 1:
+        _worker_panels.update(panels)
+        try:
+            outputs = [_run_one(task) for task in tasks]
+        finally:
+            _worker_panels.clear()
+    else:
+        blocks, specs = _share_panels(panels)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_attach_panels,
+                initargs=(specs, close.index, close.columns),
+            ) as executor:
+                outputs = list(executor.map(_run_one, tasks, chunksize=chunksize))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+    elapsed = time.perf_counter() - start
+
+    outputs.sort(key=lambda output: output[0])
+    equity = pd.DataFrame(
+        np.column_stack([o[1] for o in outputs]) if outputs else None,
+        index=close.index,
+        columns=[o[0] for o in outputs],
+    )
+    metrics = calculate_panel_metrics(equity, benchmark_equity)
+
+    table = pd.concat(
+        [
+            pd.DataFrame(parameters, index=equity.columns),
+            metrics,
+            pd.DataFrame(
+                {
+                    "n_trades": [o[2] for o in outputs],
+                    "run_seconds": [o[3] for o in outputs],
+                },
+                index=equity.columns,
+            ),
+        ],
+        axis=1,
+    )
+    table = table.rename_axis("run_id").reset_index()
+    if sort_by is not None:
+        table = table.sort_values(sort_by, ascending=ascending, ignore_index=True)
+    table.attrs["equity"] = equity
+    table.attrs["elapsed_seconds"] = elapsed
+    return table
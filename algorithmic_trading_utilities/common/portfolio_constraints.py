@@ -9,6 +9,7 @@ Sector lookups use yfinance with an in-memory cache so each symbol is only
 fetched once per process lifetime.
 """
 
+import numpy as np
 import yfinance as yf
 
 # In-memory cache: symbol -> sector string
@@ -121,3 +122,81 @@ def check_gross_exposure(
         )
 
     return True, f"Gross exposure OK: {gross_pct:.1%}"
+
+
+def exposure_limit_mask(
+    proposed_notional,
+    equity,
+    current_gross=0.0,
+    sector_codes=None,
+    sector_exposure=None,
+    max_sector_pct=0.30,
+    max_gross_pct=0.80,
+    cash=None,
+    cost=None,
+):
+    """Sector, gross exposure and cash checks for a ranked batch of trades.
+
+    Candidates are taken in the order given (highest priority first), as if
+    :func:`check_sector_exposure` and :func:`check_gross_exposure` were called
+    one trade at a time: a trade is accepted when its sector, the gross
+    exposure and (optionally) cash all stay within their limits, and only
+    accepted trades count toward the running totals, so a smaller trade after
+    a rejected one can still fit.
+
+    Args:
+        proposed_notional: Array-like of proposed trade notionals in dollars.
+        equity: Account equity in dollars.
+        current_gross: Current gross exposure in dollars (default 0).
+        sector_codes: Optional integer sector code per trade; negative codes
+            mean unknown sector and, as in :func:`check_sector_exposure`, are
+            never sector-limited. If None, only the gross limit applies.
+        sector_exposure: Current exposure in dollars per sector code
+            (indexable by code). Defaults to zero for every sector.
+        max_sector_pct: Maximum gross exposure per sector as a fraction of
+            equity (default 0.30 = 30%).
+        max_gross_pct: Maximum gross exposure as a fraction of equity
+            (default 0.80 = 80%).
+        cash: Optional cash available in dollars. If given, trades are also
+            rejected once their cost would exceed the cash left.
+        cost: Array-like of cash cost per trade (e.g. notional plus fees).
+            Defaults to the notional. Only used with ``cash``.
+
+    Returns:
+        np.ndarray of bools, True where the trade is allowed.
+    """
+    notional = np.abs(np.asarray(proposed_notional, dtype=float))
+    n = len(notional)
+    allowed = np.zeros(n, dtype=bool)
+    if n == 0 or equity <= 0:
+        return allowed
+
+    codes = (
+        np.asarray(sector_codes, dtype=np.int64)
+        if sector_codes is not None
+        else np.full(n, -1, dtype=np.int64)
+    )
+    spend = notional if cost is None else np.asarray(cost, dtype=float)
+    sector_limit = max_sector_pct * equity
+    gross_room = max_gross_pct * equity - current_gross
+    cash_left = np.inf if cash is None else float(cash)
+    sector_used = {}
+    gross_used = 0.0
+
+    for i in range(n):
+        amount = notional[i]
+        if gross_used + amount > gross_room or spend[i] > cash_left:
+            continue
+        code = int(codes[i])
+        if code >= 0:
+            if code not in sector_used:
+                sector_used[code] = (
+                    float(sector_exposure[code]) if sector_exposure is not None else 0.0
+                )
+            if sector_used[code] + amount > sector_limit:
+                continue
+            sector_used[code] += amount
+        gross_used += amount
+        cash_left -= spend[i]
+        allowed[i] = True
+    return allowed
@@ -21,7 +21,9 @@ except ImportError:
     )
 
 
-def fetch_normalized_benchmark(portfolio_equity: pd.Series, date_start: str):
+def fetch_normalized_benchmark(
+    portfolio_equity: pd.Series, date_start: str, benchmark_data: pd.Series = None
+):
     """Fetch S&P 500, intersect dates with portfolio, and normalise to portfolio start.
 
     The S&P 500 index price is in different units to portfolio equity (index
@@ -32,12 +34,15 @@ def fetch_normalized_benchmark(portfolio_equity: pd.Series, date_start: str):
     Args:
         portfolio_equity: Portfolio equity Series indexed by datetime.
         date_start: Start date YYYY-MM-DD passed to ``get_sp500_prices``.
+        benchmark_data: Already fetched S&P 500 prices. When given, no prices
+            are downloaded, so one fetch can be shared by many portfolios.
 
     Returns:
         Tuple[pd.Series, pd.Series]: ``(aligned_portfolio_equity, normalized_benchmark_equity)``.
     """
 
-    benchmark_data = get_sp500_prices(date_start)
+    if benchmark_data is None:
+        benchmark_data = get_sp500_prices(date_start)
     benchmark_equity = pd.Series(
         data=benchmark_data.values,
         index=pd.to_datetime(benchmark_data.index),
@@ -271,17 +276,26 @@ class PerformanceMetrics:
         """
         if self.benchmark_returns is None or len(self.benchmark_returns) < window:
             return pd.DataFrame(columns=["alpha", "beta"])
-        alphas, betas = [], []
-        for i in range(len(self.returns) - window + 1):
-            y = self.returns.iloc[i : i + window] - self.risk_free_rate
-            X = self.benchmark_returns.iloc[i : i + window] - self.risk_free_rate
-            model = LinearRegression().fit(
-                X.values.reshape(-1, 1), y.values.reshape(-1, 1)
-            )
-            alphas.append(model.intercept_[0])
-            betas.append(model.coef_[0][0])
+        # Per-window OLS fit in closed form: beta = cov(X, y) / var(X) and
+        # alpha = mean(y) - beta * mean(X), from rolling moments
+        n = len(self.returns)
+        y = pd.Series(self.returns.to_numpy(dtype=float) - self.risk_free_rate)
+        X = pd.Series(
+            self.benchmark_returns.to_numpy(dtype=float)[:n] - self.risk_free_rate
+        )
+        cov = y.rolling(window).cov(X).to_numpy()
+        var = X.rolling(window).var().to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # A flat benchmark window has no slope: beta 0, alpha the mean
+            # excess return
+            betas = np.where(var > 0, cov / var, 0.0)
+        alphas = y.rolling(window).mean().to_numpy() - betas * (
+            X.rolling(window).mean().to_numpy()
+        )
         index = self.returns.index[window - 1 :]
-        return pd.DataFrame({"alpha": alphas, "beta": betas}, index=index)
+        return pd.DataFrame(
+            {"alpha": alphas[window - 1 :], "beta": betas[window - 1 :]}, index=index
+        )
 
     def rolling_sharpe(self, window: int = 252) -> pd.Series:
         """Compute rolling Sharpe ratio with a specified window.
@@ -416,3 +430,259 @@ class PerformanceMetrics:
             )
 
         print("\n" + "=" * span)
+
+
+class PerformanceAnalytics:
+    """
+    Memoized plot series derived from a PerformanceMetrics instance.
+
+    Each series (running peak, drawdowns, cumulative returns, rolling
+    moments, rolling Sharpe and alpha/beta per window) is computed on first
+    use and reused afterwards, so plots sharing a window share the work.
+
+    Example:
+        >>> analytics = PerformanceAnalytics(pm)
+        >>> vol = analytics.rolling_std(63)  # computed
+        >>> sharpe = analytics.rolling_sharpe(63)  # reuses the 63-day std
+    """
+
+    def __init__(self, pm: PerformanceMetrics):
+        """
+        Initialize the bundle.
+
+        Args:
+            pm (PerformanceMetrics): Metrics instance providing the equity
+                curves, returns and risk-free rate.
+        """
+        self.pm = pm
+        self._cache = {}
+
+    def _memo(self, key, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _equity(self, benchmark: bool) -> pd.Series:
+        return self.pm.benchmark if benchmark else self.pm.portfolio
+
+    def _returns(self, benchmark: bool) -> pd.Series:
+        return self.pm.benchmark_returns if benchmark else self.pm.returns
+
+    @property
+    def running_peak(self) -> pd.Series:
+        """pd.Series: Running maximum of portfolio equity."""
+        return self._memo("running_peak", self.pm.portfolio.cummax)
+
+    @property
+    def drawdown(self) -> pd.Series:
+        """pd.Series: Portfolio drawdown from the running peak, as a positive fraction."""
+        return self._memo(
+            "drawdown",
+            lambda: (self.running_peak - self.pm.portfolio) / self.running_peak,
+        )
+
+    def cumulative_returns(self, benchmark: bool = False) -> pd.Series:
+        """
+        Compute the percentage change from the first value.
+
+        Args:
+            benchmark (bool, optional): Use the benchmark instead of the
+                portfolio. Defaults to False.
+
+        Returns:
+            pd.Series: Cumulative returns in percent.
+        """
+
+        def compute():
+            equity = self._equity(benchmark)
+            return (equity - equity.iloc[0]) / equity.iloc[0] * 100
+
+        return self._memo(("cumulative_returns", benchmark), compute)
+
+    def rolling_mean(self, window: int, benchmark: bool = False) -> pd.Series:
+        """
+        Compute the rolling mean of daily returns.
+
+        Args:
+            window (int): Rolling window size in days.
+            benchmark (bool, optional): Use benchmark returns. Defaults to False.
+
+        Returns:
+            pd.Series: Rolling mean.
+        """
+        return self._memo(
+            ("rolling_mean", window, benchmark),
+            lambda: self._returns(benchmark).rolling(window).mean(),
+        )
+
+    def rolling_std(self, window: int, benchmark: bool = False) -> pd.Series:
+        """
+        Compute the rolling standard deviation (volatility) of daily returns.
+
+        Args:
+            window (int): Rolling window size in days.
+            benchmark (bool, optional): Use benchmark returns. Defaults to False.
+
+        Returns:
+            pd.Series: Rolling standard deviation.
+        """
+        return self._memo(
+            ("rolling_std", window, benchmark),
+            lambda: self._returns(benchmark).rolling(window).std(),
+        )
+
+    def rolling_sharpe(self, window: int) -> pd.Series:
+        """
+        Compute the rolling Sharpe ratio as in ``PerformanceMetrics.rolling_sharpe``.
+
+        Args:
+            window (int): Rolling window size in days.
+
+        Returns:
+            pd.Series: Rolling Sharpe ratio.
+        """
+        return self._memo(
+            ("rolling_sharpe", window),
+            lambda: (self.rolling_mean(window) - self.pm.risk_free_rate)
+            / self.rolling_std(window),
+        )
+
+    def rolling_alpha_beta(self, window: int) -> pd.DataFrame:
+        """
+        Compute rolling alpha and beta as in ``PerformanceMetrics.rolling_alpha_beta``.
+
+        Args:
+            window (int): Rolling window size in days.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns 'alpha' and 'beta'.
+        """
+        return self._memo(
+            ("rolling_alpha_beta", window),
+            lambda: self.pm.rolling_alpha_beta(window=window),
+        )
+
+    def precompute(self, window: int = 63, alpha_beta_window: int = 252):
+        """
+        Compute every series used by the default performance plots.
+
+        Useful before pickling the bundle to worker processes, so each worker
+        reuses the results instead of recomputing them.
+
+        Args:
+            window (int, optional): Rolling volatility/Sharpe window. Defaults to 63.
+            alpha_beta_window (int, optional): Rolling alpha/beta window.
+                Defaults to 252.
+
+        Returns:
+            PerformanceAnalytics: ``self``.
+        """
+        self.drawdown
+        self.cumulative_returns()
+        self.rolling_sharpe(window)
+        if self.pm.benchmark is not None and len(self.pm.benchmark) > 0:
+            self.cumulative_returns(benchmark=True)
+        if self.pm.benchmark_returns is not None and len(self.pm.benchmark_returns):
+            self.rolling_std(window, benchmark=True)
+            self.rolling_alpha_beta(alpha_beta_window)
+        return self
+
+
+def calculate_panel_metrics(
+    portfolio_equity: pd.DataFrame,
+    benchmark_equity: pd.Series = None,
+    risk_free_rate: float = 0.02 / 252,
+    alpha: float = 0.05,
+) -> pd.DataFrame:
+    """Compute ``PerformanceMetrics.calculate_all()`` for many equity curves at once.
+
+    Each column of ``portfolio_equity`` is one equity curve on a shared date
+    index (e.g. one backtest per parameter set). Every metric is computed with
+    column-wise NumPy operations instead of one ``PerformanceMetrics`` per
+    curve, using the same definitions.
+
+    Args:
+        portfolio_equity (pd.DataFrame): Daily equity values, dates x curves.
+        benchmark_equity (pd.Series, optional): Daily benchmark equity. If
+            provided, enables alpha/beta; it is aligned to the panel dates.
+        risk_free_rate (float, optional): Daily risk-free rate. Defaults to 0.02/252.
+        alpha (float, optional): Significance level for VaR/CVaR. Defaults to 0.05.
+
+    Returns:
+        pd.DataFrame: One row per curve, one column per ``calculate_all()`` key.
+    """
+    equity = portfolio_equity.to_numpy(dtype=float)
+    n_curves = equity.shape[1]
+    returns = equity[1:] / equity[:-1] - 1
+    n = returns.shape[0]
+
+    average = returns.mean(axis=0)
+    std = returns.std(axis=0, ddof=1)
+    excess = average - risk_free_rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = excess / std
+
+        # Sample std of the negative returns only
+        negative = returns < 0
+        n_negative = negative.sum(axis=0)
+        downside_sum = np.where(negative, returns, 0.0).sum(axis=0)
+        downside_sq = np.where(negative, returns**2, 0.0).sum(axis=0)
+        downside_var = (downside_sq - downside_sum**2 / n_negative) / (n_negative - 1)
+        downside = np.where(
+            n_negative == 0, 0.0, np.sqrt(np.clip(downside_var, 0.0, None))
+        )
+        downside = np.where(n_negative == 1, np.nan, downside)
+        sortino = np.where(downside > 0, excess / downside, np.nan)
+
+        cum_max = np.maximum.accumulate(equity, axis=0)
+        drawdown = (cum_max - equity) / cum_max
+        max_dd = drawdown.max(axis=0)
+        calmar = np.where(max_dd > 0, average * 252 / max_dd, np.nan)
+
+    # Longest run of consecutive days below a previous peak
+    in_dd = drawdown > 0
+    counts = np.cumsum(in_dd, axis=0)
+    resets = np.maximum.accumulate(np.where(in_dd, 0, counts), axis=0)
+    duration = (counts - resets).max(axis=0)
+
+    var = np.quantile(returns, alpha, axis=0)
+    tail = returns <= var
+    cvar = np.where(tail, returns, 0.0).sum(axis=0) / tail.sum(axis=0)
+
+    alphas = np.full(n_curves, np.nan)
+    betas = np.full(n_curves, np.nan)
+    if benchmark_equity is not None:
+        bench = (
+            pd.Series(benchmark_equity)
+            .reindex(portfolio_equity.index)
+            .to_numpy(dtype=float)
+        )
+        if not np.isnan(bench).any():
+            x = bench[1:] / bench[:-1] - 1 - risk_free_rate
+            y = returns - risk_free_rate
+            x_dev = x - x.mean()
+            betas = (x_dev @ (y - y.mean(axis=0))) / (x_dev @ x_dev)
+            alphas = y.mean(axis=0) - betas * x.mean()
+
+    return pd.DataFrame(
+        {
+            "average_return": average,
+            "total_return": equity[-1] / equity[0] - 1,
+            "std_dev": std,
+            "sharpe_ratio": sharpe,
+            "annualised_sharpe": sharpe * np.sqrt(252),
+            "sortino_ratio": sortino,
+            "annualised_sortino": sortino * np.sqrt(252),
+            "max_drawdown": max_dd,
+            "average_drawdown": drawdown.mean(axis=0),
+            "drawdown_duration": duration,
+            "skewness": skew(returns, axis=0) if n else np.nan,
+            "kurtosis": kurtosis(returns, axis=0) if n else np.nan,
+            "VaR_5%": var,
+            "CVaR_5%": cvar,
+            "calmar_ratio": calmar,
+            "alpha": alphas,
+            "beta": betas,
+        },
+        index=portfolio_equity.columns,
+    )
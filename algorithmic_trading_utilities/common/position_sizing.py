@@ -6,6 +6,8 @@ Risk per position = ATR-based stop distance x number of shares.
 """
 
 from math import floor
+
+import numpy as np
 from alpaca.data.historical.stock import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
@@ -69,6 +71,7 @@ def calculate_position_size(
     atr_multiplier=2.0,
     max_position_pct=0.03,
     fallback_risk_pct=0.05,
+    atr=None,
 ):
     """Calculate position size based on ATR-adjusted risk.
 
@@ -85,12 +88,15 @@ def calculate_position_size(
         max_position_pct: Maximum position size as fraction of equity (default 3%).
         fallback_risk_pct: If ATR unavailable, assume this % of price as risk
             (default 5%).
+        atr: Precomputed ATR, e.g. an intraday ATR from
+            ``LiveBarAggregator.atr``. When given, no bars are fetched.
 
     Returns:
         A dict with keys: quantity, stop_distance, atr, risk_dollars, notional.
     """
     risk_dollars = equity * risk_per_trade
-    atr = get_atr(symbol, client)
+    if atr is None:
+        atr = get_atr(symbol, client)
 
     if atr and atr > 0:
         stop_distance = atr * atr_multiplier
@@ -116,3 +122,51 @@ def calculate_position_size(
         "risk_dollars": round(risk_dollars, 2),
         "notional": round(quantity * last_price, 2),
     }
+
+
+def calculate_position_size_array(
+    last_price,
+    equity,
+    risk_per_trade,
+    atr,
+    atr_multiplier=2.0,
+    max_position_pct=0.03,
+    fallback_risk_pct=0.05,
+):
+    """Vectorized :func:`calculate_position_size` for precomputed ATRs.
+
+    Applies the same stop distance, notional cap, fallback and one-share
+    minimum element-wise, e.g. to every entry candidate on a backtest day.
+
+    Args:
+        last_price: Array-like of current prices.
+        equity: Total account equity (scalar or broadcastable array).
+        risk_per_trade: Fraction of equity to risk per trade.
+        atr: Array-like of ATR values; NaN, zero or negative values use the
+            ``fallback_risk_pct`` stop distance.
+        atr_multiplier: How many ATRs to use as the stop distance (default 2.0).
+        max_position_pct: Maximum position size as fraction of equity (default 3%).
+        fallback_risk_pct: If ATR unavailable, assume this % of price as risk
+            (default 5%).
+
+    Returns:
+        A tuple of (quantity, stop_distance) arrays; quantity is integer.
+    """
+    last_price = np.asarray(last_price, dtype=float)
+    atr = np.asarray(atr, dtype=float)
+    equity = np.asarray(equity, dtype=float)
+
+    risk_dollars = equity * risk_per_trade
+    stop_distance = np.where(
+        atr > 0, atr * atr_multiplier, last_price * fallback_risk_pct
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_quantity = risk_dollars / stop_distance
+        max_shares_by_notional = (equity * max_position_pct) / last_price
+        quantity = np.floor(np.minimum(raw_quantity, max_shares_by_notional))
+    quantity = np.nan_to_num(quantity, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Minimum 1 share (if the stock isn't too expensive)
+    affordable = (last_price > 0) & (last_price <= equity * max_position_pct)
+    quantity = np.where((quantity == 0) & affordable, 1, quantity)
+    return quantity.astype(np.int64), stop_distance
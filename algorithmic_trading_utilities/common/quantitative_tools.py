@@ -1,25 +1,245 @@
-def remove_highly_correlated_columns(df, threshold):
+import numpy as np
+
+
+def _correlated_column_mask(corr, threshold, offset=0):
+    """
+    Flags the columns to drop from (a block of rows of) a correlation matrix.
+
+    For every pair (i, j) with j > i whose absolute correlation exceeds the
+    threshold, column i is dropped if the correlation is positive, otherwise
+    column j is dropped.
+
+    Args:
+        corr (np.ndarray): Correlation rows ``offset .. offset + len(corr)``
+            against all k columns, shape (rows, k).
+        threshold (float): The correlation coefficient threshold.
+        offset (int, optional): Index of the first row's column. Defaults to 0.
+
+    Returns:
+        np.ndarray: Boolean mask of length k, True for columns to drop.
+    """
+    rows, k = corr.shape
+    # Strict upper triangle of the full matrix, restricted to this row block
+    upper = np.arange(k)[None, :] > (np.arange(rows) + offset)[:, None]
+    with np.errstate(invalid="ignore"):
+        flagged = upper & (np.abs(corr) > threshold)
+        positive = corr > 0
+
+    drop = (flagged & ~positive).any(axis=0)
+    drop[offset : offset + rows] |= (flagged & positive).any(axis=1)
+    return drop
+
+
+def _blockwise_drop_mask(values, threshold, block_size):
+    """
+    Computes the drop mask without materialising the full k x k matrix.
+
+    Columns are standardized once, then correlations are computed for
+    ``block_size`` rows of the upper triangle at a time.
+
+    Args:
+        values (np.ndarray): Data of shape (n, k) without NaNs.
+        threshold (float): The correlation coefficient threshold.
+        block_size (int): Number of correlation rows computed per block.
+
+    Returns:
+        np.ndarray: Boolean mask of length k, True for columns to drop.
+    """
+    n, k = values.shape
+    centered = values - values.mean(axis=0)
+    std = centered.std(axis=0, ddof=1)
+    # Constant columns have no defined correlation, as with DataFrame.corr()
+    std[std == 0] = np.nan
+    z = centered / std
+
+    drop = np.zeros(k, dtype=bool)
+    for start in range(0, k, block_size):
+        stop = min(start + block_size, k)
+        block = np.full((stop - start, k), np.nan)
+        block[:, start:] = (z[:, start:stop].T @ z[:, start:]) / (n - 1)
+        drop |= _correlated_column_mask(block, threshold, offset=start)
+    return drop
+
+
+def remove_highly_correlated_columns(df, threshold, block_size=None):
     """
     Removes columns from a DataFrame that have a correlation coefficient above a given threshold.
 
     Args:
         df (pd.DataFrame): The DataFrame to remove columns from.
         threshold (float): The correlation coefficient threshold.
+        block_size (int, optional): If set, correlations are computed in blocks
+            of this many columns instead of one full k x k matrix, for frames
+            too wide to hold the whole matrix in memory. The data must not
+            contain NaNs in this mode. Defaults to None (full matrix).
 
     Returns:
         pd.DataFrame: The DataFrame with the highly correlated columns removed.
+
+    Raises:
+        ValueError: If ``block_size`` is set and the data contains NaNs.
     """
+    if block_size is None:
+        drop = _correlated_column_mask(df.corr().to_numpy(), threshold)
+    else:
+        values = df.to_numpy(dtype=float)
+        if np.isnan(values).any():
+            raise ValueError(
+                "Blockwise correlation does not support NaNs; fill or drop them first"
+            )
+        drop = _blockwise_drop_mask(values, threshold, block_size)
+
+    return df.drop(columns=df.columns[drop])
+
+
+class RollingCorrelationTracker:
+    """
+    Maintains a trailing-window correlation matrix incrementally.
+
+    Running column sums and the cross-product matrix are updated in O(k^2)
+    per new row (adding the new row and subtracting the one leaving the
+    window), instead of recomputing ``df.corr()`` over the whole window. The
+    sums are periodically rebuilt from the window buffer to bound
+    floating-point drift.
+
+    Example:
+        >>> tracker = RollingCorrelationTracker(df.columns, window=252, threshold=0.9)
+        >>> tracker.extend(history_df)
+        >>> tracker.update(todays_row)
+        >>> universe = tracker.pruned_columns()
+    """
+
+    def __init__(self, columns, window, threshold, recompute_every=None):
+        """Initialize an empty tracker.
+
+        Args:
+            columns (Iterable): Column labels, in the order rows are supplied.
+            window (int): Number of most recent rows in the correlation window.
+            threshold (float): The correlation coefficient threshold used by
+                :meth:`pruned_columns`.
+            recompute_every (int, optional): Rebuild the running sums from the
+                window buffer after this many updates. Defaults to ``window``.
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        self.columns = list(columns)
+        self.window = window
+        self.threshold = threshold
+        self.recompute_every = recompute_every or window
+
+        k = len(self.columns)
+        self._buffer = np.zeros((window, k))
+        self._count = 0
+        self._next = 0
+        self._updates_since_recompute = 0
+        # Sums are kept for rows shifted by a reference row, which keeps the
+        # cross-products small and limits cancellation error
+        self._shift = np.zeros(k)
+        self._sum = np.zeros(k)
+        self._cross = np.zeros((k, k))
+
+    def __len__(self):
+        return self._count
+
+    def update(self, row):
+        """Add one observation, evicting the oldest once the window is full.
+
+        Args:
+            row (array-like | pd.Series): One value per column. A Series is
+                aligned to ``columns`` by label.
+
+        Raises:
+            ValueError: If the row has the wrong length or contains NaNs.
+        """
+        if hasattr(row, "reindex"):
+            row = row.reindex(self.columns)
+        row = np.asarray(row, dtype=float)
+        if row.shape != (len(self.columns),):
+            raise ValueError(
+                f"Expected {len(self.columns)} values per row, got {row.shape}"
+            )
+        if np.isnan(row).any():
+            raise ValueError("RollingCorrelationTracker does not support NaNs")
+
+        if self._count == 0:
+            self._shift = row.copy()
+
+        if self._count == self.window:
+            old = self._buffer[self._next] - self._shift
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self._count += 1
+
+        self._buffer[self._next] = row
+        self._next = (self._next + 1) % self.window
+        new = row - self._shift
+        self._sum += new
+        self._cross += np.outer(new, new)
+
+        self._updates_since_recompute += 1
+        if self._updates_since_recompute >= self.recompute_every:
+            self.recompute()
+
+    def extend(self, rows):
+        """Add many observations in order.
+
+        Args:
+            rows (pd.DataFrame | array-like): Rows to add; a DataFrame is
+                aligned to ``columns`` by label.
+        """
+        if hasattr(rows, "reindex"):
+            rows = rows.reindex(columns=self.columns).to_numpy(dtype=float)
+        for row in np.asarray(rows, dtype=float):
+            self.update(row)
+
+    def recompute(self):
+        """Rebuild the running sums exactly from the rows in the window."""
+        window_rows = self._window_rows()
+        self._updates_since_recompute = 0
+        if not len(window_rows):
+            return
+        self._shift = window_rows.mean(axis=0)
+        shifted = window_rows - self._shift
+        self._sum = shifted.sum(axis=0)
+        self._cross = shifted.T @ shifted
+
+    def _window_rows(self):
+        """Return the buffered rows, oldest first."""
+        if self._count < self.window:
+            return self._buffer[: self._count]
+        return np.roll(self._buffer, -self._next, axis=0)
+
+    def correlation_matrix(self):
+        """Return the current window's Pearson correlation matrix.
+
+        Returns:
+            pd.DataFrame: k x k correlations, NaN for constant columns or
+            fewer than two observations.
+        """
+        import pandas as pd
+
+        k = len(self.columns)
+        n = self._count
+        if n < 2:
+            corr = np.full((k, k), np.nan)
+        else:
+            cov = (self._cross - np.outer(self._sum, self._sum) / n) / (n - 1)
+            std = np.sqrt(np.clip(np.diag(cov), 0, None))
+            std[std == 0] = np.nan
+            corr = np.clip(cov / np.outer(std, std), -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def pruned_columns(self):
+        """Return the columns kept after removing highly correlated ones.
 
-    corr_matrix = df.corr()
-    highly_correlated_cols = set()
-    for i in range(len(corr_matrix.columns)):
-        for j in range(i + 1, len(corr_matrix.columns)):
-            if abs(corr_matrix.iloc[i, j]) > threshold:
-                colname = (
-                    corr_matrix.columns[i]
-                    if corr_matrix.iloc[i, j] > 0
-                    else corr_matrix.columns[j]
-                )
-                highly_correlated_cols.add(colname)
+        Applies the same drop rule as :func:`remove_highly_correlated_columns`
+        to the current window.
 
-    return df.drop(columns=list(highly_correlated_cols))
+        Returns:
+            list: Column labels that survive pruning, in the original order.
+        """
+        drop = _correlated_column_mask(
+            self.correlation_matrix().to_numpy(), self.threshold
+        )
+        return [col for col, dropped in zip(self.columns, drop) if not dropped]
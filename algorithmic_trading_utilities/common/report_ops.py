@@ -1,14 +1,19 @@
 """Performance report writers.
 
-Strategy-agnostic helpers for emitting performance reports. Currently exposes
-:func:`write_performance_pdf` which builds a multi-page PDF from a metrics
-dict and a list of pre-rendered matplotlib Figure objects.
+Strategy-agnostic helpers for emitting performance reports.
+:func:`write_performance_pdf` builds a multi-page PDF from a metrics dict and
+a list of pre-rendered matplotlib Figure objects or serialized page payloads
+from :func:`~common.viz_ops.render_performance_pages`;
+:func:`write_comparison_pdf` does the same for a table of metrics across
+strategies.
 """
 
 from __future__ import annotations
 
+import io
+import pickle
 from pathlib import Path
-from typing import Dict, Iterable, Union
+from typing import Dict, Iterable, Optional, Union
 
 
 def write_performance_pdf(
@@ -17,6 +22,7 @@ def write_performance_pdf(
     metrics: Dict[str, object],
     figs: Iterable,
     period_text: str = "",
+    bbox_inches: Optional[str] = "tight",
 ) -> Path:
     """Write a multi-page PDF performance report.
 
@@ -24,18 +30,69 @@ def write_performance_pdf(
     and a monospace block of metric key/value pairs. Subsequent pages each
     contain one matplotlib Figure.
 
+    ``figs`` is consumed lazily and each page is closed as soon as it is
+    written, so passing a generator such as
+    :func:`~common.viz_ops.iter_performance_figures` keeps one page in memory
+    at a time regardless of the page count.
+
     Args:
         pdf_path: Output path for the PDF file. Parent directory must exist.
         title: Bold title for the cover page.
         metrics: Mapping of metric name -> value rendered as monospace lines.
-        figs: Iterable of matplotlib Figure objects to append, one per page.
+        figs: Iterable (e.g. a generator) of matplotlib Figure objects to
+            append, one per page, or page payload dicts from ``render_performance_pages()``
+            (``"png"`` pages are embedded as images, ``"pickle"`` pages are
+            unpickled and drawn as vector figures).
         period_text: Optional first line on the cover page describing the
             reporting period (e.g. ``"Period: 2025-01-01 to 2026-01-01"``).
+        bbox_inches: ``"tight"`` (default) crops each figure page to its
+            drawn content. ``None`` keeps each page at its figure size and
+            skips that extra layout pass, about 40% of the write time for
+            the performance plots.
 
     Returns:
         Path: The path the PDF was written to.
     """
 
+    lines = [f"{k}: {v}" for k, v in metrics.items()]
+    return _write_pdf(pdf_path, title, lines, figs, period_text, bbox_inches)
+
+
+def write_comparison_pdf(
+    pdf_path: Union[str, Path],
+    title: str,
+    metrics_table,
+    figs: Iterable,
+    period_text: str = "",
+    bbox_inches: Optional[str] = "tight",
+) -> Path:
+    """Write a multi-page PDF comparing several strategies.
+
+    The cover page holds the metrics table with one column per strategy;
+    the remaining pages are the figures (or page payloads), as in
+    :func:`write_performance_pdf`.
+
+    Args:
+        pdf_path: Output path for the PDF file. Parent directory must exist.
+        title: Bold title for the cover page.
+        metrics_table: ``pd.DataFrame`` with one row per strategy and one
+            column per metric (e.g. from ``calculate_panel_metrics``).
+        figs: Iterable of matplotlib Figures or page payload dicts.
+        period_text: Optional first line on the cover page.
+        bbox_inches: Figure page cropping, as in :func:`write_performance_pdf`.
+
+    Returns:
+        Path: The path the PDF was written to.
+    """
+
+    table = metrics_table.T.to_string(float_format=lambda v: f"{v:.4f}")
+    return _write_pdf(
+        pdf_path, title, table.splitlines(), figs, period_text, bbox_inches
+    )
+
+
+def _write_pdf(pdf_path, title, lines, figs, period_text="", bbox_inches="tight"):
+    """Write a cover page of monospace ``lines`` followed by one page per figure."""
     import matplotlib.pyplot as plt
     from matplotlib.backends.backend_pdf import PdfPages
 
@@ -44,11 +101,8 @@ def write_performance_pdf(
     with PdfPages(pdf_path) as pdf:
         cover = plt.figure(figsize=(8.5, 11))
         cover.suptitle(title, fontsize=14, fontweight="bold")
-        lines = []
         if period_text:
-            lines.append(period_text)
-            lines.append("")
-        lines.extend(f"{k}: {v}" for k, v in metrics.items())
+            lines = [period_text, ""] + list(lines)
         cover.text(
             0.08,
             0.88,
@@ -61,7 +115,31 @@ def write_performance_pdf(
         plt.close(cover)
 
         for fig in figs:
-            pdf.savefig(fig, bbox_inches="tight")
+            if isinstance(fig, dict):
+                fig, bbox = _page_figure(fig), None
+            else:
+                bbox = bbox_inches
+            pdf.savefig(fig, bbox_inches=bbox)
             plt.close(fig)
+            # Drop the last reference before the next page is produced
+            del fig
 
     return pdf_path
+
+
+def _page_figure(page: dict):
+    """Rebuild a matplotlib Figure from a serialized page payload."""
+    import matplotlib.pyplot as plt
+    from matplotlib.image import imread
+
+    if page["format"] == "pickle":
+        return pickle.loads(page["data"])
+
+    image = imread(io.BytesIO(page["data"]), format="png")
+    dpi = page.get("dpi", 150)
+    height, width = image.shape[:2]
+    fig = plt.figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.imshow(image, interpolation="none")
+    ax.set_axis_off()
+    return fig
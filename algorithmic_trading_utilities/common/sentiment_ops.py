@@ -1,21 +1,103 @@
 # Use a pipeline as a high-level helper
 from transformers import pipeline
+import hashlib
+import io
 import json
 import os
-import glob
 import sys
+import time
+from pathlib import Path
 
 sys.path.insert(1, "algorithmic_trading_utilities")
 
 try:
-    from common.config import sentiment_model
+    from common.config import (
+        sentiment_model,
+        sentiment_backend,
+        sentiment_batch_size,
+        sentiment_max_length,
+        sentiment_num_threads,
+        sentiment_cache_path,
+    )
 except ImportError:
-    from algorithmic_trading_utilities.common.config import sentiment_model
+    from algorithmic_trading_utilities.common.config import (
+        sentiment_model,
+        sentiment_backend,
+        sentiment_batch_size,
+        sentiment_max_length,
+        sentiment_num_threads,
+        sentiment_cache_path,
+    )
 
-pipe = pipeline(
-    "text-classification",
-    model=sentiment_model,
-)
+SENTIMENT_BACKENDS = ("pytorch", "int8", "onnx")
+
+
+def _build_pipeline(backend):
+    """Build a text-classification pipeline for the given inference backend.
+
+    Args:
+        backend (str): One of ``"pytorch"`` (FP32 model), ``"int8"`` (dynamic
+            INT8 quantization of the Linear layers) or ``"onnx"`` (ONNX Runtime
+            session exported through ``optimum``).
+
+    Returns:
+        transformers.Pipeline: Pipeline with the usual call signature.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the ``onnx`` backend is requested without
+            ``optimum[onnxruntime]`` installed.
+    """
+    backend = backend.lower()
+    if backend == "pytorch":
+        return pipeline("text-classification", model=sentiment_model)
+
+    if backend == "int8":
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        model = AutoModelForSequenceClassification.from_pretrained(sentiment_model)
+        model.eval()
+        # Quantize in place so the FP32 weights are not kept alongside
+        torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+        return pipeline(
+            "text-classification",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(sentiment_model),
+        )
+
+    if backend == "onnx":
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+        except ImportError as e:
+            raise ImportError(
+                "The 'onnx' sentiment backend requires optimum[onnxruntime]"
+            ) from e
+        from transformers import AutoTokenizer
+
+        model = ORTModelForSequenceClassification.from_pretrained(
+            sentiment_model, export=True
+        )
+        return pipeline(
+            "text-classification",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(sentiment_model),
+        )
+
+    raise ValueError(
+        f"Unknown sentiment backend '{backend}'. Use one of {SENTIMENT_BACKENDS}"
+    )
+
+
+# Only the configured backend is loaded, so INT8/ONNX deployments never hold
+# the FP32 weights in memory.
+pipe = _build_pipeline(sentiment_backend)
+
+# In-memory score caches keyed by cache file path (None = process-only cache).
+# Each cache maps a content hash -> {"label": str, "score": float}.
+_sentiment_caches = {}
 
 
 def analyze_sentiment(text):
@@ -30,3 +112,245 @@ def analyze_sentiment(text):
     """
     result = pipe(text)
     return result
+
+
+def _text_hash(text, max_length):
+    """Return the cache key for a text scored with the configured model.
+
+    The model name, inference backend and truncation length are part of the
+    key because each changes the score produced for the same text.
+
+    Args:
+        text (str): Text to hash.
+        max_length (int): Token limit the text is truncated to.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    key = f"{sentiment_model}\x00{sentiment_backend}\x00{max_length}\x00{text}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _get_sentiment_cache(cache_path):
+    """Return the score cache for ``cache_path``, loading it from disk once.
+
+    Args:
+        cache_path (str | Path | None): JSON cache file, or None for a
+            process-only cache.
+
+    Returns:
+        dict: Mutable mapping of content hash -> score dict.
+    """
+    key = str(cache_path) if cache_path is not None else None
+    if key in _sentiment_caches:
+        return _sentiment_caches[key]
+
+    cache = {}
+    if cache_path is not None and Path(cache_path).exists():
+        try:
+            cache = json.loads(Path(cache_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable sentiment cache {cache_path}: {e}")
+            cache = {}
+
+    _sentiment_caches[key] = cache
+    return cache
+
+
+def _save_sentiment_cache(cache_path, cache):
+    """Atomically write a score cache to disk.
+
+    Args:
+        cache_path (str | Path): JSON cache file.
+        cache (dict): Score cache to persist.
+    """
+    path = Path(cache_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def analyze_sentiment_batch(
+    texts,
+    batch_size=None,
+    max_length=None,
+    num_threads=None,
+    cache_path=sentiment_cache_path,
+):
+    """
+    Analyzes the sentiment of many texts in padded batches with caching.
+
+    Identical texts are scored once, and every score is memoized under a
+    content hash so repeated headlines (within a call, across calls and, when
+    ``cache_path`` is set, across runs) never reach the model again. Texts
+    that do need scoring are sorted by length before batching so each batch
+    is padded only to its own longest member.
+
+    Args:
+        texts (Iterable[str]): Texts to analyze. Any iterable is accepted.
+        batch_size (int, optional): Texts per forward pass. Defaults to
+            ``config.sentiment_batch_size``.
+        max_length (int, optional): Token limit; longer texts are truncated.
+            Defaults to ``config.sentiment_max_length``.
+        num_threads (int, optional): torch intra-op thread count. Defaults to
+            ``config.sentiment_num_threads`` (None keeps the torch default).
+        cache_path (str | Path | None, optional): JSON file for the persistent
+            score cache. Defaults to ``config.sentiment_cache_path``. Pass
+            None to keep the cache in memory only.
+
+    Returns:
+        Tuple[list, dict]: ``(results, stats)`` where ``results`` holds one
+        ``{"label", "score"}`` dict per input text (in input order) and
+        ``stats`` reports ``texts``, ``unique_texts``, ``cache_hits``,
+        ``scored``, ``elapsed_seconds`` and ``texts_per_sec``.
+    """
+    batch_size = batch_size or sentiment_batch_size
+    max_length = max_length or sentiment_max_length
+    num_threads = num_threads or sentiment_num_threads
+
+    start = time.perf_counter()
+    texts = list(texts)
+    cache = _get_sentiment_cache(cache_path)
+    hashes = [_text_hash(text, max_length) for text in texts]
+
+    # Unique texts that are not cached yet, keyed by hash
+    pending = {}
+    for text, key in zip(texts, hashes):
+        if key not in cache and key not in pending:
+            pending[key] = text
+
+    if pending:
+        if num_threads:
+            import torch
+
+            torch.set_num_threads(num_threads)
+
+        # Similar lengths share a batch, so dynamic padding stays small
+        keys = sorted(pending, key=lambda k: len(pending[k]))
+        outputs = pipe(
+            [pending[k] for k in keys],
+            batch_size=batch_size,
+            truncation=True,
+            max_length=max_length,
+        )
+        for key, output in zip(keys, outputs):
+            if isinstance(output, list):
+                output = output[0]
+            cache[key] = {"label": output["label"], "score": float(output["score"])}
+
+        if cache_path is not None:
+            _save_sentiment_cache(cache_path, cache)
+
+    results = [dict(cache[key]) for key in hashes]
+    elapsed = time.perf_counter() - start
+    unique_texts = len(set(hashes))
+    stats = {
+        "texts": len(texts),
+        "unique_texts": unique_texts,
+        "cache_hits": unique_texts - len(pending),
+        "scored": len(pending),
+        "elapsed_seconds": round(elapsed, 4),
+        "texts_per_sec": round(len(texts) / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    print(
+        f"Sentiment: {stats['texts']} texts ({stats['scored']} scored, "
+        f"{stats['cache_hits']} cached) in {elapsed:.2f}s "
+        f"- {stats['texts_per_sec']} texts/sec"
+    )
+    return results, stats
+
+
+def _model_size_bytes(backend_pipe):
+    """Return the serialized size of a pipeline's torch weights.
+
+    Args:
+        backend_pipe: A transformers pipeline.
+
+    Returns:
+        int | None: Size in bytes of the model ``state_dict``, or None when the
+        model is not a torch module (e.g. an ONNX Runtime session).
+    """
+    import torch
+
+    model = getattr(backend_pipe, "model", None)
+    if not isinstance(model, torch.nn.Module):
+        return None
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def compare_sentiment_backends(
+    texts, backend="int8", baseline="pytorch", batch_size=None, min_agreement=0.95
+):
+    """
+    Measures an alternative inference backend against the baseline pipeline.
+
+    Both pipelines score the same texts; the comparison reports label
+    agreement, score drift, throughput and model size so a backend can be
+    validated before switching ``config.sentiment_backend`` to it.
+
+    Args:
+        texts (Iterable[str]): Representative texts, e.g. a day of headlines.
+        backend (str, optional): Candidate backend. Defaults to ``"int8"``.
+        baseline (str, optional): Reference backend. Defaults to ``"pytorch"``.
+        batch_size (int, optional): Texts per forward pass. Defaults to
+            ``config.sentiment_batch_size``.
+        min_agreement (float, optional): Minimum fraction of matching labels
+            for the candidate to be within tolerance. Defaults to 0.95.
+
+    Returns:
+        dict: ``label_agreement``, ``max_score_diff``, ``mean_score_diff``,
+        ``baseline_texts_per_sec``, ``backend_texts_per_sec``, ``speedup``,
+        ``baseline_model_bytes``, ``backend_model_bytes`` and
+        ``within_tolerance``.
+    """
+    texts = list(texts)
+    batch_size = batch_size or sentiment_batch_size
+    if not texts:
+        raise ValueError("texts must not be empty")
+
+    measurements = {}
+    for name in (baseline, backend):
+        backend_pipe = pipe if name == sentiment_backend else _build_pipeline(name)
+        start = time.perf_counter()
+        outputs = backend_pipe(
+            texts,
+            batch_size=batch_size,
+            truncation=True,
+            max_length=sentiment_max_length,
+        )
+        elapsed = time.perf_counter() - start
+        outputs = [o[0] if isinstance(o, list) else o for o in outputs]
+        measurements[name] = {
+            "outputs": outputs,
+            "texts_per_sec": len(texts) / elapsed if elapsed > 0 else float("inf"),
+            "model_bytes": _model_size_bytes(backend_pipe),
+        }
+
+    base = measurements[baseline]
+    cand = measurements[backend]
+    matches = [
+        b["label"] == c["label"] for b, c in zip(base["outputs"], cand["outputs"])
+    ]
+    score_diffs = [
+        abs(float(b["score"]) - float(c["score"]))
+        for b, c, same in zip(base["outputs"], cand["outputs"], matches)
+        if same
+    ]
+    label_agreement = sum(matches) / len(matches)
+
+    return {
+        "label_agreement": round(label_agreement, 4),
+        "max_score_diff": round(max(score_diffs), 4) if score_diffs else None,
+        "mean_score_diff": (
+            round(sum(score_diffs) / len(score_diffs), 4) if score_diffs else None
+        ),
+        "baseline_texts_per_sec": round(base["texts_per_sec"], 1),
+        "backend_texts_per_sec": round(cand["texts_per_sec"], 1),
+        "speedup": round(cand["texts_per_sec"] / base["texts_per_sec"], 2),
+        "baseline_model_bytes": base["model_bytes"],
+        "backend_model_bytes": cand["model_bytes"],
+        "within_tolerance": label_agreement >= min_agreement,
+    }
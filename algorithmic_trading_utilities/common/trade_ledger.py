@@ -0,0 +1,217 @@
+"""
+Round-trip trade reconstruction from fills.
+
+Matches each symbol's buy and sell fills into closed trades with FIFO or
+LIFO lot relief, for longs and shorts. A fill that crosses through a flat
+position closes the open lots and opens a new lot in the other direction
+with the remainder. Open lots are kept in flat Python lists with a head
+index (FIFO) or as a stack (LIFO), so each fill costs O(1) amortized plus
+one step per lot it closes. The loop reads one element at a time, which
+plain lists do faster than NumPy buffers; only the matched pieces are
+turned into arrays, once, at the end.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from common.attribution import fills_frame
+except ImportError:
+    from algorithmic_trading_utilities.common.attribution import fills_frame
+
+LOT_METHODS = ("fifo", "lifo")
+
+TRADE_COLUMNS = [
+    "symbol",
+    "side",
+    "qty",
+    "entry_time",
+    "exit_time",
+    "entry_price",
+    "exit_price",
+    "pnl",
+    "return_pct",
+    "holding_days",
+]
+
+# Quantities below this are treated as fully matched
+_QTY_EPSILON = 1e-9
+
+
+def match_trades(fills, method="fifo"):
+    """
+    Matches fills into closed round-trip trades.
+
+    Each closing fill is matched against the symbol's open lots, oldest
+    first (``"fifo"``) or newest first (``"lifo"``). Partial fills split
+    lots, so one fill can close several lots and one lot can be closed by
+    several fills; each matched piece is one row of the ledger.
+
+    Example:
+        >>> trades = match_trades(snapshot["activities"], method="fifo")
+        >>> trade_statistics(trades)["win_rate"]
+
+    Args:
+        fills (pd.DataFrame | Iterable[dict]): Output of
+            :func:`~common.attribution.fills_frame`, or raw activities to
+            pass through it.
+        method (str): ``"fifo"`` or ``"lifo"``.
+
+    Returns:
+        pd.DataFrame: One row per matched piece with the ``TRADE_COLUMNS``,
+        in order of exit. ``side`` is ``"long"`` or ``"short"``.
+        ``attrs["open_lots"]`` holds the unmatched lots (symbol, side, qty,
+        entry_time, entry_price).
+
+    Raises:
+        ValueError: If ``method`` is not one of ``LOT_METHODS``.
+    """
+    if method not in LOT_METHODS:
+        raise ValueError(f"method must be one of {LOT_METHODS}, got {method!r}")
+    if not isinstance(fills, pd.DataFrame):
+        fills = fills_frame(fills)
+    # Zero-quantity fills neither open nor close anything
+    fills = fills[fills["signed_qty"] != 0]
+    fills = fills.sort_values(["symbol", "time"], kind="stable", ignore_index=True)
+
+    code_list = pd.factorize(fills["symbol"])[0].tolist()
+    qty_list = fills["signed_qty"].to_numpy(dtype=float).tolist()
+    fifo = method == "fifo"
+
+    # Closed pieces: lot index into the fills, signed qty, closing fill index
+    out_lot, out_qty, out_exit = [], [], []
+    add_lot, add_qty, add_exit = out_lot.append, out_qty.append, out_exit.append
+    # Open lots of the current symbol (remaining signed qty, opening fill
+    # index); all share one sign
+    lot_qty, lot_fill = [], []
+    head = 0
+    open_lots = []
+    current = -1
+
+    for i, (code, qty) in enumerate(zip(code_list, qty_list)):
+        if code != current:
+            open_lots.extend(zip(lot_fill[head:], lot_qty[head:]))
+            lot_qty, lot_fill = [], []
+            head = 0
+            current = code
+
+        while head < len(lot_qty) and (lot_qty[head] > 0) != (qty > 0):
+            k = head if fifo else len(lot_qty) - 1
+            lot = lot_qty[k]
+            if abs(qty) < abs(lot) - _QTY_EPSILON:
+                # Partial relief: the fill is used up, the lot stays open
+                add_lot(lot_fill[k])
+                add_qty(-qty)
+                add_exit(i)
+                lot_qty[k] = lot + qty
+                qty = 0.0
+                break
+            add_lot(lot_fill[k])
+            add_qty(lot)
+            add_exit(i)
+            qty += lot
+            if fifo:
+                head += 1
+            else:
+                lot_qty.pop()
+                lot_fill.pop()
+            if abs(qty) <= _QTY_EPSILON:
+                qty = 0.0
+                break
+
+        if fifo and head and head == len(lot_qty):
+            # Every lot closed: drop the consumed prefix
+            lot_qty, lot_fill = [], []
+            head = 0
+        if qty:
+            lot_qty.append(qty)
+            lot_fill.append(i)
+
+    open_lots.extend(zip(lot_fill[head:], lot_qty[head:]))
+
+    symbol = fills["symbol"].to_numpy(dtype=object)
+    time = pd.DatetimeIndex(fills["time"])
+    price = fills["price"].to_numpy(dtype=float)
+
+    entry = np.asarray(out_lot, dtype=np.int64)
+    exit_ = np.asarray(out_exit, dtype=np.int64)
+    signed_qty = np.asarray(out_qty, dtype=float)
+    entry_price = price[entry]
+    exit_price = price[exit_]
+    pnl = (exit_price - entry_price) * signed_qty
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return_pct = pnl / (entry_price * np.abs(signed_qty))
+
+    trades = pd.DataFrame(
+        {
+            "symbol": symbol[entry],
+            "side": np.where(signed_qty > 0, "long", "short"),
+            "qty": np.abs(signed_qty),
+            "entry_time": time[entry],
+            "exit_time": time[exit_],
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "pnl": pnl,
+            "return_pct": return_pct,
+            "holding_days": (time.asi8[exit_] - time.asi8[entry]) / 86_400e9,
+        }
+    )
+    trades = trades.sort_values("exit_time", kind="stable", ignore_index=True)
+
+    lot_index = np.asarray([lot[0] for lot in open_lots], dtype=np.int64)
+    open_qty = np.asarray([lot[1] for lot in open_lots], dtype=float)
+    trades.attrs["open_lots"] = pd.DataFrame(
+        {
+            "symbol": symbol[lot_index],
+            "side": np.where(open_qty > 0, "long", "short"),
+            "qty": np.abs(open_qty),
+            "entry_time": time[lot_index],
+            "entry_price": price[lot_index],
+        }
+    )
+    return trades
+
+
+def trade_statistics(trades):
+    """
+    Summarizes a trade ledger.
+
+    Args:
+        trades (pd.DataFrame): Output of :func:`match_trades`.
+
+    Returns:
+        dict: ``trades``, ``winners``, ``losers``, ``win_rate``,
+        ``realized_pnl``, ``gross_profit``, ``gross_loss``, ``profit_factor``,
+        ``average_win``, ``average_loss``, ``expectancy``,
+        ``average_return_pct``, ``average_holding_days``,
+        ``median_holding_days``, ``long_trades`` and ``short_trades``.
+        Ratios are None when undefined (e.g. no trades or no losses).
+    """
+    pnl = trades["pnl"].to_numpy(dtype=float)
+    n = len(pnl)
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+    gross_profit = float(wins.sum())
+    gross_loss = float(losses.sum())
+
+    def mean_or_none(values):
+        return float(np.mean(values)) if len(values) else None
+
+    return {
+        "trades": n,
+        "winners": int(len(wins)),
+        "losers": int(len(losses)),
+        "win_rate": len(wins) / n if n else None,
+        "realized_pnl": float(pnl.sum()),
+        "gross_profit": gross_profit,
+        "gross_loss": gross_loss,
+        "profit_factor": gross_profit / -gross_loss if gross_loss else None,
+        "average_win": mean_or_none(wins),
+        "average_loss": mean_or_none(losses),
+        "expectancy": mean_or_none(pnl),
+        "average_return_pct": mean_or_none(trades["return_pct"].to_numpy(float)),
+        "average_holding_days": mean_or_none(trades["holding_days"].to_numpy(float)),
+        "median_holding_days": (float(trades["holding_days"].median()) if n else None),
+        "long_trades": int((trades["side"] == "long").sum()),
+        "short_trades": int((trades["side"] == "short").sum()),
+    }
@@ -5,6 +5,9 @@ Instead of a flat 10% trailing stop for all positions, the stop percentage
 is derived from each stock's ATR, clamped between configurable bounds.
 """
 
+import numpy as np
+import pandas as pd
+
 
 def calculate_trailing_stop_pct(
     atr,
@@ -36,3 +39,159 @@ def calculate_trailing_stop_pct(
     atr_pct = (atr * atr_multiplier) / last_price
     clamped = max(min_pct, min(atr_pct, max_pct))
     return round(clamped, 4)
+
+
+def calculate_trailing_stop_pct_array(
+    atr,
+    last_price,
+    min_pct=0.05,
+    max_pct=0.20,
+    atr_multiplier=2.5,
+):
+    """Vectorized :func:`calculate_trailing_stop_pct` over arrays.
+
+    Applies the same fallback, clamping and rounding rules element-wise, so
+    whole ATR/price panels (e.g. in a backtest) are converted in one call.
+
+    Args:
+        atr: Array-like of ATR values in dollars. NaN, zero or negative values
+            get the 10% fallback.
+        last_price: Array-like of prices, broadcastable against ``atr``.
+        min_pct: Minimum trailing stop percentage (default 5%).
+        max_pct: Maximum trailing stop percentage (default 20%).
+        atr_multiplier: Multiple of ATR to use (default 2.5).
+
+    Returns:
+        np.ndarray of trailing stop percentages as decimals.
+    """
+    atr = np.asarray(atr, dtype=float)
+    last_price = np.asarray(last_price, dtype=float)
+    valid = (atr > 0) & (last_price > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atr_pct = (atr * atr_multiplier) / last_price
+    clamped = np.round(np.clip(atr_pct, min_pct, max_pct), 4)
+    return np.where(valid, clamped, 0.10)
+
+
+def simulate_trailing_stops(
+    prices,
+    trail_pct=None,
+    atr=None,
+    side="long",
+    high=None,
+    low=None,
+    min_pct=0.05,
+    max_pct=0.20,
+    atr_multiplier=2.5,
+):
+    """Simulate trailing stops for many positions at once.
+
+    Each column of ``prices`` is one position's path, entered at the first
+    row's price (shorter paths are NaN-padded). A long's high-water mark is the
+    running maximum of the highs since entry and its stop trails
+    ``trail_pct`` below it; a short mirrors this with the running low. A bar
+    triggers the stop when it trades through the level set by the previous
+    bar; the exit is at the stop, or at the bar's high (long) / low (short)
+    when the bar gapped through it.
+
+    Args:
+        prices: Array-like or DataFrame of closes, bars x positions.
+        trail_pct: Per-position trail percentages. If None, computed from
+            ``atr`` with :func:`calculate_trailing_stop_pct_array` against
+            each entry price.
+        atr: Per-position ATR in dollars, used when ``trail_pct`` is None.
+        side: ``"long"``, ``"short"`` or a per-position array of either.
+        high: Optional highs, same shape as ``prices`` (defaults to closes).
+        low: Optional lows, same shape as ``prices`` (defaults to closes).
+        min_pct: Minimum trailing stop percentage (default 5%).
+        max_pct: Maximum trailing stop percentage (default 20%).
+        atr_multiplier: Multiple of ATR to use (default 2.5).
+
+    Returns:
+        A dict with ``water_mark`` and ``stop_level`` (bars x positions, NaN
+        after the exit), and per position ``trail_pct``, ``triggered``,
+        ``exit_index`` (-1 if never triggered), ``exit_price`` (NaN if never
+        triggered) and ``return`` (to the exit, else to the last close,
+        signed for shorts). DataFrame inputs give DataFrames/Series, with an
+        additional ``exit_date``.
+    """
+    index = getattr(prices, "index", None)
+    columns = getattr(prices, "columns", None)
+    close = np.asarray(prices, dtype=float)
+    if close.ndim == 1:
+        close = close[:, None]
+    n_bars, n_positions = close.shape
+    high = close if high is None else np.asarray(high, dtype=float).reshape(close.shape)
+    low = close if low is None else np.asarray(low, dtype=float).reshape(close.shape)
+
+    entry = close[0]
+    if trail_pct is None:
+        trail_pct = calculate_trailing_stop_pct_array(
+            atr, entry, min_pct=min_pct, max_pct=max_pct, atr_multiplier=atr_multiplier
+        )
+    trail_pct = np.broadcast_to(np.asarray(trail_pct, dtype=float), (n_positions,))
+    short = np.broadcast_to(np.asarray(side) == "short", (n_positions,))
+
+    # Work in signed prices (negated for shorts) so both sides become a long:
+    # a running maximum of favourable prices and a stop hit from below.
+    sign = np.where(short, -1.0, 1.0)
+    if high is close and low is close:
+        favourable = adverse = close * sign
+    else:
+        favourable = np.where(short, -low, high)
+        adverse = np.where(short, -high, low)
+
+    # Running extreme since entry; the entry bar counts only at its close.
+    # Row by row over contiguous rows is much faster than accumulate down
+    # axis 0, and fmax skips the NaN padding of shorter paths.
+    water = np.empty_like(favourable)
+    water[0] = entry * sign
+    for t in range(1, n_bars):
+        np.fmax(water[t - 1], favourable[t], out=water[t])
+    # Longs trail below the high-water mark, shorts above the low-water mark
+    stop_factor = 1.0 - sign * trail_pct
+    stop = water * stop_factor
+
+    # Each bar is tested against the stop as of the previous bar
+    hit = adverse[1:] <= stop[:-1]
+    triggered = hit.any(axis=0)
+    exit_index = np.where(triggered, hit.argmax(axis=0) + 1, -1)
+
+    positions = np.arange(n_positions)
+    bar = np.where(triggered, exit_index, 1)
+    # A bar that gapped through the stop fills at its best price
+    exit_price = np.where(
+        triggered,
+        np.minimum(stop[bar - 1, positions], favourable[bar, positions]) * sign,
+        np.nan,
+    )
+
+    # Last available close for positions still open
+    last_row = n_bars - 1 - np.argmax(~np.isnan(close[::-1]), axis=0)
+    final_price = np.where(triggered, exit_price, close[last_row, positions])
+    returns = sign * (final_price / entry - 1.0)
+
+    # Back to real prices, blanked after the exit
+    water *= sign
+    np.multiply(water, stop_factor, out=stop)
+    after_exit = np.arange(n_bars)[:, None] > np.where(triggered, exit_index, n_bars)
+    np.putmask(water, after_exit, np.nan)
+    np.putmask(stop, after_exit, np.nan)
+
+    result = {
+        "water_mark": water,
+        "stop_level": stop,
+        "trail_pct": np.array(trail_pct),
+        "triggered": triggered,
+        "exit_index": exit_index,
+        "exit_price": exit_price,
+        "return": returns,
+    }
+    if index is not None and columns is not None:
+        for key in ("water_mark", "stop_level"):
+            result[key] = pd.DataFrame(result[key], index=index, columns=columns)
+        for key in ("trail_pct", "triggered", "exit_index", "exit_price", "return"):
+            result[key] = pd.Series(result[key], index=columns, name=key)
+        exit_dates = pd.Series(index[np.where(triggered, exit_index, 0)], index=columns)
+        result["exit_date"] = exit_dates.where(triggered).rename("exit_date")
+    return result
@@ -1,10 +1,140 @@
-from typing import Optional, Tuple
+import io
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Union
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 import seaborn as sns
-from algorithmic_trading_utilities.common.portfolio_ops import PerformanceMetrics
+from algorithmic_trading_utilities.common.portfolio_ops import (
+    PerformanceAnalytics,
+    PerformanceMetrics,
+)
+
+
+# Module-level tick formatters (not lambdas) keep figures picklable
+def _currency_tick(value, _pos):
+    return PerformanceViz.format(value)
+
+
+def _percent_tick(value, _pos):
+    return "{:.0%}".format(value)
+
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def minmax_downsample_indices(y, n_out: int) -> np.ndarray:
+    """Select the min and max point of each of ``n_out // 2`` equal buckets.
+
+    Min/max-per-pixel bucketing: with one bucket per horizontal pixel, the
+    drawn line covers exactly the same pixels as the full series.
+
+    Args:
+        y (array-like): Values to thin, without NaNs.
+        n_out (int): Maximum number of points returned (at least 4).
+
+    Returns:
+        np.ndarray: Sorted positions of the kept points, always including the
+        first and last point and the global minimum and maximum.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    n_buckets = max((n_out - 2) // 2, 1)
+    size = -(-n // n_buckets)
+    padded = np.empty(n_buckets * size)
+    padded[:n] = y
+    padded[n:] = np.inf
+    lows = padded.reshape(n_buckets, size).argmin(axis=1)
+    padded[n:] = -np.inf
+    highs = padded.reshape(n_buckets, size).argmax(axis=1)
+    offsets = np.arange(n_buckets) * size
+    keep = np.concatenate(([0, n - 1], offsets + lows, offsets + highs))
+    return np.unique(keep[keep < n])
+
+
+def lttb_downsample_indices(y, n_out: int, x=None) -> np.ndarray:
+    """Select points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, from each of ``n_out - 2`` buckets,
+    the point forming the largest triangle with the previously kept point
+    and the average of the next bucket. The global minimum and maximum are
+    added back if LTTB dropped them, so at most ``n_out + 2`` points return.
+
+    Args:
+        y (array-like): Values to thin, without NaNs.
+        n_out (int): Target number of points (at least 3).
+        x (array-like, optional): Numeric x positions. Defaults to 0..n-1.
+
+    Returns:
+        np.ndarray: Sorted positions of the kept points.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return np.unique(np.concatenate((keep, [y.argmin(), y.argmax()])))
+
+
+def downsample_series(
+    series: pd.Series, max_points: int = 2000, method: Optional[str] = "minmax"
+) -> pd.Series:
+    """Thin a series for plotting without visibly changing the line.
+
+    NaN values are dropped first. Series of ``max_points`` or fewer points,
+    or ``method=None``, are returned unchanged (apart from the NaNs).
+
+    Args:
+        series (pd.Series): Series to thin.
+        max_points (int, optional): Point budget. Defaults to 2000, a few
+            points per pixel of a 10 inch figure.
+        method (Optional[str], optional): ``"minmax"`` (min/max per bucket)
+            or ``"lttb"`` (Largest-Triangle-Three-Buckets). Defaults to
+            ``"minmax"``.
+
+    Raises:
+        ValueError: If ``method`` is not one of :data:`DOWNSAMPLE_METHODS`.
+
+    Returns:
+        pd.Series: The kept points, with their original index. The global
+        minimum and maximum are always kept.
+    """
+    if method is None:
+        return series
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"method must be one of {DOWNSAMPLE_METHODS}")
+    series = series[series.notna()]
+    if len(series) <= max_points:
+        return series
+    if method == "minmax":
+        keep = minmax_downsample_indices(series.values, max_points)
+    else:
+        x = (
+            series.index.asi8
+            if isinstance(series.index, pd.DatetimeIndex)
+            else np.arange(len(series))
+        )
+        keep = lttb_downsample_indices(series.values, max_points, x=x)
+    return series.iloc[keep]
 
 
 class PerformanceViz:
@@ -17,6 +147,12 @@ class PerformanceViz:
         >>> viz = PerformanceViz(portfolio_equity=portfolio, benchmark_equity=benchmark)
         >>> viz.plot_equity_curve()
         >>> viz.plot_underwater()
+
+        Long (e.g. minute-level) curves can be thinned before drawing, for
+        all plots or per plot name:
+
+        >>> viz = PerformanceViz(portfolio, benchmark, downsample="minmax")
+        >>> viz = PerformanceViz(portfolio, downsample={"equity_curve": "lttb"})
     """
 
     def __init__(
@@ -24,6 +160,9 @@ class PerformanceViz:
         portfolio_equity: Optional[pd.Series] = None,
         benchmark_equity: Optional[pd.Series] = None,
         pm: Optional[PerformanceMetrics] = None,
+        downsample: Optional[Union[str, dict]] = None,
+        max_points: int = 2000,
+        analytics: Optional[PerformanceAnalytics] = None,
     ):
         """Initialize PerformanceViz.
 
@@ -31,6 +170,14 @@ class PerformanceViz:
             portfolio_equity (Optional[pd.Series]): Equity curve of the portfolio.
             benchmark_equity (Optional[pd.Series]): Equity curve of the benchmark.
             pm (Optional[PerformanceMetrics]): Pre-computed PerformanceMetrics instance.
+            downsample (Optional[Union[str, dict]]): Downsampling applied to the
+                time series plots: ``"minmax"``, ``"lttb"``, or a dict of plot
+                name (as in :data:`_ALL_PERFORMANCE_PLOT_NAMES`) to method.
+                Defaults to None (every point is drawn).
+            max_points (int): Point budget per line when downsampling.
+                Defaults to 2000.
+            analytics (Optional[PerformanceAnalytics]): Shared bundle of
+                precomputed plot series for ``pm``. Defaults to a new bundle.
 
         Raises:
             ValueError: If neither portfolio_equity nor pm is provided.
@@ -44,10 +191,37 @@ class PerformanceViz:
                 raise ValueError("portfolio_equity or pm must be provided")
             self.portfolio = portfolio_equity
             self.benchmark = benchmark_equity
-            self.pm = PerformanceMetrics(
-                self.portfolio.values,
-                self.benchmark.values if self.benchmark is not None else None,
+            self.pm = PerformanceMetrics(self.portfolio, self.benchmark)
+        # Returns, drawdowns and rolling stats are computed once for all plots
+        self.analytics = (
+            analytics if analytics is not None else PerformanceAnalytics(self.pm)
+        )
+        self.downsample = downsample
+        self.max_points = max_points
+
+    def _thin(
+        self, series: pd.Series, plot: str, downsample: Optional[str] = None
+    ) -> pd.Series:
+        """Downsample a series for one plot.
+
+        Args:
+            series (pd.Series): Series to draw.
+            plot (str): Plot name, looked up when ``self.downsample`` is a dict.
+            downsample (Optional[str]): Per-call method overriding the
+                instance setting; ``False`` draws every point.
+
+        Returns:
+            pd.Series: The series to draw.
+        """
+        if downsample is None:
+            downsample = (
+                self.downsample.get(plot)
+                if isinstance(self.downsample, dict)
+                else self.downsample
             )
+        if not downsample:
+            return series
+        return downsample_series(series, self.max_points, downsample)
 
     @staticmethod
     def _make_fig(title: str, figsize: Tuple[int, int] = (10, 5)) -> plt.Figure:
@@ -88,23 +262,30 @@ class PerformanceViz:
             return f"{sign}{currency}{abs_value:.2f}"
 
     def plot_equity_curve(
-        self, show: bool = True, savepath: Optional[str] = None
+        self,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot equity curve for portfolio and benchmark.
 
         Args:
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
         """
         fig = self._make_fig("Equity Curve")
         ax = fig.axes[0]
-        ax.plot(self.portfolio.index, self.portfolio.values, label="Strategy")
-        if self.benchmark is not None:
-            ax.plot(self.benchmark.index, self.benchmark.values, label="Benchmark")
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: self.format(y)))
+        portfolio = self._thin(self.portfolio, "equity_curve", downsample)
+        ax.plot(portfolio.index, portfolio.values, label="Strategy")
+        if self.benchmark is not None and len(self.benchmark) > 0:
+            benchmark = self._thin(self.benchmark, "equity_curve", downsample)
+            ax.plot(benchmark.index, benchmark.values, label="Benchmark")
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(_currency_tick))
         ax.set_xlabel("Date")
         ax.set_ylabel("Equity")
         ax.legend()
@@ -116,13 +297,18 @@ class PerformanceViz:
         return fig
 
     def plot_equity_with_drawdowns(
-        self, show: bool = True, savepath: Optional[str] = None
+        self,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot portfolio equity curve highlighting drawdown periods.
 
         Args:
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
@@ -130,49 +316,40 @@ class PerformanceViz:
         fig = self._make_fig("Portfolio Equity with Drawdowns")
         ax = fig.axes[0]
 
-        dd = self.pm.drawdown_series()
-        x = self.portfolio.index
+        # Peaks come from the full curve so thinning never moves them
+        peak = self.analytics.running_peak
+        equity = self._thin(self.portfolio, "equity_with_drawdowns", downsample)
+        peak = peak.loc[equity.index].values
+        x = equity.index
 
-        ax.plot(x, self.portfolio.values, label="Portfolio")
+        ax.plot(x, equity.values, label="Portfolio")
 
-        in_dd = dd > 0
+        in_dd = equity.values < peak
         if in_dd.any():
+            # One fill and one line collection for all drawdown periods
+            ax.fill_between(
+                x,
+                equity.values,
+                peak,
+                where=in_dd,
+                alpha=0.3,
+                color="red",
+                label="Drawdown",
+            )
             boundaries = np.diff(np.concatenate(([0], in_dd.astype(int), [0])))
             start_idx = np.where(boundaries == 1)[0]
             end_idx = np.where(boundaries == -1)[0]
-            labeled = False
-            for s, e in zip(start_idx, end_idx):
-                top = self.portfolio.values[s - 1]
-                bottom = self.portfolio.values[s:e]
-                if not labeled:
-                    ax.fill_between(
-                        x[s:e],
-                        bottom,
-                        top,
-                        alpha=0.3,
-                        color="red",
-                        label="Drawdown",
-                    )
-                    labeled = True
-                else:
-                    ax.fill_between(
-                        x[s:e],
-                        bottom,
-                        top,
-                        alpha=0.3,
-                        color="red",
-                    )
-                ax.hlines(
-                    y=top,
-                    xmin=x[s - 1],
-                    xmax=x[e - 1],
-                    colors="red",
-                    linewidth=1,
-                )
+            ax.hlines(
+                y=peak[start_idx],
+                xmin=x[start_idx - 1],
+                xmax=x[end_idx - 1],
+                colors="red",
+                linewidth=1,
+            )
 
         ax.set_xlabel("Date")
         ax.set_ylabel("Equity")
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: self.format(y)))
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(_currency_tick))
         ax.grid(True)
         ax.legend()
         if savepath:
@@ -182,23 +359,30 @@ class PerformanceViz:
         return fig
 
     def plot_drawdown_series(
-        self, show: bool = True, savepath: Optional[str] = None
+        self,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot drawdown series with maximum drawdown highlighted.
 
         Args:
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
         """
         fig = self._make_fig("Drawdown Series")
         ax = fig.axes[0]
-        dd = -1 * self.pm.drawdown_series()
+        dd = -1 * self.analytics.drawdown
         x = self.portfolio.index
-        ax.plot(x, dd, label="Drawdown")
-        ax.fill_between(x, dd, 0, alpha=0.3)
+        # The thinned line always keeps the deepest point
+        shown = self._thin(dd, "drawdown_series", downsample)
+        ax.plot(shown.index, shown.values, label="Drawdown")
+        ax.fill_between(shown.index, shown.values, 0, alpha=0.3)
         max_dd_idx = np.argmin(dd)
         ax.plot(
             x[max_dd_idx],
@@ -228,7 +412,10 @@ class PerformanceViz:
         return fig
 
     def plot_cumulative_returns_timeseries(
-        self, show: bool = True, savepath: Optional[str] = None
+        self,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot cumulative returns time series for portfolio and benchmark.
 
@@ -237,6 +424,8 @@ class PerformanceViz:
         Args:
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
@@ -245,8 +434,8 @@ class PerformanceViz:
         ax = fig.axes[0]
 
         # Calculate cumulative returns as percentage change from start
-        portfolio_returns = (
-            (self.portfolio - self.portfolio.iloc[0]) / self.portfolio.iloc[0] * 100
+        portfolio_returns = self._thin(
+            self.analytics.cumulative_returns(), "cumulative_returns", downsample
         )
         ax.plot(
             portfolio_returns.index,
@@ -256,8 +445,10 @@ class PerformanceViz:
         )
 
         if self.benchmark is not None and len(self.benchmark) > 0:
-            benchmark_returns = (
-                (self.benchmark - self.benchmark.iloc[0]) / self.benchmark.iloc[0] * 100
+            benchmark_returns = self._thin(
+                self.analytics.cumulative_returns(benchmark=True),
+                "cumulative_returns",
+                downsample,
             )
             ax.plot(
                 benchmark_returns.index,
@@ -279,7 +470,11 @@ class PerformanceViz:
         return fig
 
     def plot_rolling_volatility(
-        self, window: int = 63, show: bool = True, savepath: Optional[str] = None
+        self,
+        window: int = 63,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot Rolling Volatility of daily returns for portfolio and benchmark.
 
@@ -287,16 +482,25 @@ class PerformanceViz:
             window (int, optional): Rolling window length in days. Defaults to 63.
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
         """
         fig = self._make_fig(f"Rolling Volatility ({window} days)")
         ax = fig.axes[0]
-        vol = self.pm.returns.rolling(window).std()
+        vol = self._thin(
+            self.analytics.rolling_std(window), "rolling_volatility", downsample
+        )
         ax.plot(vol.index, vol, label="Portfolio Volatility")
-        benchmark_vol = self.pm.benchmark_returns.rolling(window).std()
-        ax.plot(benchmark_vol.index, benchmark_vol, label="Benchmark Volatility")
+        if self.pm.benchmark_returns is not None and len(self.pm.benchmark_returns):
+            benchmark_vol = self._thin(
+                self.analytics.rolling_std(window, benchmark=True),
+                "rolling_volatility",
+                downsample,
+            )
+            ax.plot(benchmark_vol.index, benchmark_vol, label="Benchmark Volatility")
         ax.set_xlabel("Date")
         ax.set_ylabel("Volatility")
         ax.grid(True)
@@ -328,7 +532,7 @@ class PerformanceViz:
         if self.pm.benchmark_returns is not None:
             b = pd.Series(self.pm.benchmark_returns)
             ax.hist(b.dropna(), bins=bins, alpha=0.4, label="Benchmark", density=False)
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: "{:.0%}".format(y)))
+        ax.xaxis.set_major_formatter(plt.FuncFormatter(_percent_tick))
         ax.set_xlabel("Daily Return")
         ax.set_ylabel("Frequency")
         ax.legend()
@@ -405,7 +609,11 @@ class PerformanceViz:
         return fig
 
     def plot_rolling_sharpe(
-        self, window: int = 63, show: bool = True, savepath: Optional[str] = None
+        self,
+        window: int = 63,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> plt.Figure:
         """Plot rolling Sharpe ratio over a specified window.
 
@@ -413,13 +621,17 @@ class PerformanceViz:
             window (int, optional): Rolling window length in days. Defaults to 63.
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plot. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Returns:
             plt.Figure: Matplotlib Figure object.
         """
         fig = self._make_fig(f"Rolling Sharpe ({window} days)")
         ax = fig.axes[0]
-        rolling_sharpe = self.pm.rolling_sharpe(window)
+        rolling_sharpe = self._thin(
+            self.analytics.rolling_sharpe(window), "rolling_sharpe", downsample
+        )
 
         ax.plot(
             rolling_sharpe.index,
@@ -438,7 +650,11 @@ class PerformanceViz:
         return fig
 
     def plot_rolling_alpha_beta(
-        self, window: int = 252, show: bool = True, savepath: Optional[str] = None
+        self,
+        window: int = 252,
+        show: bool = True,
+        savepath: Optional[str] = None,
+        downsample: Optional[str] = None,
     ) -> Tuple[plt.Figure, plt.Figure]:
         """Plot rolling alpha and beta relative to benchmark.
 
@@ -446,6 +662,8 @@ class PerformanceViz:
             window (int, optional): Rolling window length in days. Defaults to 252.
             show (bool, optional): Whether to display the plot. Defaults to True.
             savepath (Optional[str], optional): Path to save the plots. Defaults to None.
+            downsample (Optional[str], optional): ``"minmax"``, ``"lttb"`` or
+                ``False``, overriding the instance setting. Defaults to None.
 
         Raises:
             ValueError: If benchmark returns are not available.
@@ -453,15 +671,16 @@ class PerformanceViz:
         Returns:
             Tuple[plt.Figure, plt.Figure]: Figures for alpha and beta plots.
         """
-        if self.pm.benchmark_returns is None:
+        if self.pm.benchmark_returns is None or len(self.pm.benchmark_returns) == 0:
             raise ValueError("Benchmark returns required for rolling alpha/beta")
 
-        df = self.pm.rolling_alpha_beta(window=window)
+        df = self.analytics.rolling_alpha_beta(window)
 
         # Alpha
         fig_a = self._make_fig(f"Rolling Alpha ({window} days)")
         ax_a = fig_a.axes[0]
-        ax_a.plot(df.index, df["alpha"])
+        alpha = self._thin(df["alpha"], "rolling_alpha_beta", downsample)
+        ax_a.plot(alpha.index, alpha.values)
         ax_a.axhline(0, linestyle="--")
         ax_a.set_xlabel("Date")
         ax_a.set_ylabel("Alpha")
@@ -472,7 +691,8 @@ class PerformanceViz:
         # Beta
         fig_b = self._make_fig(f"Rolling Beta ({window} days)")
         ax_b = fig_b.axes[0]
-        ax_b.plot(df.index, df["beta"])
+        beta = self._thin(df["beta"], "rolling_alpha_beta", downsample)
+        ax_b.plot(beta.index, beta.values)
         ax_b.axhline(1, linestyle="--")
         ax_b.set_xlabel("Date")
         ax_b.set_ylabel("Beta")
@@ -595,54 +815,370 @@ def build_performance_figures(
         list: matplotlib Figure objects, one per plot (alpha/beta produces two).
     """
 
+    return list(iter_performance_figures(viz, show, mask_benchmark_on))
+
+
+def iter_performance_figures(
+    viz: "PerformanceViz",
+    show: bool = False,
+    mask_benchmark_on=("cumulative_returns", "equity_curve"),
+):
+    """Lazily build the plots of :func:`build_performance_figures`.
+
+    Each plot is only drawn when the next figure is requested, so a consumer
+    that closes every figure before asking for the next one, such as
+    :func:`~common.report_ops.write_performance_pdf`, has one plot open at a
+    time (two for alpha/beta) however many pages the report has.
+
+    Example:
+        >>> write_performance_pdf("report.pdf", title, metrics, iter_performance_figures(viz))
+
+    Args:
+        viz: ``PerformanceViz`` instance to render from.
+        show: Whether to display plots interactively.
+        mask_benchmark_on: Plot names whose benchmark line is hidden, as in
+            :func:`build_performance_figures`.
+
+    Yields:
+        matplotlib.figure.Figure: One figure per plot, in report order.
+    """
+
+    mask_set = set(mask_benchmark_on)
+    for name in _ALL_PERFORMANCE_PLOT_NAMES:
+        if name == "rolling_alpha_beta" and name in mask_set:
+            # Alpha/beta is meaningless without the benchmark: skip it
+            continue
+        yield from _render_named_plot(viz, name, show=show, mask=name in mask_set)
+
+
+_PLOT_METHODS = {
+    "cumulative_returns": "plot_cumulative_returns_timeseries",
+    "equity_curve": "plot_equity_curve",
+    "equity_with_drawdowns": "plot_equity_with_drawdowns",
+    "drawdown_series": "plot_drawdown_series",
+    "rolling_volatility": "plot_rolling_volatility",
+    "returns_distribution": "plot_returns_distribution",
+    "rolling_sharpe": "plot_rolling_sharpe",
+    "rolling_alpha_beta": "plot_rolling_alpha_beta",
+}
+
+
+def _render_named_plot(viz, name, show=False, mask=False):
+    """Render one named plot, optionally with the benchmark hidden.
+
+    The masking is implemented by temporarily setting ``viz.benchmark`` to
+    ``None`` around the call and restoring it afterwards (the plot methods
+    short-circuit on ``self.benchmark is None``).
+
+    Returns:
+        list: The plot's figures (alpha/beta produces two, or none if there is
+        not enough data).
+    """
     saved_benchmark = viz.benchmark
+    if mask:
+        viz.benchmark = None
+    try:
+        result = getattr(viz, _PLOT_METHODS[name])(show=show)
+    except ValueError:
+        if name != "rolling_alpha_beta":
+            raise
+        return []
+    finally:
+        viz.benchmark = saved_benchmark
+    return list(result) if isinstance(result, tuple) else [result]
+
+
+def _use_agg_backend():
+    """Process pool initializer: render with Agg in the worker process only."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_page_task(task):
+    """Render one named plot to serialized page payloads.
+
+    Runs in pool workers and, for ``max_workers=1``, in the caller's process,
+    so it leaves the matplotlib backend alone.
+    """
+    viz, name, mask, fmt, dpi = task
+    start = time.perf_counter()
+    figs = _render_named_plot(viz, name, show=False, mask=mask)
+    payloads = []
+    for fig in figs:
+        if fmt == "png":
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+            data = buffer.getvalue()
+        else:
+            data = pickle.dumps(fig)
+        plt.close(fig)
+        payloads.append(data)
+    return name, payloads, time.perf_counter() - start
+
+
+def render_performance_pages(
+    viz: "PerformanceViz",
+    mask_benchmark_on=("cumulative_returns", "equity_curve"),
+    fmt: str = "png",
+    dpi: int = 150,
+    max_workers: Optional[int] = None,
+    executor=None,
+) -> dict:
+    """Render the performance plots in a process pool as page payloads.
+
+    Renders the same plots as :func:`build_performance_figures`, one task per
+    plot, in worker processes switched to the Agg backend by the pool
+    initializer. Each worker returns serialized pages which
+    :func:`~common.report_ops.write_performance_pdf` assembles in order.
+    In-process rendering (``max_workers=1``) keeps the caller's backend.
+
+    Args:
+        viz: ``PerformanceViz`` instance to render from (pickled to workers).
+        mask_benchmark_on: Plot names whose benchmark line is hidden, as in
+            :func:`build_performance_figures`.
+        fmt: ``"png"`` to rasterize in the workers (the PDF only embeds
+            images), or ``"pickle"`` for pickled Figures that stay vector in
+            the PDF (drawn when the PDF is written).
+        dpi: Resolution of ``"png"`` pages.
+        max_workers: Worker processes; defaults to the CPU count. 1 renders
+            in-process.
+        executor: Optional existing ``concurrent.futures`` executor to reuse
+            across many reports; ``max_workers`` is then ignored and its
+            workers keep whatever backend they were started with.
+
+    Returns:
+        dict: ``pages`` (list of ``{"name", "format", "data", "dpi"}`` in
+        report order), ``timings`` (pd.Series of render seconds per plot) and
+        ``elapsed_seconds``.
+    """
+    if fmt not in ("png", "pickle"):
+        raise ValueError("fmt must be 'png' or 'pickle'")
     mask_set = set(mask_benchmark_on)
+    # Compute the shared series once here rather than in every worker
+    viz.analytics.precompute()
+    tasks = [
+        (viz, name, name in mask_set, fmt, dpi)
+        for name in _ALL_PERFORMANCE_PLOT_NAMES
+        if not (name == "rolling_alpha_beta" and name in mask_set)
+    ]
+
+    start = time.perf_counter()
+    if executor is not None:
+        results = list(executor.map(_render_page_task, tasks))
+    elif max_workers == 1:
+        results = [_render_page_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_use_agg_backend
+        ) as pool:
+            results = list(pool.map(_render_page_task, tasks))
+    elapsed = time.perf_counter() - start
+
+    pages = [
+        {"name": name, "format": fmt, "data": data, "dpi": dpi}
+        for name, payloads, _ in results
+        for data in payloads
+    ]
+    timings = pd.Series(
+        {name: seconds for name, _, seconds in results}, name="render_seconds"
+    )
+    return {"pages": pages, "timings": timings, "elapsed_seconds": elapsed}
 
-    def _maybe_mask(name, fn):
-        if name in mask_set:
-            viz.benchmark = None
-        try:
-            return fn()
-        finally:
-            viz.benchmark = saved_benchmark
-
-    figs = []
-    figs.append(
-        _maybe_mask(
-            "cumulative_returns",
-            lambda: viz.plot_cumulative_returns_timeseries(show=show),
+
+def build_comparison_figures(
+    equity: pd.DataFrame,
+    benchmark: Optional[pd.Series] = None,
+    metrics: Optional[pd.DataFrame] = None,
+    show: bool = False,
+) -> list:
+    """Build strategy comparison plots for a consolidated report.
+
+    Args:
+        equity: Equity curves, dates x strategies. Curves may cover different
+            dates (NaN outside their history).
+        benchmark: Optional benchmark equity drawn on the growth plot.
+        metrics: Optional metrics table, one row per strategy (e.g. from
+            ``calculate_panel_metrics``); adds a bar chart page of the
+            headline metrics.
+        show: Whether to display plots interactively.
+
+    Returns:
+        list: matplotlib Figure objects: growth of $1, drawdowns and, with
+        ``metrics``, headline metric bars.
+    """
+    # Each curve rebased to its own first value
+    growth = equity / equity.bfill().iloc[0]
+    drawdown = growth / growth.cummax() - 1
+
+    fig_growth = PerformanceViz._make_fig("Growth of $1")
+    ax = fig_growth.axes[0]
+    for name in growth:
+        column = growth[name].dropna()
+        ax.plot(column.index, column.values, label=str(name))
+    if benchmark is not None and len(benchmark) > 0:
+        ax.plot(
+            benchmark.index,
+            benchmark.values / benchmark.iloc[0],
+            label="Benchmark",
+            color="black",
+            linestyle="--",
+            alpha=0.7,
         )
-    )
-    figs.append(_maybe_mask("equity_curve", lambda: viz.plot_equity_curve(show=show)))
-    figs.append(
-        _maybe_mask(
-            "equity_with_drawdowns",
-            lambda: viz.plot_equity_with_drawdowns(show=show),
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Growth of $1")
+    ax.legend()
+    ax.grid(True)
+
+    fig_dd = PerformanceViz._make_fig("Drawdowns")
+    ax = fig_dd.axes[0]
+    for name in drawdown:
+        column = drawdown[name].dropna()
+        ax.plot(column.index, column.values, label=str(name))
+    ax.yaxis.set_major_formatter(mtick.PercentFormatter(xmax=1))
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Drawdown")
+    ax.legend()
+    ax.grid(True)
+
+    figs = [fig_growth, fig_dd]
+    if metrics is not None:
+        headline = [
+            ("total_return", "Total Return", True),
+            ("annualised_sharpe", "Annualised Sharpe", False),
+            ("max_drawdown", "Max Drawdown", True),
+            ("calmar_ratio", "Calmar Ratio", False),
+        ]
+        headline = [h for h in headline if h[0] in metrics]
+        fig_bars, axes = plt.subplots(
+            1, len(headline), figsize=(4 * len(headline), 5), squeeze=False
         )
+        fig_bars.suptitle("Strategy Comparison")
+        labels = [str(name) for name in metrics.index]
+        for ax, (key, title, percent) in zip(axes[0], headline):
+            ax.bar(labels, metrics[key].astype(float).values)
+            ax.set_title(title)
+            ax.tick_params(axis="x", labelrotation=45)
+            if percent:
+                ax.yaxis.set_major_formatter(mtick.PercentFormatter(xmax=1))
+            ax.grid(True, axis="y")
+        fig_bars.tight_layout()
+        figs.append(fig_bars)
+    if show:
+        plt.show()
+    return figs
+
+
+def iter_attribution_figures(
+    attribution: pd.DataFrame,
+    rows_per_page: int = 45,
+    top_n: int = 15,
+    max_rows: Optional[int] = None,
+    show: bool = False,
+):
+    """Lazily build the per-symbol attribution pages of a report.
+
+    The first page charts the ``top_n`` best and worst symbols by
+    contribution to return (or by P&L when no starting equity was given).
+    The rest are compact monospace tables of ``rows_per_page`` symbols each,
+    drawn as a single text block per page. By default every symbol is
+    listed. With ``max_rows`` set, only the best and worst are listed
+    beyond that many symbols and the middle is folded into one "other
+    symbols" row, which bounds the page count for very large accounts.
+
+    Example:
+        >>> figs = itertools.chain(iter_performance_figures(viz), iter_attribution_figures(table))
+        >>> write_performance_pdf("report.pdf", title, metrics, figs)
+
+    Args:
+        attribution: Output of
+            :func:`~common.attribution.compute_position_attribution`.
+        rows_per_page: Symbols listed per table page.
+        top_n: Symbols shown at each end of the contribution chart.
+        max_rows: Symbols listed in the tables; None (default) lists every
+            symbol.
+        show: Whether to display plots interactively.
+
+    Yields:
+        matplotlib.figure.Figure: The chart, then one figure per table page.
+        Nothing for an empty table.
+    """
+    if attribution.empty:
+        return
+
+    if attribution["contribution"].notna().any():
+        key, title, percent = "contribution", "Contribution to Return", True
+    else:
+        key, title, percent = "pnl", "P&L by Symbol", False
+    ranked = attribution[key].astype(float).sort_values(ascending=False)
+    if len(ranked) > 2 * top_n:
+        ranked = pd.concat([ranked.iloc[:top_n], ranked.iloc[-top_n:]])
+    fig, ax = plt.subplots(figsize=(10, max(4, 0.25 * len(ranked) + 1)))
+    fig.suptitle(f"{title} (top and bottom {top_n})" if len(ranked) > top_n else title)
+    ax.barh(
+        ranked.index.astype(str)[::-1],
+        ranked.values[::-1],
+        color=np.where(ranked.values[::-1] >= 0, "tab:green", "tab:red"),
     )
-    figs.append(
-        _maybe_mask("drawdown_series", lambda: viz.plot_drawdown_series(show=show))
+    ax.xaxis.set_major_formatter(
+        mtick.PercentFormatter(xmax=1)
+        if percent
+        else mtick.FuncFormatter(_currency_tick)
     )
-    figs.append(
-        _maybe_mask(
-            "rolling_volatility", lambda: viz.plot_rolling_volatility(show=show)
-        )
+    ax.grid(True, axis="x")
+    fig.tight_layout()
+    if show:
+        plt.show()
+    yield fig
+
+    table = pd.DataFrame(
+        {
+            "Fills": attribution["fills"].astype(int),
+            "Open Qty": attribution["open_qty"].map("{:,.0f}".format),
+            "Avg Buy": attribution["avg_buy_price"].map("{:,.2f}".format),
+            "Avg Sell": attribution["avg_sell_price"].map("{:,.2f}".format),
+            "Mark": attribution["mark_price"].map("{:,.2f}".format),
+            "P&L": attribution["pnl"].map("{:,.2f}".format),
+            "Contrib": attribution["contribution"].map("{:.2%}".format),
+            "Share": attribution["pnl_share"].map("{:.1%}".format),
+            "Held (d)": attribution["holding_days"].map("{:,.1f}".format),
+        },
+        index=attribution.index,
     )
-    figs.append(
-        _maybe_mask(
-            "returns_distribution",
-            lambda: viz.plot_returns_distribution(show=show),
+    if max_rows is not None and len(table) > max_rows:
+        # Rows are sorted by P&L: keep both ends, sum up the middle
+        head, tail = (max_rows + 1) // 2, max_rows // 2
+        middle = attribution.iloc[head : len(attribution) - tail]
+        other = pd.DataFrame(
+            {
+                "Fills": [int(middle["fills"].sum())],
+                "Open Qty": [""],
+                "Avg Buy": [""],
+                "Avg Sell": [""],
+                "Mark": [""],
+                "P&L": ["{:,.2f}".format(middle["pnl"].sum())],
+                "Contrib": ["{:.2%}".format(middle["contribution"].sum(min_count=1))],
+                "Share": ["{:.1%}".format(middle["pnl_share"].sum(min_count=1))],
+                "Held (d)": [""],
+            },
+            index=[f"({len(middle)} other symbols)"],
         )
-    )
-    figs.append(
-        _maybe_mask("rolling_sharpe", lambda: viz.plot_rolling_sharpe(show=show))
-    )
-
-    if "rolling_alpha_beta" not in mask_set:
-        try:
-            a, b = viz.plot_rolling_alpha_beta(show=show)
-            figs.extend([a, b])
-        except ValueError:
-            pass
-
-    return figs
+        table = pd.concat([table.iloc[:head], other, table.iloc[len(table) - tail :]])
+    n_pages = -(-len(table) // rows_per_page)
+    for page in range(n_pages):
+        rows = table.iloc[page * rows_per_page : (page + 1) * rows_per_page]
+        fig = plt.figure(figsize=(11, 8.5))
+        fig.suptitle(
+            f"Per-Symbol Attribution ({page + 1}/{n_pages})", fontweight="bold"
+        )
+        fig.text(
+            0.04,
+            0.92,
+            rows.to_string(),
+            fontsize=8,
+            family="monospace",
+            verticalalignment="top",
+        )
+        if show:
+            plt.show()
+        yield fig
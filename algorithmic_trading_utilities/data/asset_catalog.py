@@ -0,0 +1,225 @@
+"""
+Alpaca asset catalog.
+
+Builds a typed, columnar DataFrame of the asset master list straight from the
+raw ``/v2/assets`` JSON payload (skipping per-asset model validation), caches
+it on disk for a day and serves indexed lookups by symbol, exchange and
+trading flags.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_PATH = ".cache/asset_catalog.pkl"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+CATEGORY_COLUMNS = ["asset_class", "exchange", "status"]
+BOOL_COLUMNS = [
+    "tradable",
+    "marginable",
+    "shortable",
+    "easy_to_borrow",
+    "fractionable",
+]
+FLOAT_COLUMNS = [
+    "min_order_size",
+    "min_trade_increment",
+    "price_increment",
+    "maintenance_margin_requirement",
+]
+CATALOG_COLUMNS = (
+    ["symbol", "id", "name"]
+    + CATEGORY_COLUMNS
+    + BOOL_COLUMNS
+    + FLOAT_COLUMNS
+    + ["attributes"]
+)
+
+
+def build_asset_frame(records):
+    """
+    Builds the typed asset DataFrame from raw asset records in one pass.
+
+    Args:
+        records (list[dict]): Raw ``/v2/assets`` payload, or dicts with the
+            same keys (``asset_class`` is accepted in place of ``class``).
+
+    Returns:
+        pd.DataFrame: One row per asset indexed by ``symbol``, with
+        categorical exchange/class/status, boolean flags and float sizes.
+    """
+    df = pd.DataFrame.from_records(records)
+    if "class" in df.columns:
+        df = df.rename(columns={"class": "asset_class"})
+    df = df.reindex(columns=CATALOG_COLUMNS)
+
+    for column in CATEGORY_COLUMNS:
+        df[column] = df[column].astype("category")
+    for column in BOOL_COLUMNS:
+        df[column] = df[column].fillna(False).astype(bool)
+    for column in FLOAT_COLUMNS:
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+    df["id"] = df["id"].astype(str)
+
+    return df.set_index("symbol", drop=False).rename_axis(None)
+
+
+class AssetCatalog:
+    """
+    Indexed view of the asset master list.
+
+    Example:
+        >>> catalog = load_asset_catalog(trading_client)
+        >>> catalog.get("AAPL")["exchange"]
+        >>> catalog.symbols(exchange="NASDAQ", shortable=True, fractionable=True)
+    """
+
+    def __init__(self, df, fetched_at=None):
+        """Wrap a DataFrame built by :func:`build_asset_frame`.
+
+        Args:
+            df (pd.DataFrame): Asset frame indexed by symbol.
+            fetched_at (float, optional): Epoch seconds the data was fetched.
+        """
+        self.df = df
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        # Row positions per exchange, computed once
+        self._by_exchange = {
+            exchange: positions
+            for exchange, positions in df.groupby(
+                "exchange", observed=True, sort=False
+            ).indices.items()
+        }
+
+    def __len__(self):
+        return len(self.df)
+
+    def __contains__(self, symbol):
+        return symbol in self.df.index
+
+    def get(self, symbol):
+        """
+        Returns one asset.
+
+        Args:
+            symbol (str): Ticker symbol.
+
+        Returns:
+            pd.Series | None: The asset row, or None if unknown.
+        """
+        if symbol not in self.df.index:
+            return None
+        return self.df.loc[symbol]
+
+    def lookup(self, symbols):
+        """
+        Returns the rows for many symbols, in the order given.
+
+        Args:
+            symbols (Iterable[str]): Ticker symbols; unknown ones are skipped.
+
+        Returns:
+            pd.DataFrame: Matching asset rows.
+        """
+        symbols = pd.Index(list(symbols))
+        return self.df.loc[symbols[symbols.isin(self.df.index)]]
+
+    def filter(self, exchange=None, **flags):
+        """
+        Returns the assets on an exchange and/or with the given flags.
+
+        Args:
+            exchange (str | Iterable[str], optional): Exchange name(s), e.g.
+                ``"NASDAQ"``.
+            **flags: Boolean flag filters, e.g. ``shortable=True``,
+                ``fractionable=True``, ``easy_to_borrow=True``.
+
+        Returns:
+            pd.DataFrame: Matching asset rows.
+        """
+        unknown = set(flags) - set(BOOL_COLUMNS)
+        if unknown:
+            raise ValueError(
+                f"Unknown asset flags {sorted(unknown)}; use {BOOL_COLUMNS}"
+            )
+
+        if exchange is None:
+            rows = np.arange(len(self.df))
+        else:
+            exchanges = [exchange] if isinstance(exchange, str) else list(exchange)
+            parts = [
+                self._by_exchange.get(e, np.array([], dtype=int)) for e in exchanges
+            ]
+            rows = np.sort(np.concatenate(parts)) if parts else np.array([], dtype=int)
+
+        mask = np.ones(len(rows), dtype=bool)
+        for flag, wanted in flags.items():
+            mask &= self.df[flag].to_numpy()[rows] == bool(wanted)
+        return self.df.iloc[rows[mask]]
+
+    def symbols(self, exchange=None, **flags):
+        """
+        Returns the symbols matching :meth:`filter`.
+
+        Returns:
+            list[str]: Matching symbols.
+        """
+        return self.filter(exchange=exchange, **flags).index.tolist()
+
+
+def load_asset_catalog(
+    trading_client,
+    cache_path=DEFAULT_CACHE_PATH,
+    ttl_seconds=DEFAULT_TTL_SECONDS,
+    refresh=False,
+    tradable_only=True,
+):
+    """
+    Loads the active asset catalog, from the disk cache when fresh.
+
+    The catalog is fetched with a single raw ``/v2/assets`` request, so the
+    ~12k records are never validated into individual ``Asset`` models.
+
+    Args:
+        trading_client (TradingClient): Alpaca trading client.
+        cache_path (str | Path | None, optional): Pickle cache file. Pass
+            None to disable the disk cache.
+        ttl_seconds (float, optional): Maximum cache age. Defaults to one day.
+        refresh (bool, optional): Ignore any cached catalog. Defaults to False.
+        tradable_only (bool, optional): Keep only tradable assets, as
+            ``get_assets`` does. Defaults to True.
+
+    Returns:
+        AssetCatalog: The catalog.
+    """
+    path = Path(cache_path) if cache_path is not None else None
+    if path is not None and not refresh and path.exists():
+        try:
+            cached = pd.read_pickle(path)
+            age = time.time() - cached["fetched_at"]
+            if age <= ttl_seconds and cached["tradable_only"] == tradable_only:
+                return AssetCatalog(cached["df"], fetched_at=cached["fetched_at"])
+        except Exception as e:
+            print(f"Ignoring unreadable asset catalog cache {path}: {e}")
+
+    # ref. https://docs.alpaca.markets/reference/get-v2-assets-1
+    # "tradable" is not a server-side filter, so it is applied to the frame
+    records = trading_client.get("/assets", {"status": "active"})
+    df = build_asset_frame(records)
+    if tradable_only:
+        df = df[df["tradable"]]
+    fetched_at = time.time()
+
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        pd.to_pickle(
+            {"fetched_at": fetched_at, "tradable_only": tradable_only, "df": df},
+            tmp_path,
+        )
+        tmp_path.replace(path)
+
+    return AssetCatalog(df, fetched_at=fetched_at)
@@ -9,8 +9,17 @@ from alpaca.trading.requests import *
 from alpaca.trading.enums import *
 from typing import List, Any, Tuple
 from datetime import datetime, timedelta
+import threading
+import time
 import pandas as pd
 
+# Symbols per multi-symbol snapshot request
+SNAPSHOT_SYMBOLS_PER_REQUEST = 200
+
+# symbol -> (fetched_at, {"price", "timestamp", "source"}) for get_last_prices
+_last_price_cache = {}
+_last_price_lock = threading.Lock()
+
 
 def get_assets(trading_client):
     """
@@ -40,15 +49,11 @@ def get_asset_list(assets):
         List[Asset]: A list of Asset objects representing the active tradable assets.
 
     """
-    asset_list = []
-    for asset in assets:
-        try:
-            asset_symbol = asset.symbol
-        except AttributeError as e:
-            asset_symbol = asset["symbol"]
-        asset_list.append(asset_symbol)
-
-    return asset_list
+    # Assets may be Asset models or raw dicts; check the type rather than
+    # paying for an AttributeError per dict
+    return [
+        asset["symbol"] if isinstance(asset, dict) else asset.symbol for asset in assets
+    ]
 
 
 def get_asset_df(assets: List[Tuple[str, Any]]) -> pd.DataFrame:
@@ -65,22 +70,9 @@ def get_asset_df(assets: List[Tuple[str, Any]]) -> pd.DataFrame:
     if not assets:
         return pd.DataFrame()
 
-    assets_df = pd.DataFrame(assets)
-
-    # Get the first item from each tuple in the 'columns' column.
-    column_list = [assets_df[column][0][0] for column in assets_df.columns]
-
-    # Get the 2nd item from each tuple to obtain the value
-    assets_df = pd.DataFrame(
-        [
-            [assets_df[column][i][1] for column in assets_df.columns]
-            for i in range(len(assets_df))
-        ]
-    )
-
-    assets_df.columns = column_list
-
-    return assets_df
+    # Asset models iterate as (name, value) pairs, so dict() turns each one
+    # into a record and the frame is built column-wise in a single pass
+    return pd.DataFrame.from_records([dict(asset) for asset in assets])
 
 
 def get_historical_data(symbol, stock_historical_data_client):
@@ -138,3 +130,110 @@ def get_last_price(symbol, stock_historical_data_client):
         last_close_price = None
 
     return last_close_price
+
+
+def _price_from_snapshot(snapshot):
+    """
+    Pick the most recent usable price from a snapshot.
+
+    Preference order: latest trade, quote midpoint, current daily bar close,
+    previous daily bar close.
+
+    Args:
+        snapshot (Snapshot): Snapshot returned by the snapshot endpoint.
+
+    Returns:
+        dict | None: ``price``, ``timestamp`` and ``source``, or None if the
+        snapshot carries no price.
+    """
+    trade = snapshot.latest_trade
+    if trade is not None and trade.price:
+        return {
+            "price": float(trade.price),
+            "timestamp": trade.timestamp,
+            "source": "trade",
+        }
+
+    quote = snapshot.latest_quote
+    if quote is not None and quote.bid_price and quote.ask_price:
+        return {
+            "price": (float(quote.bid_price) + float(quote.ask_price)) / 2,
+            "timestamp": quote.timestamp,
+            "source": "quote",
+        }
+
+    for source, bar in (
+        ("daily_bar", snapshot.daily_bar),
+        ("previous_daily_bar", snapshot.previous_daily_bar),
+    ):
+        if bar is not None and bar.close:
+            return {
+                "price": float(bar.close),
+                "timestamp": bar.timestamp,
+                "source": source,
+            }
+    return None
+
+
+def get_last_prices(
+    symbols,
+    stock_historical_data_client,
+    ttl_seconds=30,
+    chunk_size=SNAPSHOT_SYMBOLS_PER_REQUEST,
+    feed=None,
+):
+    """
+    Get the latest prices for many symbols through the snapshot endpoint.
+
+    Symbols are fetched in multi-symbol snapshot requests of up to
+    ``chunk_size`` symbols. Results are kept in an in-memory cache for
+    ``ttl_seconds`` so repeated sizing calls during one rebalance do not
+    refetch.
+
+    Args:
+        symbols (Iterable[str]): The stock symbols to price.
+        stock_historical_data_client (Any): The client for accessing stock data.
+        ttl_seconds (float): Maximum age of a cached price. Use 0 to always fetch.
+        chunk_size (int): Maximum symbols per snapshot request.
+        feed (DataFeed, optional): Data feed, e.g. ``DataFeed.IEX``. Defaults
+            to the account's default feed.
+
+    Returns:
+        dict: symbol -> ``{"price": float, "timestamp": datetime, "source": str}``
+        where ``source`` is ``"trade"``, ``"quote"``, ``"daily_bar"`` or
+        ``"previous_daily_bar"``. Symbols without any price are omitted.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    now = time.time()
+    prices = {}
+    missing = []
+    with _last_price_lock:
+        for symbol in symbols:
+            cached = _last_price_cache.get(symbol)
+            if cached is not None and now - cached[0] <= ttl_seconds:
+                prices[symbol] = cached[1]
+            else:
+                missing.append(symbol)
+
+    for i in range(0, len(missing), chunk_size):
+        chunk = missing[i : i + chunk_size]
+        # ref. https://docs.alpaca.markets/reference/stocksnapshots-1
+        req = StockSnapshotRequest(symbol_or_symbols=chunk, feed=feed)
+        snapshots = stock_historical_data_client.get_stock_snapshot(req)
+        fetched_at = time.time()
+        with _last_price_lock:
+            for symbol, snapshot in snapshots.items():
+                if snapshot is None:
+                    continue
+                price = _price_from_snapshot(snapshot)
+                if price is not None:
+                    prices[symbol] = price
+                    _last_price_cache[symbol] = (fetched_at, price)
+
+    return {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+
+
+def clear_last_price_cache():
+    """Drop all prices cached by :func:`get_last_prices`."""
+    with _last_price_lock:
+        _last_price_cache.clear()
@@ -0,0 +1,366 @@
+"""
+Live market data aggregation.
+
+Subscribes to trades or minute bars on the Alpaca market data stream and
+aggregates them into rolling OHLCV ring buffers at several timeframes per
+symbol. Buffers are fixed-size NumPy arrays allocated up front, so memory
+stays constant over a trading day however many updates arrive.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_TIMEFRAMES = ("1Min", "5Min", "15Min")
+# One regular session of one-minute bars
+DEFAULT_CAPACITY = 390
+
+
+def _timeframe_seconds(timeframe):
+    """Convert a timeframe like ``"5Min"``, ``"1H"`` or seconds to int seconds."""
+    if isinstance(timeframe, (int, float)):
+        return int(timeframe)
+    return int(pd.Timedelta(timeframe).total_seconds())
+
+
+def _epoch_seconds(timestamp):
+    """Convert a datetime or epoch seconds to float epoch seconds."""
+    if hasattr(timestamp, "timestamp"):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+class BarRingBuffer:
+    """
+    Fixed-capacity OHLCV buffer for one symbol at one timeframe.
+
+    The newest bar is the one currently forming; once ``capacity`` bars
+    exist, each new bar overwrites the oldest.
+    """
+
+    def __init__(self, timeframe, capacity=DEFAULT_CAPACITY):
+        """Allocate the buffer.
+
+        Args:
+            timeframe (str | int): Bar length, e.g. ``"5Min"`` or seconds.
+            capacity (int): Number of bars kept.
+        """
+        self.timeframe = timeframe
+        self.seconds = _timeframe_seconds(timeframe)
+        self.capacity = capacity
+        self.start = np.zeros(capacity, dtype=np.int64)
+        self.open = np.zeros(capacity)
+        self.high = np.zeros(capacity)
+        self.low = np.zeros(capacity)
+        self.close = np.zeros(capacity)
+        self.volume = np.zeros(capacity)
+        self._pos = -1
+        self._count = 0
+        self.late_updates = 0
+
+    def __len__(self):
+        return self._count
+
+    def update(self, timestamp, open_, high, low, close, volume):
+        """
+        Merge a trade or sub-bar into the bar covering ``timestamp``.
+
+        Args:
+            timestamp (datetime | float): Event time.
+            open_, high, low, close (float): Prices (all equal for a trade).
+            volume (float): Traded size.
+
+        Returns:
+            bool: False if the update was older than the forming bar and
+            was dropped.
+        """
+        t = int(_epoch_seconds(timestamp))
+        bucket = t - t % self.seconds
+        if self._count and bucket < self.start[self._pos]:
+            self.late_updates += 1
+            return False
+
+        if not self._count or bucket > self.start[self._pos]:
+            self._pos = (self._pos + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            i = self._pos
+            self.start[i] = bucket
+            self.open[i] = open_
+            self.high[i] = high
+            self.low[i] = low
+            self.close[i] = close
+            self.volume[i] = volume
+            return True
+
+        i = self._pos
+        if high > self.high[i]:
+            self.high[i] = high
+        if low < self.low[i]:
+            self.low[i] = low
+        self.close[i] = close
+        self.volume[i] += volume
+        return True
+
+    def _order(self):
+        """Return buffer indices from oldest to newest."""
+        if self._count < self.capacity:
+            return np.arange(self._count)
+        return (np.arange(self.capacity) + self._pos + 1) % self.capacity
+
+    @property
+    def last_close(self):
+        """float | None: Close of the forming bar."""
+        return float(self.close[self._pos]) if self._count else None
+
+    def to_frame(self, include_partial=True):
+        """
+        Returns the bars as a DataFrame, oldest first.
+
+        Args:
+            include_partial (bool): Include the bar still forming.
+
+        Returns:
+            pd.DataFrame: ``open``, ``high``, ``low``, ``close``, ``volume``
+            indexed by UTC bar start.
+        """
+        order = self._order()
+        if not include_partial and len(order):
+            order = order[:-1]
+        return pd.DataFrame(
+            {
+                "open": self.open[order],
+                "high": self.high[order],
+                "low": self.low[order],
+                "close": self.close[order],
+                "volume": self.volume[order],
+            },
+            index=pd.to_datetime(self.start[order], unit="s", utc=True),
+        )
+
+    def atr(self, period=14, include_partial=False):
+        """
+        Returns the Average True Range over the last ``period`` bars.
+
+        True range is computed as in ``position_sizing.get_atr``:
+        max(high - low, |high - prev_close|, |low - prev_close|), averaged.
+
+        Args:
+            period (int): Number of bars averaged.
+            include_partial (bool): Include the bar still forming.
+
+        Returns:
+            float | None: ATR rounded to 4 decimals, or None with fewer than
+            ``period + 1`` bars.
+        """
+        order = self._order()
+        if not include_partial and len(order):
+            order = order[:-1]
+        if len(order) < period + 1:
+            return None
+        order = order[-(period + 1) :]
+        high = self.high[order][1:]
+        low = self.low[order][1:]
+        prev_close = self.close[order][:-1]
+        tr = np.maximum(
+            high - low,
+            np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+        )
+        return round(float(tr.mean()), 4)
+
+
+class LiveBarAggregator:
+    """
+    Multi-symbol, multi-timeframe live bars fed by the market data stream.
+
+    Example:
+        >>> live = LiveBarAggregator(["AAPL", "MSFT"], timeframes=("1Min", "15Min"))
+        >>> live.start()
+        >>> price = live.last_price("AAPL")
+        >>> atr = live.atr("AAPL", "15Min")
+        >>> calculate_position_size("AAPL", price, equity, 0.01, client, atr=atr)
+    """
+
+    def __init__(
+        self,
+        symbols,
+        timeframes=DEFAULT_TIMEFRAMES,
+        capacity=DEFAULT_CAPACITY,
+        data_stream=None,
+    ):
+        """Allocate buffers for every symbol and timeframe.
+
+        Args:
+            symbols (Iterable[str]): Symbols to aggregate.
+            timeframes (Iterable[str | int]): Bar lengths, e.g. ``"1Min"``.
+            capacity (int): Bars kept per symbol and timeframe.
+            data_stream (StockDataStream, optional): Stream to subscribe on.
+                Defaults to an IEX stream built from the config keys.
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.timeframes = list(timeframes)
+        self.capacity = capacity
+        self.data_stream = data_stream
+        self._buffers = {
+            symbol: {tf: BarRingBuffer(tf, capacity) for tf in self.timeframes}
+            for symbol in self.symbols
+        }
+        self._last_price = {}
+        self._last_time = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def update_trade(self, symbol, timestamp, price, size):
+        """
+        Apply one trade to every timeframe of a symbol.
+
+        Args:
+            symbol (str): Ticker symbol.
+            timestamp (datetime | float): Trade time.
+            price (float): Trade price.
+            size (float): Trade size.
+        """
+        buffers = self._buffers.get(symbol)
+        if buffers is None:
+            return
+        price = float(price)
+        with self._lock:
+            for buffer in buffers.values():
+                buffer.update(timestamp, price, price, price, price, float(size))
+            self._last_price[symbol] = price
+            self._last_time[symbol] = timestamp
+
+    def update_bar(self, symbol, timestamp, open_, high, low, close, volume):
+        """
+        Merge one (minute) bar into every timeframe of a symbol.
+
+        Args:
+            symbol (str): Ticker symbol.
+            timestamp (datetime | float): Bar start time.
+            open_, high, low, close (float): Bar prices.
+            volume (float): Bar volume.
+        """
+        buffers = self._buffers.get(symbol)
+        if buffers is None:
+            return
+        with self._lock:
+            for buffer in buffers.values():
+                buffer.update(
+                    timestamp,
+                    float(open_),
+                    float(high),
+                    float(low),
+                    float(close),
+                    float(volume),
+                )
+            self._last_price[symbol] = float(close)
+            self._last_time[symbol] = timestamp
+
+    async def _handle_trade(self, trade):
+        self.update_trade(trade.symbol, trade.timestamp, trade.price, trade.size)
+
+    async def _handle_bar(self, bar):
+        self.update_bar(
+            bar.symbol,
+            bar.timestamp,
+            bar.open,
+            bar.high,
+            bar.low,
+            bar.close,
+            bar.volume,
+        )
+
+    def last_price(self, symbol):
+        """
+        Returns the latest price seen for a symbol.
+
+        Returns:
+            float | None: Last trade price (or bar close), None before any data.
+        """
+        with self._lock:
+            return self._last_price.get(symbol)
+
+    def last_prices(self):
+        """
+        Returns the latest prices of every symbol with data.
+
+        Returns:
+            dict: symbol -> ``{"price": float, "timestamp": datetime}``.
+        """
+        with self._lock:
+            return {
+                symbol: {"price": price, "timestamp": self._last_time[symbol]}
+                for symbol, price in self._last_price.items()
+            }
+
+    def bars(self, symbol, timeframe, include_partial=True):
+        """
+        Returns a symbol's bars at a timeframe as a DataFrame.
+
+        Args:
+            symbol (str): Ticker symbol.
+            timeframe (str | int): One of the configured timeframes.
+            include_partial (bool): Include the bar still forming.
+
+        Returns:
+            pd.DataFrame: OHLCV bars, oldest first.
+        """
+        with self._lock:
+            return self._buffers[symbol][timeframe].to_frame(include_partial)
+
+    def atr(self, symbol, timeframe, period=14, include_partial=False):
+        """
+        Returns the intraday ATR of a symbol at a timeframe.
+
+        Args:
+            symbol (str): Ticker symbol.
+            timeframe (str | int): One of the configured timeframes.
+            period (int): Number of bars averaged.
+            include_partial (bool): Include the bar still forming.
+
+        Returns:
+            float | None: ATR in dollars, or None with too few bars.
+        """
+        with self._lock:
+            return self._buffers[symbol][timeframe].atr(period, include_partial)
+
+    def start(self, source="trades"):
+        """
+        Subscribe and consume the data stream in a daemon thread.
+
+        Args:
+            source (str): ``"trades"`` to aggregate every trade, or ``"bars"``
+                to aggregate the stream's one-minute bars (far fewer messages).
+        """
+        if self.data_stream is None:
+            from alpaca.data.live.stock import StockDataStream
+
+            try:
+                from common.config import api_key, secret_key
+            except ImportError:
+                from algorithmic_trading_utilities.common.config import (
+                    api_key,
+                    secret_key,
+                )
+            self.data_stream = StockDataStream(api_key, secret_key)
+
+        if source == "trades":
+            self.data_stream.subscribe_trades(self._handle_trade, *self.symbols)
+        elif source == "bars":
+            self.data_stream.subscribe_bars(self._handle_bar, *self.symbols)
+        else:
+            raise ValueError("source must be 'trades' or 'bars'")
+        self._thread = threading.Thread(target=self.data_stream.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=10):
+        """Stop the data stream and wait for its thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to 10.
+        """
+        if self._thread is None:
+            return
+        self.data_stream.stop()
+        self._thread.join(timeout)
+        self._thread = None
@@ -0,0 +1,229 @@
+"""
+Synthetic, seeded inputs for the benchmark suite.
+
+Every generator is deterministic for a given seed and needs no network or
+broker access, so runs on different machines time the same work.
+"""
+
+import enum
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+MINUTES_PER_SESSION = 390
+
+_SYMBOLS = [f"SYM{i:04d}" for i in range(2000)]
+
+
+def daily_equity(years, seed=0, start="2010-01-01"):
+    """
+    Returns portfolio and benchmark daily equity curves.
+
+    Args:
+        years (float): Length of the curves in trading years.
+        seed (int, optional): Random seed.
+        start (str, optional): First business day.
+
+    Returns:
+        tuple[pd.Series, pd.Series]: ``(portfolio, benchmark)`` on the same
+        business-day index.
+    """
+    periods = int(years * TRADING_DAYS_PER_YEAR)
+    index = pd.bdate_range(start, periods=periods)
+    return _correlated_curves(index, seed, sigma=0.01)
+
+
+def minute_equity(sessions, seed=0, start="2024-01-02"):
+    """
+    Returns portfolio and benchmark curves sampled every minute.
+
+    Args:
+        sessions (int): Number of 390-minute sessions.
+        seed (int, optional): Random seed.
+        start (str, optional): First session date.
+
+    Returns:
+        tuple[pd.Series, pd.Series]: ``(portfolio, benchmark)`` on the same
+        minute index.
+    """
+    days = pd.bdate_range(start, periods=sessions)
+    minutes = pd.to_timedelta(np.arange(MINUTES_PER_SESSION), unit="min")
+    open_times = days + pd.Timedelta(hours=14, minutes=30)
+    index = pd.DatetimeIndex((open_times.values[:, None] + minutes.values).ravel())
+    return _correlated_curves(index, seed, sigma=0.0006)
+
+
+def _correlated_curves(index, seed, sigma):
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0002, sigma, len(index))
+    own = rng.normal(0.0001, sigma, len(index))
+    portfolio = pd.Series(
+        100_000 * np.cumprod(1 + 0.8 * market + 0.6 * own), index=index
+    )
+    benchmark = pd.Series(100_000 * np.cumprod(1 + market), index=index)
+    return portfolio, benchmark
+
+
+def activities(n, n_symbols=200, seed=0):
+    """
+    Returns ``n`` account activities shaped like a strategy snapshot's.
+
+    About 90% are fills (buys, sells and short sells in random sizes), the
+    rest fees and dividends. Values are strings, as in a saved snapshot.
+
+    Args:
+        n (int): Number of activities.
+        n_symbols (int, optional): Distinct symbols traded.
+        seed (int, optional): Random seed.
+
+    Returns:
+        list[dict]: Activities in time order.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = np.asarray(_SYMBOLS[:n_symbols], dtype=object)[
+        rng.integers(0, n_symbols, n)
+    ]
+    kinds = rng.choice(["FILL", "FEE", "DIV"], n, p=[0.9, 0.05, 0.05])
+    sides = rng.choice(["buy", "sell", "sell_short"], n, p=[0.5, 0.4, 0.1])
+    qty = rng.integers(1, 200, n)
+    price = np.round(rng.uniform(5, 500, n), 2)
+    start = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+    seconds = np.sort(rng.integers(0, 3600 * 24 * 365, n))
+
+    records = []
+    for i in range(n):
+        when = (start + timedelta(seconds=int(seconds[i]))).isoformat()
+        if kinds[i] == "FILL":
+            records.append(
+                {
+                    "activity_type": "FILL",
+                    "symbol": symbols[i],
+                    "side": sides[i],
+                    "qty": str(qty[i]),
+                    "price": str(price[i]),
+                    "transaction_time": when,
+                    "order_id": f"order-{i}",
+                }
+            )
+        else:
+            records.append(
+                {
+                    "activity_type": kinds[i],
+                    "symbol": symbols[i] if kinds[i] == "DIV" else None,
+                    "net_amount": str(-round(price[i] / 100, 2)),
+                    "date": when,
+                }
+            )
+    return records
+
+
+def snapshot(n_activities, n_positions=100, years=1, seed=0):
+    """
+    Returns a strategy snapshot dict as ``save_strategy_snapshot`` writes it.
+
+    Args:
+        n_activities (int): Number of activities.
+        n_positions (int, optional): Open positions.
+        years (float, optional): Length of the equity history.
+        seed (int, optional): Random seed.
+
+    Returns:
+        dict: Snapshot with positions, orders, activities, balances and
+        equity performance.
+    """
+    rng = np.random.default_rng(seed)
+    equity, _ = daily_equity(years, seed=seed)
+    positions = [
+        {
+            "symbol": _SYMBOLS[i],
+            "side": "long" if i % 5 else "short",
+            "qty": str(int(rng.integers(1, 500))),
+            "market_value": str(round(float(rng.uniform(-5e3, 5e4)), 2)),
+            "unrealized_pl": str(round(float(rng.normal(0, 500)), 2)),
+            "unrealized_plpc": str(round(float(rng.normal(0, 0.05)), 4)),
+        }
+        for i in range(n_positions)
+    ]
+    orders = [
+        {
+            "symbol": _SYMBOLS[i % n_positions],
+            "status": "new",
+            "order_type": "trailing_stop",
+            "side": "sell",
+        }
+        for i in range(n_positions)
+    ]
+    return {
+        "strategy": "benchmark",
+        "timestamp": "2025-01-02T21:00:00+00:00",
+        "positions": positions,
+        "orders": orders,
+        "activities": activities(n_activities, seed=seed),
+        "balances": {"status": "ACTIVE", "currency": "USD", "equity": "100000"},
+        "equity_performance": {
+            "timestamp": [int(ts.timestamp()) for ts in equity.index],
+            "equity": equity.round(2).tolist(),
+        },
+    }
+
+
+class _Side(enum.Enum):
+    BUY = "buy"
+    SELL = "sell"
+
+
+def sdk_activities(n, seed=0):
+    """
+    Returns ``n`` objects shaped like Alpaca SDK activity models.
+
+    Attribute objects holding enums, UUIDs, datetimes and a nested object,
+    which is what ``_to_serializable`` walks when saving a snapshot.
+
+    Args:
+        n (int): Number of objects.
+        seed (int, optional): Random seed.
+
+    Returns:
+        list[SimpleNamespace]: Activity-like objects.
+    """
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)
+    qty = rng.integers(1, 200, n).tolist()
+    price = np.round(rng.uniform(5, 500, n), 2).tolist()
+    return [
+        SimpleNamespace(
+            id=uuid.UUID(int=i),
+            activity_type="FILL",
+            symbol=_SYMBOLS[i % 200],
+            side=_Side.BUY if i % 2 else _Side.SELL,
+            qty=qty[i],
+            price=price[i],
+            transaction_time=start + timedelta(seconds=i),
+            order=SimpleNamespace(id=uuid.UUID(int=n + i), status="filled"),
+        )
+        for i in range(n)
+    ]
+
+
+def feature_frame(rows, columns, seed=0):
+    """
+    Returns a feature DataFrame with groups of correlated columns.
+
+    Args:
+        rows (int): Number of rows.
+        columns (int): Number of columns; every fourth column is a noisy copy
+            of the one before it.
+        seed (int, optional): Random seed.
+
+    Returns:
+        pd.DataFrame: ``rows`` x ``columns`` floats.
+    """
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(rows, columns))
+    copies = values[:, 3::4].shape[1]
+    values[:, 3::4] = values[:, 2::4][:, :copies] + rng.normal(0, 0.05, (rows, copies))
+    return pd.DataFrame(values, columns=[f"f{i}" for i in range(columns)])
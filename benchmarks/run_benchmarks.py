@@ -0,0 +1,479 @@
+"""
+Benchmarks for the analytics and reporting hot paths.
+
+Times each case on seeded synthetic data (see ``benchmarks.datasets``),
+records its peak traced memory, writes the results to JSON and compares
+them with a stored baseline. The process exits with status 1 when a case's
+median time, or its peak memory, exceeds the baseline by more than the
+threshold.
+
+Example:
+    $ python -m benchmarks.run_benchmarks                      # quick tier
+    $ python -m benchmarks.run_benchmarks --tier full -o results.json
+    $ python -m benchmarks.run_benchmarks --filter metrics --update-baseline
+
+Timings are only comparable on the machine the baseline was recorded on;
+refresh ``benchmarks/baseline.json`` with ``--update-baseline`` when the
+reference machine changes.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+# The package reads broker keys at import time; benchmarks never call the
+# broker, so placeholder keys are enough when none are configured
+os.environ.setdefault("PAPER_KEY", "benchmark")
+os.environ.setdefault("PAPER_SECRET", "benchmark")
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+try:
+    from benchmarks import datasets
+except ImportError:
+    import datasets
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+TIERS = ("quick", "full")
+
+# Relative slowdown / memory growth tolerated before a case fails
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.25
+# Absolute differences below these are treated as noise
+MIN_SECONDS_DELTA = 0.025
+MIN_MEMORY_DELTA_MB = 1.0
+# Medians of cases shorter than this still differ by up to ~40% between runs
+# on a 1-CPU machine, so their noise floor is this fraction of the baseline
+SHORT_CASE_SECONDS = 0.5
+SHORT_CASE_NOISE = 0.5
+
+Case = namedtuple("Case", ["name", "scale", "tier", "dataset", "setup"])
+
+# name -> zero-argument builder; built once per run and shared by cases
+DATASETS = {
+    "daily_1y": lambda: datasets.daily_equity(1),
+    "daily_10y": lambda: datasets.daily_equity(10),
+    "minute_1y": lambda: datasets.minute_equity(datasets.TRADING_DAYS_PER_YEAR),
+    "snapshot_1k": lambda: datasets.snapshot(1_000),
+    "snapshot_100k": lambda: datasets.snapshot(100_000),
+    "snapshot_1m": lambda: datasets.snapshot(1_000_000),
+    "sdk_1k": lambda: datasets.sdk_activities(1_000),
+    "sdk_100k": lambda: datasets.sdk_activities(100_000),
+    "sdk_1m": lambda: datasets.sdk_activities(1_000_000),
+    "features_1y_100": lambda: datasets.feature_frame(252, 100),
+    "features_10y_500": lambda: datasets.feature_frame(2520, 500),
+}
+
+
+def _calculate_all(data):
+    from algorithmic_trading_utilities.common.portfolio_ops import PerformanceMetrics
+
+    portfolio, benchmark = data
+    return lambda: PerformanceMetrics(portfolio, benchmark).calculate_all()
+
+
+def _rolling_alpha_beta(data):
+    from algorithmic_trading_utilities.common.portfolio_ops import PerformanceMetrics
+
+    pm = PerformanceMetrics(*data)
+    return lambda: pm.rolling_alpha_beta(window=252)
+
+
+def _report_data(data):
+    from algorithmic_trading_utilities.brokers.alpaca.performance_ops import (
+        generate_strategy_report_data,
+    )
+
+    return lambda: generate_strategy_report_data(data)
+
+
+def _to_serializable(data):
+    from algorithmic_trading_utilities.brokers.alpaca.performance_ops import (
+        _to_serializable,
+    )
+
+    return lambda: _to_serializable(data)
+
+
+def _remove_correlated(data):
+    from algorithmic_trading_utilities.common.quantitative_tools import (
+        remove_highly_correlated_columns,
+    )
+
+    return lambda: remove_highly_correlated_columns(data, 0.9)
+
+
+def _performance_figures(data):
+    # Headless drawing; set here so importing this module changes nothing
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from algorithmic_trading_utilities.common.portfolio_ops import PerformanceMetrics
+    from algorithmic_trading_utilities.common.viz_ops import (
+        PerformanceViz,
+        build_performance_figures,
+    )
+
+    def run():
+        # A fresh PerformanceViz per run so memoized series are recomputed
+        viz = PerformanceViz(pm=PerformanceMetrics(*data))
+        figs = build_performance_figures(viz)
+        for fig in figs:
+            plt.close(fig)
+        return len(figs)
+
+    return run
+
+
+CASES = [
+    Case("metrics.calculate_all", "daily_1y", "quick", "daily_1y", _calculate_all),
+    Case("metrics.calculate_all", "daily_10y", "quick", "daily_10y", _calculate_all),
+    Case("metrics.calculate_all", "minute_1y", "full", "minute_1y", _calculate_all),
+    Case(
+        "metrics.rolling_alpha_beta",
+        "daily_1y",
+        "quick",
+        "daily_1y",
+        _rolling_alpha_beta,
+    ),
+    Case(
+        "metrics.rolling_alpha_beta",
+        "daily_10y",
+        "quick",
+        "daily_10y",
+        _rolling_alpha_beta,
+    ),
+    Case(
+        "metrics.rolling_alpha_beta",
+        "minute_1y",
+        "full",
+        "minute_1y",
+        _rolling_alpha_beta,
+    ),
+    Case("report.strategy_report_data", "1k", "quick", "snapshot_1k", _report_data),
+    Case("report.strategy_report_data", "100k", "full", "snapshot_100k", _report_data),
+    Case("report.strategy_report_data", "1m", "full", "snapshot_1m", _report_data),
+    Case("snapshot.to_serializable", "1k", "quick", "sdk_1k", _to_serializable),
+    Case("snapshot.to_serializable", "100k", "full", "sdk_100k", _to_serializable),
+    Case("snapshot.to_serializable", "1m", "full", "sdk_1m", _to_serializable),
+    Case(
+        "quant.remove_correlated",
+        "252x100",
+        "quick",
+        "features_1y_100",
+        _remove_correlated,
+    ),
+    Case(
+        "quant.remove_correlated",
+        "2520x500",
+        "full",
+        "features_10y_500",
+        _remove_correlated,
+    ),
+    Case(
+        "viz.performance_figures", "daily_1y", "quick", "daily_1y", _performance_figures
+    ),
+    Case(
+        "viz.performance_figures",
+        "daily_10y",
+        "full",
+        "daily_10y",
+        _performance_figures,
+    ),
+    Case(
+        "viz.performance_figures",
+        "minute_1y",
+        "full",
+        "minute_1y",
+        _performance_figures,
+    ),
+]
+
+
+def case_id(case):
+    """Returns the result key of a case, e.g. ``metrics.calculate_all[daily_1y]``."""
+    return f"{case.name}[{case.scale}]"
+
+
+def select_cases(tier="quick", pattern=None):
+    """
+    Returns the cases to run.
+
+    Args:
+        tier (str): ``"quick"`` runs the quick tier; ``"full"`` runs every case.
+        pattern (str, optional): Keep only cases whose id contains this text.
+
+    Returns:
+        list[Case]: Selected cases in registry order.
+    """
+    if tier not in TIERS:
+        raise ValueError(f"tier must be one of {TIERS}, got {tier!r}")
+    cases = [c for c in CASES if tier == "full" or c.tier == "quick"]
+    if pattern:
+        cases = [c for c in cases if pattern in case_id(c)]
+    return cases
+
+
+def measure(run, repeat=7, max_seconds=10.0, min_seconds=0.0):
+    """
+    Times a callable and records its peak traced memory.
+
+    The callable is timed ``repeat`` times, and then again until
+    ``min_seconds`` of wall time have passed, so short cases are sampled
+    across a longer stretch than a brief burst of machine noise; it stops
+    early once the timed total passes ``max_seconds``. It is then run once more under
+    ``tracemalloc``, whose overhead would distort the timings.
+
+    Args:
+        run (Callable[[], Any]): Zero-argument workload.
+        repeat (int): Minimum timed runs, unless ``max_seconds`` is reached.
+        max_seconds (float): Stop repeating after this much total time.
+        min_seconds (float): Keep repeating until this much wall time.
+
+    Returns:
+        dict: ``seconds_min``, ``seconds_median``, ``repeats`` and
+        ``peak_mb`` (peak memory allocated during the traced run, in MiB).
+    """
+    timings = []
+    began = time.perf_counter()
+    while len(timings) < max(repeat, 1) or time.perf_counter() - began < min_seconds:
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+        if sum(timings) >= max_seconds:
+            break
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds_min": min(timings),
+        "seconds_median": statistics.median(timings),
+        "repeats": len(timings),
+        "peak_mb": peak / 2**20,
+    }
+
+
+def run_benchmarks(cases, repeat=7, max_seconds=10.0, min_seconds=1.0, log=None):
+    """
+    Runs cases and collects their measurements.
+
+    Datasets are built once and dropped as soon as no remaining case
+    needs them, so the large tiers do not hold every input at once.
+
+    Args:
+        cases (Iterable[Case]): Cases to run, e.g. from :func:`select_cases`.
+        repeat (int): Minimum timed runs per case.
+        max_seconds (float): Per-case time budget for repeats.
+        min_seconds (float): Per-case time short cases keep repeating for.
+        log (Callable[[str], None], optional): Progress callback.
+
+    Returns:
+        dict: ``meta`` (environment) and ``results`` (case id ->
+        measurements from :func:`measure`).
+    """
+    cases = list(cases)
+    remaining = {}
+    for case in cases:
+        remaining[case.dataset] = remaining.get(case.dataset, 0) + 1
+
+    built = {}
+    results = {}
+    for case in cases:
+        if case.dataset not in built:
+            built[case.dataset] = DATASETS[case.dataset]()
+        result = measure(
+            case.setup(built[case.dataset]), repeat, max_seconds, min_seconds
+        )
+        results[case_id(case)] = result
+        if log is not None:
+            log(
+                f"{case_id(case):<45} {result['seconds_median'] * 1000:10.1f} ms"
+                f" {result['peak_mb']:9.1f} MiB"
+            )
+        remaining[case.dataset] -= 1
+        if not remaining[case.dataset]:
+            del built[case.dataset]
+
+    return {"meta": environment(), "results": results}
+
+
+def environment():
+    """Returns the interpreter, library and machine details of this run."""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+def compare_results(
+    current,
+    baseline,
+    time_threshold=DEFAULT_TIME_THRESHOLD,
+    memory_threshold=DEFAULT_MEMORY_THRESHOLD,
+):
+    """
+    Compares measurements against a baseline.
+
+    A case regresses when its median time exceeds the baseline's by more
+    than ``time_threshold`` (relative) and the noise floor, or its peak
+    memory by more than ``memory_threshold`` and ``MIN_MEMORY_DELTA_MB``. The
+    time noise floor is ``MIN_SECONDS_DELTA``, raised to ``SHORT_CASE_NOISE``
+    of the baseline for cases under ``SHORT_CASE_SECONDS``.
+
+    Args:
+        current (dict): Case id -> measurements of this run.
+        baseline (dict): Case id -> measurements of the baseline.
+        time_threshold (float): Tolerated relative slowdown, e.g. 0.25.
+        memory_threshold (float): Tolerated relative memory growth.
+
+    Returns:
+        list[dict]: One row per case in ``current`` with ``case``,
+        ``time_ratio``, ``memory_ratio`` and ``status`` (``"ok"``,
+        ``"regression"`` or ``"new"``), plus ``reasons`` for regressions.
+    """
+    rows = []
+    for key, result in current.items():
+        base = baseline.get(key)
+        if base is None:
+            rows.append(
+                {
+                    "case": key,
+                    "time_ratio": None,
+                    "memory_ratio": None,
+                    "status": "new",
+                }
+            )
+            continue
+
+        reasons = []
+        seconds, base_seconds = result["seconds_median"], base["seconds_median"]
+        time_ratio = seconds / base_seconds if base_seconds else None
+        noise = MIN_SECONDS_DELTA
+        if base_seconds < SHORT_CASE_SECONDS:
+            noise = max(noise, SHORT_CASE_NOISE * base_seconds)
+        if (
+            seconds > base_seconds * (1 + time_threshold)
+            and seconds - base_seconds > noise
+        ):
+            reasons.append(f"time {base_seconds:.4f}s -> {seconds:.4f}s")
+
+        peak, base_peak = result["peak_mb"], base["peak_mb"]
+        memory_ratio = peak / base_peak if base_peak else None
+        if (
+            peak > base_peak * (1 + memory_threshold)
+            and peak - base_peak > MIN_MEMORY_DELTA_MB
+        ):
+            reasons.append(f"memory {base_peak:.1f} MiB -> {peak:.1f} MiB")
+
+        row = {
+            "case": key,
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "status": "regression" if reasons else "ok",
+        }
+        if reasons:
+            row["reasons"] = reasons
+        rows.append(row)
+    return rows
+
+
+def load_results(path):
+    """Load a results or baseline JSON file; a missing file gives no results."""
+    path = Path(path)
+    if not path.exists():
+        return {"meta": {}, "results": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_results(path, payload):
+    """Write a results payload as indented JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--tier", choices=TIERS, default="quick")
+    parser.add_argument("--filter", help="only cases whose id contains this text")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--max-seconds", type=float, default=10.0)
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    parser.add_argument(
+        "-o", "--output", default="bench_results.json", help="results JSON path"
+    )
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD)
+    parser.add_argument(
+        "--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="merge this run into the baseline instead of comparing",
+    )
+    args = parser.parse_args(argv)
+
+    cases = select_cases(args.tier, args.filter)
+    payload = run_benchmarks(
+        cases, args.repeat, args.max_seconds, args.min_seconds, log=print
+    )
+    write_results(args.output, payload)
+    print(f"Results written to {args.output}")
+
+    baseline = load_results(args.baseline)
+    if args.update_baseline:
+        baseline["meta"] = payload["meta"]
+        baseline["results"].update(payload["results"])
+        write_results(args.baseline, baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    rows = compare_results(
+        payload["results"],
+        baseline["results"],
+        args.time_threshold,
+        args.memory_threshold,
+    )
+    regressions = [row for row in rows if row["status"] == "regression"]
+    for row in rows:
+        ratio = row["time_ratio"]
+        print(
+            f"{row['status']:<11} {row['case']:<45} "
+            + (f"x{ratio:.2f}" if ratio is not None else "")
+            + ("  " + "; ".join(row["reasons"]) if "reasons" in row else "")
+        )
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed beyond the threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import time
+import uuid
+
+import pandas as pd
+import pytest
+
+from data.asset_catalog import AssetCatalog, build_asset_frame, load_asset_catalog
+
+
+def _raw_asset(
+    symbol, exchange="NASDAQ", tradable=True, shortable=True, fractionable=True
+):
+    return {
+        "id": str(uuid.uuid4()),
+        "class": "us_equity",
+        "exchange": exchange,
+        "symbol": symbol,
+        "name": f"{symbol} Inc.",
+        "status": "active",
+        "tradable": tradable,
+        "marginable": True,
+        "shortable": shortable,
+        "easy_to_borrow": shortable,
+        "fractionable": fractionable,
+        "min_order_size": "1",
+        "min_trade_increment": "1",
+        "price_increment": "0.01",
+        "maintenance_margin_requirement": 30,
+        "attributes": [],
+    }
+
+
+RAW_ASSETS = [
+    _raw_asset("AAPL"),
+    _raw_asset("XOM", exchange="NYSE", fractionable=False),
+    _raw_asset("TINY", exchange="OTC", shortable=False, fractionable=False),
+    _raw_asset("GONE", tradable=False),
+]
+
+
+class TestBuildAssetFrame:
+
+    # builds typed columns straight from the raw payload
+    def test_typed_columns(self):
+        df = build_asset_frame(RAW_ASSETS)
+
+        assert list(df.index) == ["AAPL", "XOM", "TINY", "GONE"]
+        assert isinstance(df["exchange"].dtype, pd.CategoricalDtype)
+        assert df["asset_class"].iloc[0] == "us_equity"
+        assert df["shortable"].dtype == bool
+        assert df["price_increment"].dtype == float
+        assert df.loc["AAPL", "price_increment"] == pytest.approx(0.01)
+
+
+class TestAssetCatalog:
+
+    # supports symbol, exchange and flag lookups
+    def test_lookups(self):
+        catalog = AssetCatalog(build_asset_frame(RAW_ASSETS))
+
+        assert "AAPL" in catalog
+        assert catalog.get("XOM")["exchange"] == "NYSE"
+        assert catalog.get("MISSING") is None
+        assert list(catalog.lookup(["XOM", "MISSING", "AAPL"]).index) == ["XOM", "AAPL"]
+        assert catalog.symbols(exchange="NASDAQ") == ["AAPL", "GONE"]
+        assert catalog.symbols(exchange=["NYSE", "OTC"]) == ["XOM", "TINY"]
+        assert catalog.symbols(shortable=True, fractionable=True) == ["AAPL", "GONE"]
+        assert catalog.symbols(exchange="NYSE", fractionable=True) == []
+
+    # rejects unknown flags
+    def test_unknown_flag(self):
+        catalog = AssetCatalog(build_asset_frame(RAW_ASSETS))
+
+        with pytest.raises(ValueError):
+            catalog.symbols(optionable=True)
+
+
+class TestLoadAssetCatalog:
+
+    # fetches once, then serves from the disk cache until the TTL expires
+    def test_disk_cache_ttl(self, mocker, tmp_path):
+        client = mocker.Mock()
+        client.get.return_value = RAW_ASSETS
+        cache_path = tmp_path / "assets.pkl"
+
+        first = load_asset_catalog(client, cache_path=cache_path)
+        second = load_asset_catalog(client, cache_path=cache_path)
+
+        assert client.get.call_count == 1
+        assert "GONE" not in first
+        pd.testing.assert_frame_equal(first.df, second.df)
+
+        mocker.patch(
+            "data.asset_catalog.time.time", return_value=time.time() + 2 * 86400
+        )
+        load_asset_catalog(client, cache_path=cache_path)
+        assert client.get.call_count == 2
+
+    # refresh bypasses a fresh cache
+    def test_refresh(self, mocker, tmp_path):
+        client = mocker.Mock()
+        client.get.return_value = RAW_ASSETS
+        cache_path = tmp_path / "assets.pkl"
+
+        load_asset_catalog(client, cache_path=cache_path)
+        load_asset_catalog(client, cache_path=cache_path, refresh=True)
+
+        assert client.get.call_count == 2
@@ -0,0 +1,130 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.attribution import compute_position_attribution, fills_frame
+
+
+def _fill(symbol, side, qty, price, time):
+    return {
+        "activity_type": "FILL",
+        "symbol": symbol,
+        "side": side,
+        "qty": str(qty),
+        "price": str(price),
+        "transaction_time": time,
+    }
+
+
+ACTIVITIES = [
+    _fill("AAPL", "buy", 10, 100, "2026-01-01T15:00:00Z"),
+    _fill("AAPL", "sell", 4, 110, "2026-01-02T15:00:00Z"),
+    _fill("AAPL", "sell", 6, 90, "2026-01-04T15:00:00Z"),
+    _fill("MSFT", "buy", 5, 200, "2026-01-02T15:00:00Z"),
+    _fill("TSLA", "sell_short", 2, 300, "2026-01-03T15:00:00Z"),
+    {"activity_type": "FEE", "net_amount": "-1", "date": "2026-01-03"},
+]
+AS_OF = "2026-01-05T15:00:00Z"
+
+
+class TestFillsFrame:
+
+    # only fills, signed by side and sorted by symbol then time
+    def test_signs_and_sorts_fills(self):
+        fills = fills_frame(list(reversed(ACTIVITIES)))
+
+        assert fills["symbol"].tolist() == ["AAPL", "AAPL", "AAPL", "MSFT", "TSLA"]
+        assert fills["signed_qty"].tolist() == [10.0, -4.0, -6.0, 5.0, -2.0]
+        assert str(fills["time"].dt.tz) == "UTC"
+
+    # no fills gives an empty frame with the fill columns
+    def test_no_fills(self):
+        assert fills_frame([{"activity_type": "FEE"}]).empty
+
+
+class TestComputePositionAttribution:
+
+    # closed, open long and open short positions with marks and fallbacks
+    def test_pnl_holding_and_contribution(self):
+        table = compute_position_attribution(
+            ACTIVITIES, marks={"MSFT": 210.0}, starting_equity=10_000, as_of=AS_OF
+        )
+
+        aapl, msft, tsla = table.loc["AAPL"], table.loc["MSFT"], table.loc["TSLA"]
+        # 4 x 110 + 6 x 90 - 10 x 100
+        assert aapl["pnl"] == pytest.approx(-20.0)
+        assert aapl["open_qty"] == 0
+        assert aapl["holding_days"] == pytest.approx(3.0)
+        assert aapl["avg_sell_price"] == pytest.approx(98.0)
+        # Open long marked at 210, held to as_of
+        assert msft["pnl"] == pytest.approx(50.0)
+        assert msft["market_value"] == pytest.approx(1050.0)
+        assert msft["holding_days"] == pytest.approx(3.0)
+        # Open short without a mark falls back to its last fill price
+        assert tsla["mark_price"] == 300.0
+        assert tsla["pnl"] == 0.0
+        assert np.isnan(tsla["avg_buy_price"])
+
+        assert table.index.tolist() == ["MSFT", "TSLA", "AAPL"]
+        assert table.attrs["total_pnl"] == pytest.approx(30.0)
+        assert table["contribution"].sum() == pytest.approx(30.0 / 10_000)
+        assert table["pnl_share"].sum() == pytest.approx(1.0)
+
+    # bars supply marks for symbols without an explicit one
+    def test_marks_from_bars(self):
+        bars = pd.DataFrame(
+            {"MSFT": [205.0, np.nan], "TSLA": [290.0, 280.0]},
+            index=pd.bdate_range("2026-01-01", periods=2),
+        )
+
+        table = compute_position_attribution(ACTIVITIES, bars=bars, as_of=AS_OF)
+
+        assert table.loc["MSFT", "mark_price"] == 205.0
+        assert table.loc["TSLA", "pnl"] == pytest.approx(2 * (300 - 280))
+        assert table["contribution"].isna().all()
+
+    # a reopened position only counts the time it was open
+    def test_holding_excludes_flat_periods(self):
+        activities = [
+            _fill("AAA", "buy", 1, 10, "2026-01-01T00:00:00Z"),
+            _fill("AAA", "sell", 1, 11, "2026-01-02T00:00:00Z"),
+            _fill("AAA", "buy", 1, 12, "2026-01-10T00:00:00Z"),
+            _fill("AAA", "sell", 1, 12, "2026-01-12T00:00:00Z"),
+        ]
+
+        table = compute_position_attribution(activities, as_of=AS_OF)
+
+        assert table.loc["AAA", "holding_days"] == pytest.approx(3.0)
+        assert table.loc["AAA", "fills"] == 4
+
+    # one grouped pass matches a per-symbol loop on random fills
+    def test_matches_per_symbol_loop(self):
+        rng = np.random.default_rng(0)
+        times = pd.date_range("2026-01-01", periods=500, freq="h", tz="UTC")
+        activities = [
+            _fill(
+                f"S{rng.integers(20)}",
+                rng.choice(["buy", "sell"]),
+                int(rng.integers(1, 50)),
+                round(float(rng.uniform(10, 100)), 2),
+                t.isoformat(),
+            )
+            for t in times
+        ]
+
+        table = compute_position_attribution(activities, as_of=times[-1])
+
+        for symbol, group in fills_frame(activities).groupby("symbol"):
+            cash = -(group["signed_qty"] * group["price"]).sum()
+            expected = cash + group["signed_qty"].sum() * group["price"].iloc[-1]
+            assert table.loc[symbol, "pnl"] == pytest.approx(expected)
+
+    # no fills gives an empty table
+    def test_empty(self):
+        table = compute_position_attribution([])
+
+        assert table.empty
+        assert table.attrs["total_pnl"] == 0.0
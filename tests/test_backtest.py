@@ -0,0 +1,163 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.backtest import compute_atr_panel, run_backtest
+from common.portfolio_ops import PerformanceMetrics
+
+
+def _single_symbol_panel():
+    """100/101 chop for 20 days (ATR 1.0), a rally to 120, then a slide."""
+    chop = [100.0, 101.0] * 10
+    rally = list(np.linspace(102, 120, 10))
+    slide = [118.0, 116.0, 113.0, 110.0, 108.0]
+    dates = pd.bdate_range("2024-01-01", periods=len(chop) + len(rally) + len(slide))
+    close = pd.DataFrame({"AAA": chop + rally + slide}, index=dates)
+    entries = pd.DataFrame(False, index=dates, columns=["AAA"])
+    entries.iloc[19] = True
+    return close, entries
+
+
+def _random_panel(n_days=300, n_symbols=40, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2020-01-01", periods=n_days)
+    symbols = [f"S{i}" for i in range(n_symbols)]
+    returns = rng.normal(0.0005, 0.02, (n_days, n_symbols))
+    close = pd.DataFrame(50 * np.exp(returns.cumsum(axis=0)), dates, symbols)
+    high = close * (1 + np.abs(rng.normal(0, 0.01, close.shape)))
+    low = close * (1 - np.abs(rng.normal(0, 0.01, close.shape)))
+    entries = close > close.rolling(20).mean()
+    return close, high, low, entries
+
+
+class TestComputeAtrPanel:
+
+    # matches the get_atr true range with high/low panels
+    def test_matches_true_range(self):
+        close, high, low, _ = _random_panel(n_days=40, n_symbols=3)
+        atr = compute_atr_panel(close, high, low, period=14)
+
+        prev_close = close["S1"].shift(1)
+        tr = pd.concat(
+            [
+                high["S1"] - low["S1"],
+                (high["S1"] - prev_close).abs(),
+                (low["S1"] - prev_close).abs(),
+            ],
+            axis=1,
+        ).max(axis=1)
+        assert atr["S1"].iloc[-1] == pytest.approx(tr.iloc[-14:].mean())
+        assert atr["S1"].iloc[:14].isna().all()
+        assert not np.isnan(atr["S1"].iloc[14])
+
+
+class TestRunBacktest:
+
+    # sized entry, trailing stop exit and consistent accounting
+    def test_entry_and_trailing_stop(self):
+        close, entries = _single_symbol_panel()
+
+        result = run_backtest(
+            close, entries, initial_equity=100_000.0, max_position_pct=1.0
+        )
+
+        trades = result["trades"]
+        assert trades["reason"].tolist() == ["entry", "trailing_stop"]
+        # 1% of 100k risked over 2 x ATR(1.0) -> 500 shares at 101
+        assert trades["quantity"].tolist() == [500, 500]
+        assert trades["price"].iloc[0] == 101.0
+        # Stop is clamped to 5% below the 120 high-water mark -> 114; the close
+        # at 113 is the first to breach it and fills at the close
+        assert trades["date"].iloc[1] == close.index[32]
+        assert trades["price"].iloc[1] == 113.0
+        assert result["equity"].iloc[-1] == pytest.approx(100_000 + 500 * 12)
+        assert (result["positions"]["AAA"].iloc[19:32] == 500).all()
+        assert result["positions"]["AAA"].iloc[32:].sum() == 0
+
+    # stops with a low panel fill at the stop level
+    def test_intraday_stop_fills_at_stop_level(self):
+        close, entries = _single_symbol_panel()
+        low = close.copy()
+        low.iloc[31] = 113.5
+
+        result = run_backtest(close, entries, low=low, max_position_pct=1.0)
+
+        stop = result["trades"].iloc[1]
+        assert stop["date"] == close.index[31]
+        assert stop["price"] == pytest.approx(120 * 0.95)
+
+    # equity always equals cash plus marked positions, within the gross cap
+    def test_accounting_and_gross_cap(self):
+        close, high, low, entries = _random_panel()
+
+        result = run_backtest(close, entries, high, low, max_gross_pct=0.5, cost_bps=5)
+
+        marked = (result["positions"] * close).sum(axis=1)
+        pd.testing.assert_series_equal(
+            result["equity"],
+            (result["cash"] + marked).rename("equity"),
+        )
+        assert (result["cash"] >= 0).all()
+        entry_days = result["trades"].query("side == 'buy'")["date"].unique()
+        ratio = result["gross_exposure"] / result["equity"]
+        assert (ratio.loc[entry_days] <= 0.5 + 1e-9).all()
+
+    # sector limit caps exposure per sector on entry days
+    def test_sector_cap(self):
+        close, high, low, entries = _random_panel()
+        sectors = {s: ("Tech" if i < 20 else "Energy") for i, s in enumerate(close)}
+
+        result = run_backtest(
+            close,
+            entries,
+            high,
+            low,
+            max_position_pct=0.05,
+            sectors=sectors,
+            max_sector_pct=0.2,
+        )
+
+        tech = [s for s in close if sectors[s] == "Tech"]
+        tech_value = (result["positions"][tech] * close[tech]).sum(axis=1)
+        trades = result["trades"]
+        entry_days = trades[trades["symbol"].isin(tech)]["date"].unique()
+        assert len(entry_days)
+        assert (
+            tech_value.loc[entry_days] / result["equity"].loc[entry_days]
+        ).max() <= 0.2 + 1e-9
+
+    # an entry too large for the gross cap does not block a smaller one that day
+    def test_rejected_entry_does_not_block_smaller_one(self):
+        dates = pd.bdate_range("2024-01-01", periods=25)
+        close = pd.DataFrame(
+            {
+                "BIG": [100.0, 101.0] * 12 + [101.0],
+                "SMALL": [100.0, 110.0] * 12 + [110.0],
+            },
+            index=dates,
+        )
+        entries = pd.DataFrame(False, index=dates, columns=close.columns)
+        entries.iloc[19] = True
+        scores = pd.DataFrame({"BIG": 2.0, "SMALL": 1.0}, index=dates)
+
+        result = run_backtest(
+            close, entries, scores=scores, max_position_pct=0.6, max_gross_pct=0.3
+        )
+
+        trades = result["trades"]
+        assert trades["symbol"].tolist() == ["SMALL"]
+        assert result["gross_exposure"].iloc[19] <= 0.3 * result["equity"].iloc[19]
+
+    # the equity curve feeds PerformanceMetrics
+    def test_equity_feeds_performance_metrics(self):
+        close, high, low, entries = _random_panel()
+        result = run_backtest(close, entries, high, low)
+
+        pm = PerformanceMetrics(result["equity"], close.mean(axis=1))
+        metrics = pm.calculate_all()
+
+        assert isinstance(result["equity"].index, pd.DatetimeIndex)
+        assert np.isfinite(metrics["max_drawdown"])
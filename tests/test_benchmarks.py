@@ -0,0 +1,144 @@
+import json
+
+import pytest
+
+from benchmarks import datasets
+from benchmarks.run_benchmarks import (
+    case_id,
+    compare_results,
+    main,
+    measure,
+    select_cases,
+)
+
+
+def _result(seconds, peak_mb):
+    return {
+        "seconds_min": seconds,
+        "seconds_median": seconds,
+        "repeats": 1,
+        "peak_mb": peak_mb,
+    }
+
+
+class TestCompareResults:
+
+    # slower or larger than the threshold regresses, within it is ok
+    def test_statuses(self):
+        baseline = {
+            "fast": _result(1.0, 100.0),
+            "slow": _result(1.0, 100.0),
+            "big": _result(1.0, 100.0),
+        }
+        current = {
+            "fast": _result(1.2, 110.0),
+            "slow": _result(1.3, 100.0),
+            "big": _result(1.0, 130.0),
+            "added": _result(1.0, 1.0),
+        }
+
+        rows = {row["case"]: row for row in compare_results(current, baseline, 0.25)}
+
+        assert rows["fast"]["status"] == "ok"
+        assert rows["fast"]["time_ratio"] == pytest.approx(1.2)
+        assert rows["slow"]["status"] == "regression"
+        assert rows["slow"]["reasons"][0].startswith("time")
+        assert rows["big"]["status"] == "regression"
+        assert rows["big"]["reasons"][0].startswith("memory")
+        assert rows["added"]["status"] == "new"
+
+    # tiny absolute differences are noise, whatever the ratio
+    def test_ignores_noise(self):
+        rows = compare_results(
+            {"case": _result(0.002, 0.5)}, {"case": _result(0.001, 0.1)}
+        )
+
+        assert rows[0]["status"] == "ok"
+
+    # run-to-run jitter on a ~50 ms case stays under the noise floor, a
+    # doubling does not
+    def test_short_case_noise_floor(self):
+        baseline = {"case": _result(0.0502, 1.0)}
+
+        jitter = compare_results({"case": _result(0.0636, 1.0)}, baseline)
+        doubled = compare_results({"case": _result(0.1004, 1.0)}, baseline)
+
+        assert jitter[0]["status"] == "ok"
+        assert doubled[0]["status"] == "regression"
+
+    # the median, not the best run, is compared
+    def test_compares_median(self):
+        current = dict(_result(1.0, 1.0), seconds_median=2.0)
+
+        rows = compare_results({"case": current}, {"case": _result(1.0, 1.0)})
+
+        assert rows[0]["status"] == "regression"
+
+
+class TestRunner:
+
+    # the quick tier is a subset of the full tier and ids are unique
+    def test_select_cases(self):
+        quick = select_cases("quick")
+        full = select_cases("full")
+
+        assert set(quick) < set(full)
+        assert len({case_id(c) for c in full}) == len(full)
+        assert all("metrics" in case_id(c) for c in select_cases("full", "metrics"))
+        with pytest.raises(ValueError):
+            select_cases("nightly")
+
+    # timings and traced peak memory are recorded
+    def test_measure(self):
+        result = measure(lambda: bytearray(4 * 2**20), repeat=2)
+
+        assert result["repeats"] == 2
+        assert result["seconds_min"] <= result["seconds_median"]
+        assert result["peak_mb"] >= 4
+
+    # a filtered run writes JSON, fails against a much faster baseline and
+    # leaves the matplotlib backend alone
+    def test_main_detects_regression(self, tmp_path, monkeypatch):
+        import matplotlib
+
+        backend = matplotlib.get_backend()
+        monkeypatch.setattr("benchmarks.run_benchmarks.MIN_SECONDS_DELTA", 0.0)
+        output = tmp_path / "results.json"
+        baseline = tmp_path / "baseline.json"
+        args = ["--filter", "rolling_alpha_beta[daily_1y]", "--repeat", "1"]
+
+        assert (
+            main(
+                args
+                + ["-o", str(output), "--baseline", str(baseline), "--update-baseline"]
+            )
+            == 0
+        )
+        stored = json.loads(baseline.read_text())
+        assert list(stored["results"]) == ["metrics.rolling_alpha_beta[daily_1y]"]
+        assert stored["meta"]["pandas"]
+
+        # A wide threshold keeps the rerun from tripping on machine noise
+        rerun = ["-o", str(output), "--baseline", str(baseline)]
+        assert main(args + rerun + ["--time-threshold", "100"]) == 0
+
+        for result in stored["results"].values():
+            result["seconds_median"] = 1e-6
+        baseline.write_text(json.dumps(stored))
+        assert main(args + rerun) == 1
+        assert matplotlib.get_backend() == backend
+
+
+class TestDatasets:
+
+    # generators are deterministic and sized as requested
+    def test_generators(self):
+        portfolio, benchmark = datasets.daily_equity(1)
+        minute, _ = datasets.minute_equity(2)
+        records = datasets.activities(50)
+
+        assert len(portfolio) == len(benchmark) == datasets.TRADING_DAYS_PER_YEAR
+        assert len(minute) == 2 * datasets.MINUTES_PER_SESSION
+        assert records == datasets.activities(50)
+        assert len(datasets.snapshot(20)["activities"]) == 20
+        assert datasets.feature_frame(10, 8).shape == (10, 8)
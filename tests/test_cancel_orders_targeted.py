@@ -3,97 +3,166 @@ Tests for targeted order cancellation.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from alpaca.trading.enums import OrderType
 
 from algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted import (
+    ORDERS_PAGE_LIMIT,
     cancel_orders_for_symbols,
+    get_open_orders_for_symbols,
 )
 
 
+def _paging_client(orders):
+    """Client whose get_orders pages newest first with an exclusive ``until``."""
+    client = MagicMock()
+
+    def get_orders(filter):
+        rows = [
+            o
+            for o in orders
+            if o.symbol in filter.symbols
+            and (filter.until is None or o.submitted_at < filter.until)
+        ]
+        rows.sort(key=lambda o: o.submitted_at, reverse=True)
+        return rows[: filter.limit]
+
+    client.get_orders.side_effect = get_orders
+    return client
+
+
 class TestTargetedCancellation(unittest.TestCase):
     """Test targeted order cancellation."""
 
-    @patch(
-        "algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted.get_orders"
-    )
-    def test_only_specified_symbols_cancelled(self, mock_get_orders):
-        """Should only cancel orders for the given symbols, not all orders."""
+    def test_only_specified_symbols_cancelled(self):
+        """Should only query and cancel orders for the given symbols."""
         mock_order_aapl = MagicMock(symbol="AAPL", id="order-1", type="trailing_stop")
-        mock_order_nvda = MagicMock(symbol="NVDA", id="order-2", type="trailing_stop")
-        mock_order_xom = MagicMock(symbol="XOM", id="order-3", type="trailing_stop")
-        mock_get_orders.return_value = [
-            mock_order_aapl,
-            mock_order_nvda,
-            mock_order_xom,
-        ]
-
         mock_client = MagicMock()
+        mock_client.get_orders.return_value = [mock_order_aapl]
 
-        count = cancel_orders_for_symbols(["AAPL"], mock_client)
+        result = cancel_orders_for_symbols(["AAPL"], mock_client)
 
-        self.assertEqual(count, 1)
+        self.assertEqual(result["cancelled"], 1)
         mock_client.cancel_order_by_id.assert_called_once_with("order-1")
+        request = mock_client.get_orders.call_args.kwargs["filter"]
+        self.assertEqual(request.symbols, ["AAPL"])
 
-    @patch(
-        "algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted.get_orders"
-    )
-    def test_empty_symbols_cancels_nothing(self, mock_get_orders):
+    def test_empty_symbols_cancels_nothing(self):
         """Empty symbol list should cancel zero orders."""
         mock_client = MagicMock()
-        count = cancel_orders_for_symbols([], mock_client)
+        result = cancel_orders_for_symbols([], mock_client)
 
-        self.assertEqual(count, 0)
-        mock_get_orders.assert_not_called()
+        self.assertEqual(result["cancelled"], 0)
+        self.assertEqual(result["results"], [])
+        mock_client.get_orders.assert_not_called()
 
-    @patch(
-        "algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted.get_orders"
-    )
-    def test_multiple_symbols_cancelled(self, mock_get_orders):
+    def test_multiple_symbols_cancelled(self):
         """Should cancel orders for multiple specified symbols."""
         mock_order_aapl = MagicMock(symbol="AAPL", id="order-1", type="market")
-        mock_order_nvda = MagicMock(symbol="NVDA", id="order-2", type="trailing_stop")
         mock_order_xom = MagicMock(symbol="XOM", id="order-3", type="trailing_stop")
-        mock_get_orders.return_value = [
-            mock_order_aapl,
-            mock_order_nvda,
-            mock_order_xom,
-        ]
-
         mock_client = MagicMock()
+        mock_client.get_orders.return_value = [mock_order_aapl, mock_order_xom]
 
-        count = cancel_orders_for_symbols(["AAPL", "XOM"], mock_client)
+        result = cancel_orders_for_symbols(["AAPL", "XOM"], mock_client)
 
-        self.assertEqual(count, 2)
+        self.assertEqual(result["cancelled"], 2)
+        self.assertEqual(
+            sorted(r["order_id"] for r in result["results"]), ["order-1", "order-3"]
+        )
 
-    @patch(
-        "algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted.get_orders"
-    )
-    def test_no_matching_orders(self, mock_get_orders):
+    def test_no_matching_orders(self):
         """If no orders match the symbols, cancel count should be 0."""
         mock_order = MagicMock(symbol="TSLA", id="order-1", type="market")
-        mock_get_orders.return_value = [mock_order]
-
         mock_client = MagicMock()
+        mock_client.get_orders.return_value = [mock_order]
 
-        count = cancel_orders_for_symbols(["AAPL"], mock_client)
+        result = cancel_orders_for_symbols(["AAPL"], mock_client)
 
-        self.assertEqual(count, 0)
+        self.assertEqual(result["cancelled"], 0)
         mock_client.cancel_order_by_id.assert_not_called()
 
-    @patch(
-        "algorithmic_trading_utilities.brokers.alpaca.cancel_orders_targeted.get_orders"
-    )
-    def test_handles_cancel_failure_gracefully(self, mock_get_orders):
+    def test_handles_cancel_failure_gracefully(self):
         """Should handle individual cancel failures without crashing."""
         mock_order = MagicMock(symbol="AAPL", id="order-1", type="market")
-        mock_get_orders.return_value = [mock_order]
-
         mock_client = MagicMock()
+        mock_client.get_orders.return_value = [mock_order]
         mock_client.cancel_order_by_id.side_effect = Exception("API Error")
 
-        count = cancel_orders_for_symbols(["AAPL"], mock_client)
+        result = cancel_orders_for_symbols(["AAPL"], mock_client)
+
+        self.assertEqual(result["cancelled"], 0)
+        self.assertEqual(result["failed"], 1)
+        self.assertEqual(result["results"][0]["error"], "API Error")
+
+    def test_long_symbol_lists_are_chunked(self):
+        """Symbol lists longer than chunk_size are split across requests."""
+        symbols = [f"S{i}" for i in range(250)]
+        mock_client = MagicMock()
+        mock_client.get_orders.side_effect = lambda filter: [
+            MagicMock(symbol=s, id=f"id-{s}", type="limit") for s in filter.symbols
+        ]
+
+        orders, requests = get_open_orders_for_symbols(
+            symbols + ["S0"], mock_client, chunk_size=100
+        )
+
+        self.assertEqual(requests, 3)
+        self.assertEqual(
+            [
+                len(c.kwargs["filter"].symbols)
+                for c in mock_client.get_orders.call_args_list
+            ],
+            [100, 100, 50],
+        )
+        self.assertEqual(len(orders), 250)
+
+    def test_pages_past_the_limit(self):
+        """Every open order is fetched when a symbol has several pages."""
+        start = datetime(2026, 1, 2, 15, tzinfo=timezone.utc)
+        orders = [
+            SimpleNamespace(
+                symbol="AAPL",
+                id=f"order-{i}",
+                type="limit",
+                # Pairs of orders share a timestamp, including across pages
+                submitted_at=start + timedelta(seconds=i // 2),
+            )
+            for i in range(2 * ORDERS_PAGE_LIMIT + 101)
+        ]
+        client = _paging_client(orders)
+
+        fetched, requests = get_open_orders_for_symbols(["AAPL"], client)
+
+        self.assertEqual(sorted(o.id for o in fetched), sorted(o.id for o in orders))
+        self.assertEqual(requests, 3)
+
+    def test_order_type_enum_recorded_by_value(self):
+        """Enum order types are reported as their API value."""
+        mock_client = MagicMock()
+        mock_client.get_orders.return_value = [
+            MagicMock(symbol="AAPL", id="order-1", type=OrderType.TRAILING_STOP)
+        ]
+
+        result = cancel_orders_for_symbols(["AAPL"], mock_client)
+
+        self.assertEqual(result["results"][0]["type"], "trailing_stop")
+
+    def test_reports_timing(self):
+        """The report includes fetch, cancel and total timings."""
+        mock_client = MagicMock()
+        mock_client.get_orders.return_value = [
+            MagicMock(symbol="AAPL", id=f"order-{i}", type="limit") for i in range(5)
+        ]
+
+        result = cancel_orders_for_symbols(["AAPL"], mock_client, max_workers=2)
 
-        self.assertEqual(count, 0)
+        self.assertEqual(result["requests"], 1)
+        for key in ("fetch_seconds", "cancel_seconds", "elapsed_seconds"):
+            self.assertGreaterEqual(result[key], 0)
+        self.assertTrue(all("latency_seconds" in r for r in result["results"]))
 
 
 if __name__ == "__main__":
@@ -7,9 +7,12 @@ from data.get_data import (
     get_historical_data,
     get_asset_df,
     get_last_price,
+    get_last_prices,
+    clear_last_price_cache,
 )
 from alpaca.data.historical.stock import StockHistoricalDataClient
 import pandas as pd
+from datetime import datetime
 
 
 class TestGetAssets:
@@ -225,3 +228,71 @@ class TestGetLastPrice:
 
         # Assert
         assert result is None
+
+
+def _snapshot(trade=None, bid=None, ask=None, close=None):
+    from unittest.mock import Mock
+
+    ts = datetime(2026, 4, 6, 14, 0)
+    return Mock(
+        latest_trade=Mock(price=trade, timestamp=ts) if trade else None,
+        latest_quote=Mock(bid_price=bid, ask_price=ask, timestamp=ts) if bid else None,
+        daily_bar=Mock(close=close, timestamp=ts) if close else None,
+        previous_daily_bar=None,
+    )
+
+
+class TestGetLastPrices:
+
+    def setup_method(self):
+        clear_last_price_cache()
+
+    # Prices many symbols from chunked snapshot requests
+    def test_batches_and_falls_back(self, mocker):
+        # Arrange
+        mock_client = mocker.Mock()
+        snapshots = {
+            "AAPL": _snapshot(trade=190.0),
+            "MSFT": _snapshot(bid=400.0, ask=401.0),
+            "XOM": _snapshot(close=110.0),
+            "NONE": _snapshot(),
+        }
+        mock_client.get_stock_snapshot.side_effect = lambda req: {
+            s: snapshots[s] for s in req.symbol_or_symbols
+        }
+
+        # Act
+        result = get_last_prices(
+            ["AAPL", "MSFT", "XOM", "NONE"], mock_client, chunk_size=3
+        )
+
+        # Assert
+        assert mock_client.get_stock_snapshot.call_count == 2
+        assert result["AAPL"]["price"] == 190.0
+        assert result["AAPL"]["source"] == "trade"
+        assert result["MSFT"]["price"] == 400.5
+        assert result["MSFT"]["source"] == "quote"
+        assert result["XOM"]["source"] == "daily_bar"
+        assert "NONE" not in result
+        assert list(result) == ["AAPL", "MSFT", "XOM"]
+
+    # Serves repeated calls from the TTL cache
+    def test_ttl_cache(self, mocker):
+        # Arrange
+        mock_client = mocker.Mock()
+        mock_client.get_stock_snapshot.side_effect = lambda req: {
+            s: _snapshot(trade=10.0) for s in req.symbol_or_symbols
+        }
+
+        # Act
+        get_last_prices(["AAPL", "MSFT"], mock_client, ttl_seconds=60)
+        result = get_last_prices(["AAPL", "MSFT", "XOM"], mock_client, ttl_seconds=60)
+        get_last_prices(["AAPL"], mock_client, ttl_seconds=0)
+
+        # Assert
+        requested = [
+            c.args[0].symbol_or_symbols
+            for c in mock_client.get_stock_snapshot.call_args_list
+        ]
+        assert requested == [["AAPL", "MSFT"], ["XOM"], ["AAPL"]]
+        assert set(result) == {"AAPL", "MSFT", "XOM"}
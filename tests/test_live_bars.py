@@ -0,0 +1,135 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import asyncio
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from alpaca.data.models import Bar, Trade
+
+from data.live_bars import BarRingBuffer, LiveBarAggregator
+
+T0 = datetime(2026, 4, 6, 13, 30, tzinfo=timezone.utc).timestamp()
+
+
+class TestBarRingBuffer:
+
+    # aggregates trades into OHLCV buckets
+    def test_aggregates_trades(self):
+        buffer = BarRingBuffer("1Min", capacity=10)
+        for offset, price, size in [(0, 10, 1), (20, 12, 2), (40, 9, 1), (61, 11, 5)]:
+            buffer.update(T0 + offset, price, price, price, price, size)
+
+        df = buffer.to_frame()
+
+        assert df["open"].tolist() == [10, 11]
+        assert df["high"].tolist() == [12, 11]
+        assert df["low"].tolist() == [9, 11]
+        assert df["close"].tolist() == [9, 11]
+        assert df["volume"].tolist() == [4, 5]
+        assert len(buffer.to_frame(include_partial=False)) == 1
+
+    # keeps only the newest bars once full, without growing
+    def test_fixed_memory_ring(self):
+        buffer = BarRingBuffer(60, capacity=5)
+        arrays = [buffer.start, buffer.close]
+        nbytes = sum(a.nbytes for a in arrays)
+
+        for minute in range(50):
+            buffer.update(T0 + 60 * minute, minute, minute, minute, minute, 1)
+
+        df = buffer.to_frame()
+        assert len(buffer) == 5
+        assert df["close"].tolist() == [45, 46, 47, 48, 49]
+        assert buffer.start is arrays[0] and buffer.close is arrays[1]
+        assert sum(a.nbytes for a in arrays) == nbytes
+
+    # drops updates older than the forming bar
+    def test_late_updates_dropped(self):
+        buffer = BarRingBuffer("1Min", capacity=5)
+        buffer.update(T0 + 120, 10, 10, 10, 10, 1)
+
+        assert buffer.update(T0, 5, 5, 5, 5, 1) is False
+        assert buffer.late_updates == 1
+        assert buffer.last_close == 10
+
+    # ATR matches the daily get_atr true-range definition
+    def test_atr_matches_reference(self):
+        rng = np.random.default_rng(0)
+        closes = 100 + rng.normal(size=30).cumsum()
+        buffer = BarRingBuffer("5Min", capacity=50)
+        for i, close in enumerate(closes):
+            buffer.update(T0 + 300 * i, close, close + 0.5, close - 0.7, close, 100)
+
+        df = buffer.to_frame(include_partial=False)
+        prev_close = df["close"].shift(1)
+        tr = pd.concat(
+            [
+                df["high"] - df["low"],
+                (df["high"] - prev_close).abs(),
+                (df["low"] - prev_close).abs(),
+            ],
+            axis=1,
+        ).max(axis=1)
+
+        assert buffer.atr(14) == pytest.approx(round(tr.iloc[-14:].mean(), 4))
+        assert BarRingBuffer("5Min").atr(14) is None
+
+
+class TestLiveBarAggregator:
+
+    # stream handlers feed every timeframe and the last price
+    def test_stream_handlers(self):
+        live = LiveBarAggregator(["AAPL"], timeframes=("1Min", "5Min"))
+        for i in range(10):
+            ts = datetime.fromtimestamp(T0 + 60 * i, timezone.utc)
+            asyncio.run(
+                live._handle_trade(
+                    Trade(
+                        "AAPL",
+                        {
+                            "t": ts,
+                            "x": "V",
+                            "p": 100 + i,
+                            "s": 10,
+                            "i": i,
+                            "c": [],
+                            "z": "C",
+                        },
+                    )
+                )
+            )
+        asyncio.run(
+            live._handle_bar(
+                Bar(
+                    "AAPL",
+                    {
+                        "t": datetime.fromtimestamp(T0 + 600, timezone.utc),
+                        "o": 110,
+                        "h": 112,
+                        "l": 108,
+                        "c": 111,
+                        "v": 500,
+                        "n": 5,
+                        "vw": 110.5,
+                    },
+                )
+            )
+        )
+
+        assert live.last_price("AAPL") == 111
+        assert len(live.bars("AAPL", "1Min")) == 11
+        five = live.bars("AAPL", "5Min")
+        assert five["open"].tolist() == [100, 105, 110]
+        assert five["volume"].tolist() == [50, 50, 500]
+        assert live.last_prices()["AAPL"]["price"] == 111
+        assert live.atr("AAPL", "1Min", period=5) == pytest.approx(1.0)
+
+    # unknown symbols are ignored
+    def test_ignores_unsubscribed_symbols(self):
+        live = LiveBarAggregator(["AAPL"])
+        live.update_trade("MSFT", T0, 400, 1)
+
+        assert live.last_price("MSFT") is None
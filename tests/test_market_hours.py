@@ -2,9 +2,14 @@
 
 import unittest
 from unittest.mock import patch
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
 from algorithmic_trading_utilities.common.market_hours import is_market_hours
+from algorithmic_trading_utilities.common.market_calendar import (
+    MarketCalendar,
+    nyse_early_closes,
+    nyse_holidays,
+)
 
 
 class TestIsMarketHours(unittest.TestCase):
@@ -61,5 +66,93 @@ class TestIsMarketHours(unittest.TestCase):
             self.assertTrue(is_market_hours())
 
 
+class TestMarketCalendar(unittest.TestCase):
+    """Test the NYSE session index."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = MarketCalendar(2025, 2027)
+
+    def test_holidays(self):
+        """Observed holidays follow the NYSE rules."""
+        holidays = nyse_holidays(2026)
+        self.assertIn(date(2026, 4, 3), holidays)  # Good Friday
+        self.assertIn(date(2026, 7, 3), holidays)  # July 4 on a Saturday
+        self.assertIn(date(2026, 6, 19), holidays)  # Juneteenth
+        # New Year's Day 2028 is a Saturday and is not observed on Dec 31
+        self.assertNotIn(date(2027, 12, 31), nyse_holidays(2027))
+        self.assertIn(date(2027, 12, 24), nyse_holidays(2027))
+
+    def test_early_closes(self):
+        """July 3 and Christmas Eve close early only Monday-Thursday."""
+        self.assertEqual(
+            nyse_early_closes(2025),
+            {date(2025, 7, 3), date(2025, 11, 28), date(2025, 12, 24)},
+        )
+        self.assertEqual(
+            nyse_early_closes(2026), {date(2026, 11, 27), date(2026, 12, 24)}
+        )
+
+    def test_daylight_saving_time(self):
+        """The open moves from 14:30 to 13:30 UTC when DST starts."""
+        sessions = self.calendar.sessions()
+        self.assertEqual(sessions.loc[date(2026, 3, 6), "open"].hour, 14)
+        self.assertEqual(sessions.loc[date(2026, 3, 9), "open"].hour, 13)
+
+    def test_is_open(self):
+        """Regular and extended sessions, weekends and holidays."""
+        cal = self.calendar
+        self.assertTrue(cal.is_open(datetime(2026, 4, 6, 14, 0, tzinfo=timezone.utc)))
+        self.assertFalse(cal.is_open(datetime(2026, 4, 6, 20, 0, tzinfo=timezone.utc)))
+        self.assertTrue(
+            cal.is_open(datetime(2026, 4, 6, 20, 0, tzinfo=timezone.utc), extended=True)
+        )
+        self.assertFalse(cal.is_open(datetime(2026, 4, 5, 14, 0, tzinfo=timezone.utc)))
+        self.assertFalse(cal.is_open(datetime(2026, 4, 3, 14, 0, tzinfo=timezone.utc)))
+        # Early close at 13:00 ET (18:00 UTC in winter)
+        self.assertFalse(
+            cal.is_open(datetime(2026, 12, 24, 18, 30, tzinfo=timezone.utc))
+        )
+
+    def test_next_open_and_seconds_until_close(self):
+        """Binary-search queries return exact session boundaries."""
+        cal = self.calendar
+        good_friday = datetime(2026, 4, 3, 14, 0, tzinfo=timezone.utc)
+        self.assertEqual(
+            cal.next_open(good_friday),
+            datetime(2026, 4, 6, 13, 30, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            cal.seconds_until_close(datetime(2026, 4, 6, 19, 0, tzinfo=timezone.utc)),
+            3600,
+        )
+        self.assertIsNone(cal.seconds_until_close(good_friday))
+
+    def test_out_of_range(self):
+        """Queries beyond the indexed years raise."""
+        with self.assertRaises(ValueError):
+            self.calendar.is_open(datetime(2030, 1, 2, 15, 0, tzinfo=timezone.utc))
+
+    def test_sleep_until_open(self):
+        """Schedulers sleep exactly until the next session."""
+        slept = []
+        with patch("algorithmic_trading_utilities.common.market_calendar.time") as t:
+            t.time.return_value = datetime(
+                2026, 4, 6, 13, 0, tzinfo=timezone.utc
+            ).timestamp()
+            self.calendar.sleep_until_open(sleep=slept.append)
+        self.assertEqual(slept, [1800])
+
+    def test_is_market_hours_with_calendar(self):
+        """is_market_hours honours holidays when given a calendar."""
+        good_friday = datetime(2026, 4, 3, 14, 0, tzinfo=timezone.utc)
+        with patch(
+            "algorithmic_trading_utilities.common.market_hours.datetime"
+        ) as mock_dt:
+            mock_dt.now.return_value = good_friday
+            self.assertTrue(is_market_hours())
+            self.assertFalse(is_market_hours(calendar=self.calendar))
+
+
 if __name__ == "__main__":
     unittest.main()
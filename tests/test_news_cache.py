@@ -0,0 +1,201 @@
+"""
+Tests for the conditional-GET news page cache.
+"""
+
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from algorithmic_trading_utilities.common.news_cache import NewsPageCache
+from algorithmic_trading_utilities.common.news_ops import (
+    scrape_many,
+    scrape_with_beautifulsoup,
+)
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Local HTTP stub that honours If-None-Match for /etag/* pages."""
+
+    requests_seen = []
+    version = "v1"
+
+    def do_GET(self):
+        _ETagHandler.requests_seen.append(
+            (self.path, self.headers.get("If-None-Match"))
+        )
+        etag = f'"{self.path}-{_ETagHandler.version}"'
+        if self.path.startswith("/etag") and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = f"<html><body><p>{self.path} {_ETagHandler.version}</p></body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class TestNewsPageCache(unittest.TestCase):
+    """Test the cache store itself."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_store_and_get(self):
+        """Stored text and validators are returned on a hit."""
+        cache = NewsPageCache(self.tmp.name)
+        cache.store("https://a.com/x", "<p>x</p>", "x", {"ETag": '"1"'})
+
+        entry = cache.get("https://a.com/x")
+
+        self.assertEqual(entry["text"], "x")
+        self.assertEqual(
+            cache.conditional_headers("https://a.com/x"), {"If-None-Match": '"1"'}
+        )
+        self.assertIsNone(cache.get("https://a.com/missing"))
+
+    def test_index_persists_across_instances(self):
+        """A new cache instance over the same directory sees earlier pages."""
+        NewsPageCache(self.tmp.name).store("https://a.com/x", "<p>x</p>", "x")
+
+        self.assertIn("https://a.com/x", NewsPageCache(self.tmp.name))
+
+    def test_lru_eviction_keeps_cache_bounded(self):
+        """Least recently used pages are evicted once max_bytes is exceeded."""
+        cache = NewsPageCache(self.tmp.name, max_bytes=60)
+        cache.store("https://a.com/1", "a" * 10, "a" * 10)
+        cache.store("https://a.com/2", "b" * 10, "b" * 10)
+        cache.get("https://a.com/1")  # 1 is now more recent than 2
+        cache.store("https://a.com/3", "c" * 10, "c" * 10)
+        cache.store("https://a.com/4", "d" * 10, "d" * 10)
+
+        self.assertLessEqual(cache.total_bytes, 60)
+        self.assertIn("https://a.com/1", cache)
+        self.assertNotIn("https://a.com/2", cache)
+        self.assertIn("https://a.com/4", cache)
+
+    def test_hits_do_not_rewrite_index(self):
+        """Cache hits update recency in memory; the index is saved on flush."""
+        cache = NewsPageCache(self.tmp.name)
+        cache.store("https://a.com/1", "a", "a")
+        cache.store("https://a.com/2", "b", "b")
+
+        with patch.object(cache, "_write_index", wraps=cache._write_index) as write:
+            for _ in range(5):
+                cache.get("https://a.com/1")
+            self.assertEqual(write.call_count, 0)
+            cache.flush()
+            cache.flush()
+            self.assertEqual(write.call_count, 1)
+
+        # The reloaded index keeps the flushed access order
+        reloaded = NewsPageCache(self.tmp.name)
+        self.assertEqual(
+            [entry["url"] for entry in reloaded._index.values()],
+            ["https://a.com/2", "https://a.com/1"],
+        )
+
+    def test_close_on_context_exit(self):
+        """Leaving the context manager flushes pending recency updates."""
+        with NewsPageCache(self.tmp.name) as cache:
+            cache.store("https://a.com/1", "a", "a")
+            cache.get("https://a.com/1")
+            self.assertTrue(cache._dirty)
+
+        self.assertFalse(cache._dirty)
+
+    def test_clear(self):
+        """Clearing removes every page."""
+        cache = NewsPageCache(self.tmp.name)
+        cache.store("https://a.com/x", "<p>x</p>", "x")
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+
+class TestCachedScraping(unittest.TestCase):
+    """Test conditional GETs against a local stub server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = NewsPageCache(self.tmp.name)
+        _ETagHandler.requests_seen = []
+        _ETagHandler.version = "v1"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch("algorithmic_trading_utilities.common.news_ops.BeautifulSoup")
+    def test_not_modified_served_without_parsing(self, mock_soup):
+        """A 304 revalidation returns the cached text and skips parsing."""
+        mock_soup.return_value.get_text.return_value = "parsed text"
+        url = f"{self.base_url}/etag/1"
+
+        first = scrape_with_beautifulsoup(url, cache=self.cache)
+        second = scrape_with_beautifulsoup(url, cache=self.cache)
+
+        self.assertEqual(first, "parsed text")
+        self.assertEqual(second, "parsed text")
+        self.assertEqual(mock_soup.call_count, 1)
+        self.assertEqual(_ETagHandler.requests_seen[1], ("/etag/1", '"/etag/1-v1"'))
+
+    def test_changed_page_is_reparsed(self):
+        """A new ETag produces a fresh parse and replaces the cached text."""
+        url = f"{self.base_url}/etag/2"
+        scrape_with_beautifulsoup(url, cache=self.cache)
+        _ETagHandler.version = "v2"
+
+        text = scrape_with_beautifulsoup(url, cache=self.cache)
+
+        self.assertIn("v2", text)
+        self.assertIn("v2", self.cache.get(url)["text"])
+
+    @patch("algorithmic_trading_utilities.common.news_ops.BeautifulSoup")
+    def test_identical_body_without_validators_skips_parsing(self, mock_soup):
+        """Pages without validators are still not re-parsed if unchanged."""
+        mock_soup.return_value.get_text.return_value = "parsed text"
+        url = f"{self.base_url}/plain/1"
+
+        scrape_with_beautifulsoup(url, cache=self.cache)
+        scrape_with_beautifulsoup(url, cache=self.cache)
+
+        self.assertEqual(mock_soup.call_count, 1)
+
+    def test_scrape_many_uses_cache(self):
+        """The bulk scraper revalidates through the cache as well."""
+        urls = [f"{self.base_url}/etag/{i}" for i in range(4)]
+        list(scrape_many(urls, cache=self.cache))
+        _ETagHandler.requests_seen = []
+
+        results = dict(scrape_many(urls, cache=self.cache))
+
+        self.assertTrue(all(etag for _, etag in _ETagHandler.requests_seen))
+        self.assertIn("/etag/2 v1", results[urls[2]])
+        self.assertFalse(self.cache._dirty)
+
+
+if __name__ == "__main__":
+    unittest.main()
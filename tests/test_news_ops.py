@@ -3,16 +3,27 @@ from unittest.mock import Mock, patch
 import os
 from datetime import datetime, timezone
 import sys
+import threading
+import time
+import numpy as np
 import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Add the root directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from algorithmic_trading_utilities.common.news_ops import (
     scrape_with_beautifulsoup,
+    scrape_many,
     is_within_one_day,
     is_within_15_mins,
     calculate_time_ago,
+    parse_relative_ages,
+    is_within_15_mins_batch,
+    is_within_one_day_batch,
+    article_ages,
+    age_buckets,
+    calculate_time_ago_batch,
 )
 
 
@@ -63,6 +74,141 @@ class TestScrapeWithBeautifulSoup(TestNewsOps):
         self.assertIsNone(result)
 
 
+class _StubNewsHandler(BaseHTTPRequestHandler):
+    """Local HTTP stub serving article pages for the bulk scraper tests."""
+
+    active = 0
+    max_active = 0
+    served = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _StubNewsHandler.lock:
+            _StubNewsHandler.served += 1
+            _StubNewsHandler.active += 1
+            _StubNewsHandler.max_active = max(
+                _StubNewsHandler.max_active, _StubNewsHandler.active
+            )
+        try:
+            if self.path.startswith("/missing"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            if self.path.startswith("/slow"):
+                time.sleep(0.5)
+            else:
+                time.sleep(0.05)
+            body = f"<html><body><p>Article {self.path}</p></body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body.encode())
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client gave up (timeout test)
+        finally:
+            with _StubNewsHandler.lock:
+                _StubNewsHandler.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TestScrapeMany(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubNewsHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _StubNewsHandler.max_active = 0
+        _StubNewsHandler.served = 0
+
+    def test_scrapes_all_urls(self):
+        """Every URL is yielded once with its extracted text."""
+        urls = [f"{self.base_url}/article/{i}" for i in range(10)]
+
+        results = dict(scrape_many(urls, max_workers=5))
+
+        self.assertEqual(set(results), set(urls))
+        self.assertIn("Article /article/3", results[f"{self.base_url}/article/3"])
+
+    def test_failed_url_yields_none(self):
+        """HTTP errors are reported as None without stopping other URLs."""
+        urls = [f"{self.base_url}/missing", f"{self.base_url}/article/1"]
+
+        results = dict(scrape_many(urls))
+
+        self.assertIsNone(results[f"{self.base_url}/missing"])
+        self.assertIsNotNone(results[f"{self.base_url}/article/1"])
+
+    def test_streams_in_completion_order(self):
+        """Fast pages are yielded before a slow page submitted first."""
+        urls = [f"{self.base_url}/slow"] + [
+            f"{self.base_url}/article/{i}" for i in range(3)
+        ]
+
+        order = [url for url, _ in scrape_many(urls, max_workers=4)]
+
+        self.assertEqual(order[-1], f"{self.base_url}/slow")
+
+    def test_per_host_limit(self):
+        """No more than per_host_limit requests hit one host concurrently."""
+        urls = [f"{self.base_url}/article/{i}" for i in range(12)]
+
+        list(scrape_many(urls, max_workers=12, per_host_limit=2))
+
+        self.assertLessEqual(_StubNewsHandler.max_active, 2)
+        self.assertGreaterEqual(_StubNewsHandler.max_active, 1)
+
+    def test_busy_host_does_not_starve_others(self):
+        """A burst from one host does not hold every worker slot."""
+        port = self.server.server_address[1]
+        busy = [f"http://127.0.0.1:{port}/article/{i}" for i in range(8)]
+        other = f"http://localhost:{port}/article/other"
+
+        order = [
+            url
+            for url, _ in scrape_many(busy + [other], max_workers=2, per_host_limit=1)
+        ]
+
+        self.assertIn(other, order[:2])
+
+    def test_early_stop_skips_queued_urls(self):
+        """Closing the generator early stops dispatching remaining URLs."""
+        urls = [f"{self.base_url}/article/{i}" for i in range(20)]
+
+        results = scrape_many(urls, max_workers=2, per_host_limit=2)
+        next(results)
+        results.close()
+
+        self.assertLess(_StubNewsHandler.served, len(urls))
+
+    def test_timeout_yields_none(self):
+        """Requests slower than the timeout are reported as None."""
+        results = dict(scrape_many([f"{self.base_url}/slow"], timeout=0.1))
+
+        self.assertIsNone(results[f"{self.base_url}/slow"])
+
+    def test_lxml_parser_option(self):
+        """A faster parser backend can be selected."""
+        results = dict(scrape_many([f"{self.base_url}/article/1"], parser="lxml"))
+
+        self.assertIn("Article /article/1", results[f"{self.base_url}/article/1"])
+
+    def test_empty_urls(self):
+        """No URLs yields nothing."""
+        self.assertEqual(list(scrape_many([])), [])
+
+
 class TestIsWithinOneDay(TestNewsOps):
 
     def test_is_within_one_day_empty_list(self):
@@ -254,5 +400,101 @@ class TestCalculateTimeAgo(TestNewsOps):
         self.assertEqual(result, "2d ago")
 
 
+class TestFreshnessBatch(TestNewsOps):
+    """Test the vectorized freshness helpers."""
+
+    def test_parse_relative_ages(self):
+        """All supported formats parse in one pass; bad entries become NaN."""
+        ages = parse_relative_ages(
+            [
+                "4m ago",
+                "16 hours ago",
+                "a day ago",
+                "  10  m  ago  ",
+                "8M AGO",
+                None,
+                "x",
+            ]
+        )
+
+        np.testing.assert_array_equal(ages[:5], [240, 57600, 86400, 600, 480])
+        self.assertTrue(np.isnan(ages[5:]).all())
+
+    def test_parse_relative_ages_empty(self):
+        """An empty batch returns an empty array."""
+        self.assertEqual(parse_relative_ages([]).size, 0)
+
+    def test_is_within_15_mins_batch_matches_scalar(self):
+        """The mask agrees with is_within_15_mins element by element."""
+        strings = [
+            "4m ago",
+            "15m ago",
+            "16m ago",
+            "2h ago",
+            "30s ago",
+            "",
+            None,
+            "1d ago",
+        ]
+
+        mask = is_within_15_mins_batch(strings)
+
+        self.assertEqual(mask.tolist(), [is_within_15_mins(s) for s in strings])
+
+    def test_is_within_one_day_batch(self):
+        """Strings and lists of strings are both accepted."""
+        mask = is_within_one_day_batch(
+            [
+                ["Posted", "30 minutes ago"],
+                "1 day ago",
+                "a day ago",
+                "3 days ago",
+                "30 hours ago",
+                None,
+            ]
+        )
+
+        self.assertEqual(mask.tolist(), [True, True, True, False, False, False])
+
+    def test_article_ages_single_reference(self):
+        """Ages are computed against one reference time; invalid dates are NaN."""
+        now = datetime(2025, 10, 19, 12, 0, 0, tzinfo=timezone.utc)
+
+        ages = article_ages(
+            ["2025-10-19T11:59:00Z", "2025-10-19T08:00:00+00:00", "invalid", None],
+            now=now,
+        )
+
+        np.testing.assert_array_equal(ages[:2], [60, 14400])
+        self.assertTrue(np.isnan(ages[2:]).all())
+
+    def test_age_buckets(self):
+        """Buckets follow the calculate_time_ago units."""
+        buckets = age_buckets([5, 120, 7200, 172800, 1209600, np.nan])
+
+        self.assertEqual(buckets.tolist(), ["s", "m", "h", "d", "w", ""])
+
+    @patch("algorithmic_trading_utilities.common.news_ops.datetime")
+    def test_calculate_time_ago_batch_matches_scalar(self, mock_datetime):
+        """Labels agree with calculate_time_ago for the same reference time."""
+        now = datetime(2025, 10, 21, 12, 0, 30, tzinfo=timezone.utc)
+        mock_datetime.now.return_value = now
+        mock_datetime.fromisoformat.side_effect = datetime.fromisoformat
+        pub_dates = [
+            "2025-10-21T12:00:00Z",
+            "2025-10-21T11:30:00Z",
+            "2025-10-21T08:00:00Z",
+            "2025-10-19T12:00:00Z",
+            "2025-10-01T12:00:00Z",
+            "2025-10-21T12:00:30Z",
+            "invalid",
+            None,
+        ]
+
+        labels = calculate_time_ago_batch(pub_dates, now=now)
+
+        self.assertEqual(labels.tolist(), [calculate_time_ago(d) for d in pub_dates])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,105 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.backtest import run_backtest
+from common.param_sweep import (
+    parameter_grid,
+    run_parameter_sweep,
+    sample_parameters,
+)
+
+
+def _panel(n_days=200, n_symbols=15, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2021-01-01", periods=n_days)
+    symbols = [f"S{i}" for i in range(n_symbols)]
+    returns = rng.normal(0.0005, 0.02, (n_days, n_symbols))
+    close = pd.DataFrame(40 * np.exp(returns.cumsum(axis=0)), dates, symbols)
+    entries = close > close.rolling(10).mean()
+    return close, entries
+
+
+class TestParameterGeneration:
+
+    # grid covers every combination
+    def test_parameter_grid(self):
+        grid = parameter_grid(stop_min_pct=[0.03, 0.05], risk_per_trade=[0.01, 0.02])
+
+        assert len(grid) == 4
+        assert {"stop_min_pct": 0.05, "risk_per_trade": 0.01} in grid
+
+    # random samples respect ranges and are reproducible
+    def test_sample_parameters(self):
+        first = sample_parameters(
+            20, seed=1, stop_atr_multiplier=(1.5, 3.5), max_position_pct=[0.02, 0.05]
+        )
+        second = sample_parameters(
+            20, seed=1, stop_atr_multiplier=(1.5, 3.5), max_position_pct=[0.02, 0.05]
+        )
+
+        assert first == second
+        assert all(1.5 <= p["stop_atr_multiplier"] <= 3.5 for p in first)
+        assert {p["max_position_pct"] for p in first} <= {0.02, 0.05}
+
+
+class TestRunParameterSweep:
+
+    # process pool over shared memory gives the in-process results
+    def test_pool_matches_serial(self):
+        close, entries = _panel()
+        grid = parameter_grid(stop_atr_multiplier=[2.0, 3.0], stop_min_pct=[0.03, 0.08])
+
+        serial = run_parameter_sweep(close, entries, grid, max_workers=1)
+        pooled = run_parameter_sweep(close, entries, grid, max_workers=2)
+
+        pd.testing.assert_frame_equal(
+            serial.drop(columns="run_seconds"), pooled.drop(columns="run_seconds")
+        )
+        pd.testing.assert_frame_equal(serial.attrs["equity"], pooled.attrs["equity"])
+
+    # signal panels with missing dates or symbols are filled the same way in
+    # the pool as in-process, where gaps are no signal
+    def test_pool_matches_serial_with_signal_gaps(self):
+        close, entries = _panel()
+        exits = close < close.rolling(20).mean()
+        entries = entries.drop(index=close.index[50:60], columns="S3")
+        exits = exits.drop(columns="S5")
+        grid = parameter_grid(stop_min_pct=[0.03, 0.08])
+
+        serial = run_parameter_sweep(close, entries, grid, exits=exits, max_workers=1)
+        pooled = run_parameter_sweep(close, entries, grid, exits=exits, max_workers=2)
+
+        pd.testing.assert_frame_equal(serial.attrs["equity"], pooled.attrs["equity"])
+        expected = run_backtest(close, entries, exits=exits, stop_min_pct=0.03)
+        pd.testing.assert_series_equal(
+            pooled.attrs["equity"][
+                serial["run_id"][serial["stop_min_pct"] == 0.03].item()
+            ],
+            expected["equity"],
+            check_names=False,
+        )
+
+    # each row scores the backtest of its own parameters, best first
+    def test_table_rows_match_backtests(self):
+        close, entries = _panel()
+        grid = parameter_grid(risk_per_trade=[0.005, 0.02])
+
+        table = run_parameter_sweep(
+            close, entries, grid, max_workers=1, initial_equity=50_000
+        )
+
+        assert table["annualised_sharpe"].is_monotonic_decreasing
+        for _, row in table.iterrows():
+            equity = run_backtest(
+                close,
+                entries,
+                initial_equity=50_000,
+                risk_per_trade=row["risk_per_trade"],
+            )["equity"]
+            assert row["total_return"] == pytest.approx(
+                equity.iloc[-1] / equity.iloc[0] - 1
+            )
@@ -2,16 +2,19 @@ import json
 import sys
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 import pytest
 
 sys.path.insert(1, "algorithmic_trading_utilities")
 
 from brokers.alpaca.performance_ops import (
+    generate_multi_strategy_report,
     generate_performance_report,
     get_portfolio_equity_series,
     save_strategy_snapshot,
 )
+from common.portfolio_ops import PerformanceMetrics
 
 
 class TestSaveStrategySnapshot:
@@ -167,14 +170,14 @@ class TestGeneratePerformanceReport:
             _PM,
         )
 
-        # Stub the viz layer entirely; we just need build_performance_figures to
-        # return an empty list so the PDF writer has only the cover page.
+        # Stub the viz layer entirely; we just need iter_performance_figures to
+        # produce no figures so the PDF writer has only the cover page.
         mocker.patch(
             "common.viz_ops.PerformanceViz",
             return_value=mocker.MagicMock(),
         )
         mocker.patch(
-            "common.viz_ops.build_performance_figures",
+            "common.viz_ops.iter_performance_figures",
             return_value=[],
         )
 
@@ -233,7 +236,7 @@ class TestGeneratePerformanceReport:
             return_value=mocker.MagicMock(),
         )
         mocker.patch(
-            "common.viz_ops.build_performance_figures",
+            "common.viz_ops.iter_performance_figures",
             return_value=[],
         )
 
@@ -245,3 +248,134 @@ class TestGeneratePerformanceReport:
 
         fetch_mock.assert_not_called()
         assert captured["benchmark"] is None
+
+    def test_appends_attribution_pages(self, mocker, tmp_path):
+        """Per-symbol pages built from the snapshot fills follow the plots."""
+        snapshot_path = tmp_path / "attr_snapshot_20260101_000000.json"
+        fill = {
+            "activity_type": "FILL",
+            "symbol": "AAPL",
+            "side": "buy",
+            "qty": "10",
+            "price": "100",
+            "transaction_time": "2025-01-02T15:00:00Z",
+        }
+        snapshot_path.write_text(
+            json.dumps(
+                {
+                    "timestamp": "2025-01-03T21:00:00+00:00",
+                    "positions": [
+                        {"symbol": "AAPL", "qty": "10", "market_value": "1050"}
+                    ],
+                    "activities": [fill],
+                }
+            )
+        )
+        mocker.patch(
+            "brokers.alpaca.performance_ops.save_strategy_snapshot",
+            return_value=snapshot_path,
+        )
+        mocker.patch(
+            "brokers.alpaca.performance_ops.get_portfolio_equity_series",
+            return_value=pd.Series(
+                [10000.0, 10020.0, 10050.0],
+                index=pd.to_datetime(["2025-01-01", "2025-01-02", "2025-01-03"]),
+            ),
+        )
+        mocker.patch("common.viz_ops.iter_performance_figures", return_value=[])
+        attribution_pages = mocker.patch(
+            "common.viz_ops.iter_attribution_figures", return_value=[]
+        )
+
+        generate_performance_report(
+            strategy_name="attr", output_dir=tmp_path, include_benchmark=False
+        )
+
+        table = attribution_pages.call_args.args[0]
+        assert table.loc["AAPL", "pnl"] == pytest.approx(50.0)
+        assert table.loc["AAPL", "contribution"] == pytest.approx(50.0 / 10000)
+
+
+class TestGenerateMultiStrategyReport:
+    def _equity(self, seed, periods=300):
+        rng = np.random.default_rng(seed)
+        index = pd.bdate_range("2024-01-01", periods=periods)
+        return pd.Series(
+            10000 * np.cumprod(1 + rng.normal(0.0005, 0.01, periods)), index=index
+        )
+
+    def test_shares_fetches_and_writes_all_pdfs(self, mocker, tmp_path):
+        """Account state, equity and benchmark are fetched once for every strategy."""
+        account = self._equity(0)
+        benchmark = self._equity(1, periods=320)
+
+        state_mock = mocker.patch(
+            "brokers.alpaca.performance_ops._fetch_snapshot_state",
+            return_value={"positions": [], "orders": [], "activities": []},
+        )
+        equity_mock = mocker.patch(
+            "brokers.alpaca.performance_ops.get_portfolio_equity_series",
+            return_value=account,
+        )
+        sp500_mock = mocker.patch(
+            "data.yfinance_ops.get_sp500_prices", return_value=benchmark
+        )
+        other = self._equity(2)
+
+        result = generate_multi_strategy_report(
+            {"alpha": None, "beta": None, "gamma": lambda: other},
+            output_dir=tmp_path,
+            date_start="2024-01-01",
+            render_workers=1,
+        )
+
+        state_mock.assert_called_once_with("1D", "2024-01-01", None)
+        equity_mock.assert_called_once()
+        sp500_mock.assert_called_once()
+        assert set(result["snapshots"]) == {"alpha", "beta"}
+        for name, path in result["snapshots"].items():
+            assert json.loads(path.read_text())["strategy"] == name
+        assert list(result["metrics"].index) == ["alpha", "beta", "gamma"]
+        for path in list(result["pdfs"].values()) + [result["consolidated_pdf"]]:
+            assert path.exists() and path.stat().st_size > 0
+        assert result["pdfs"]["alpha"].name == (
+            result["snapshots"]["alpha"].stem + "_report.pdf"
+        )
+
+        expected = PerformanceMetrics(other, benchmark.loc[other.index]).calculate_all()
+        for key, value in expected.items():
+            assert result["metrics"].loc["gamma", key] == pytest.approx(value, rel=1e-9)
+
+    def test_without_benchmark(self, mocker, tmp_path):
+        """``include_benchmark=False`` never downloads S&P 500 prices."""
+        sp500_mock = mocker.patch("data.yfinance_ops.get_sp500_prices")
+
+        result = generate_multi_strategy_report(
+            {"a": self._equity(3), "b": self._equity(4, periods=200)},
+            output_dir=tmp_path,
+            include_benchmark=False,
+            render_workers=1,
+        )
+
+        sp500_mock.assert_not_called()
+        assert result["snapshots"] == {}
+        assert result["metrics"]["beta"].isna().all()
+        assert result["consolidated_pdf"].exists()
+
+    def test_in_process_keeps_caller_backend(self, tmp_path):
+        """``render_workers=1`` does not switch the caller's matplotlib backend."""
+        import matplotlib
+
+        backend = matplotlib.get_backend()
+        matplotlib.use("pdf")
+        try:
+            generate_multi_strategy_report(
+                {"a": self._equity(5)},
+                output_dir=tmp_path,
+                include_benchmark=False,
+                render_workers=1,
+            )
+
+            assert matplotlib.get_backend() == "pdf"
+        finally:
+            matplotlib.use(backend)
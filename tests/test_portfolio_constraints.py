@@ -10,6 +10,7 @@ from algorithmic_trading_utilities.common.portfolio_constraints import (
     get_sector,
     check_sector_exposure,
     check_gross_exposure,
+    exposure_limit_mask,
 )
 
 
@@ -246,5 +247,64 @@ class TestCheckGrossExposure(unittest.TestCase):
         self.assertFalse(allowed)
 
 
+class TestExposureLimitMask(unittest.TestCase):
+    """Test the vectorized exposure checks used by the backtester."""
+
+    def test_gross_limit_counts_only_accepted_trades(self):
+        """A rejected trade does not use up room for later, smaller trades."""
+        allowed = exposure_limit_mask(
+            [2000, 2000, 3000, 500], equity=10000, current_gross=3000
+        )
+        # 3000+2000+2000 = 70%; +3000 = 100% > 80% rejected; +500 = 75% ok
+        self.assertEqual(allowed.tolist(), [True, True, False, True])
+
+    def test_large_order_does_not_block_small_one(self):
+        """A large breaching order followed by a small one: the small one fits."""
+        allowed = exposure_limit_mask([9000, 1000], equity=10000)
+        self.assertEqual(allowed.tolist(), [False, True])
+
+        allowed = exposure_limit_mask(
+            [5000, 1000],
+            equity=10000,
+            sector_codes=[0, 0],
+            max_sector_pct=0.30,
+            max_gross_pct=1.0,
+        )
+        self.assertEqual(allowed.tolist(), [False, True])
+
+    def test_cash_limit_counts_only_accepted_trades(self):
+        """Cash is spent only by accepted trades, in order."""
+        allowed = exposure_limit_mask(
+            [4000, 1000, 500],
+            equity=10000,
+            max_gross_pct=1.0,
+            cash=2000,
+            cost=[4010, 1005, 1500],
+        )
+        # 4010 > 2000 rejected; 1005 ok; 1005+1500 > 2000 rejected
+        self.assertEqual(allowed.tolist(), [False, True, False])
+
+    def test_sector_limit_per_sector(self):
+        """Each sector is capped independently; unknown sectors are not."""
+        allowed = exposure_limit_mask(
+            [1500, 1000, 1500, 2000, 1000],
+            equity=10000,
+            sector_codes=[0, 1, 0, -1, 1],
+            sector_exposure=[1000, 0],
+            max_sector_pct=0.30,
+            max_gross_pct=1.0,
+        )
+        # Sector 0: 1000+1500 = 25% ok, +1500 = 40% rejected
+        # Sector 1: 1000, 2000 ok; unknown sector always ok
+        self.assertEqual(allowed.tolist(), [True, True, False, True, True])
+
+    def test_matches_sequential_checks_for_single_trade(self):
+        """A single trade gets the same decision as check_gross_exposure."""
+        positions = [{"market_value": "15000"}, {"market_value": "-8000"}]
+        expected, _ = check_gross_exposure(positions, 3000, equity=30000)
+        allowed = exposure_limit_mask([3000], equity=30000, current_gross=23000)
+        self.assertEqual(bool(allowed[0]), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,10 +5,13 @@ import pandas as pd
 
 sys.path.insert(1, "algorithmic_trading_utilities")
 from algorithmic_trading_utilities.common.portfolio_ops import (
+    PerformanceAnalytics,
     PerformanceMetrics,
+    calculate_panel_metrics,
     fetch_normalized_benchmark,
 )
 import numpy as np
+from sklearn.linear_model import LinearRegression
 
 
 class TestFetchNormalizedBenchmark:
@@ -75,6 +78,24 @@ class TestFetchNormalizedBenchmark:
 
         mock.assert_called_once_with("2025-04-08")
 
+    def test_benchmark_data_skips_fetch(self, mocker):
+        """Prices passed as ``benchmark_data`` are used without a download."""
+        portfolio = pd.Series(
+            [100.0, 110.0],
+            index=pd.to_datetime(["2025-04-08", "2025-04-09"]),
+        )
+        mock = mocker.patch(
+            "algorithmic_trading_utilities.common.portfolio_ops.get_sp500_prices"
+        )
+        sp500 = pd.Series([50.0, 55.0], index=portfolio.index)
+
+        _, b_aligned = fetch_normalized_benchmark(
+            portfolio, "2025-04-08", benchmark_data=sp500
+        )
+
+        mock.assert_not_called()
+        assert b_aligned.tolist() == pytest.approx([100.0, 110.0])
+
 
 class TestPerformanceMetrics:
     def setup_method(self):
@@ -202,3 +223,128 @@ class TestPerformanceMetrics:
             self.pm.report()
         except Exception as e:
             pytest.fail(f"report() raised an exception: {e}")
+
+
+def _daily_equity(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2023-01-02", periods=n)
+    bench = rng.normal(0.0003, 0.01, n)
+    port = 0.7 * bench + rng.normal(0.0002, 0.006, n)
+    return (
+        pd.Series(1000 * np.cumprod(1 + port), index=dates),
+        pd.Series(1000 * np.cumprod(1 + bench), index=dates),
+    )
+
+
+class TestRollingAlphaBeta:
+    def test_matches_per_window_regression(self):
+        portfolio, benchmark = _daily_equity()
+        pm = PerformanceMetrics(portfolio, benchmark)
+        window = 60
+
+        result = pm.rolling_alpha_beta(window=window)
+
+        assert result.index.equals(pm.returns.index[window - 1 :])
+        for i in (0, 100, len(result) - 1):
+            y = pm.returns.iloc[i : i + window] - pm.risk_free_rate
+            X = pm.benchmark_returns.iloc[i : i + window] - pm.risk_free_rate
+            model = LinearRegression().fit(
+                X.values.reshape(-1, 1), y.values.reshape(-1, 1)
+            )
+            assert result["alpha"].iloc[i] == pytest.approx(
+                model.intercept_[0], abs=1e-12
+            )
+            assert result["beta"].iloc[i] == pytest.approx(model.coef_[0][0], rel=1e-9)
+
+    def test_flat_benchmark_window_has_zero_beta(self):
+        portfolio, benchmark = _daily_equity(n=200)
+        benchmark.iloc[100:] = benchmark.iloc[100]
+        pm = PerformanceMetrics(portfolio, benchmark)
+        window = 30
+
+        result = pm.rolling_alpha_beta(window=window)
+
+        y = pm.returns.iloc[-window:] - pm.risk_free_rate
+        assert result["beta"].iloc[-1] == 0.0
+        assert result["alpha"].iloc[-1] == pytest.approx(y.mean(), abs=1e-15)
+        assert np.isfinite(result.to_numpy()).all()
+
+    def test_short_history_is_empty(self):
+        portfolio, benchmark = _daily_equity(n=30)
+        result = PerformanceMetrics(portfolio, benchmark).rolling_alpha_beta(252)
+        assert list(result.columns) == ["alpha", "beta"]
+        assert result.empty
+
+
+class TestPerformanceAnalytics:
+    def setup_method(self):
+        portfolio, benchmark = _daily_equity()
+        self.pm = PerformanceMetrics(portfolio, benchmark)
+        self.analytics = PerformanceAnalytics(self.pm)
+
+    def test_matches_performance_metrics(self):
+        pd.testing.assert_series_equal(
+            self.analytics.drawdown, self.pm.drawdown_series()
+        )
+        pd.testing.assert_series_equal(
+            self.analytics.rolling_sharpe(63), self.pm.rolling_sharpe(63)
+        )
+        pd.testing.assert_series_equal(
+            self.analytics.rolling_std(63, benchmark=True),
+            self.pm.benchmark_returns.rolling(63).std(),
+        )
+        assert self.analytics.cumulative_returns().iloc[-1] == pytest.approx(
+            self.pm.total_return() * 100
+        )
+
+    def test_series_are_computed_once(self):
+        self.analytics.precompute(window=21, alpha_beta_window=60)
+        cached = dict(self.analytics._cache)
+
+        assert self.analytics.rolling_sharpe(21) is cached[("rolling_sharpe", 21)]
+        assert (
+            self.analytics.rolling_alpha_beta(60) is cached[("rolling_alpha_beta", 60)]
+        )
+        assert self.analytics.drawdown is cached["drawdown"]
+        assert len(self.analytics._cache) == len(cached)
+
+
+class TestCalculatePanelMetrics:
+    def setup_method(self):
+        rng = np.random.default_rng(7)
+        dates = pd.bdate_range("2024-01-01", periods=300)
+        returns = rng.normal(0.0004, 0.01, (300, 5))
+        self.equity = pd.DataFrame(
+            1000 * np.cumprod(1 + returns, axis=0),
+            index=dates,
+            columns=list("abcde"),
+        )
+        self.benchmark = pd.Series(
+            1000 * np.cumprod(1 + rng.normal(0.0003, 0.008, 300)), index=dates
+        )
+
+    def test_matches_calculate_all_per_column(self):
+        panel = calculate_panel_metrics(self.equity, self.benchmark)
+        for column in self.equity:
+            expected = PerformanceMetrics(
+                self.equity[column], self.benchmark
+            ).calculate_all()
+            for key, value in expected.items():
+                assert panel.loc[column, key] == pytest.approx(value, rel=1e-9), key
+
+    def test_without_benchmark_alpha_beta_nan(self):
+        panel = calculate_panel_metrics(self.equity)
+        assert list(panel.index) == list("abcde")
+        assert panel["alpha"].isna().all()
+        assert panel["beta"].isna().all()
+
+    def test_monotonic_curve_has_no_drawdown(self):
+        equity = pd.DataFrame(
+            {"up": [100.0, 101.0, 102.0, 103.0]},
+            index=pd.bdate_range("2024-01-01", periods=4),
+        )
+        panel = calculate_panel_metrics(equity)
+        assert panel.loc["up", "max_drawdown"] == 0
+        assert panel.loc["up", "drawdown_duration"] == 0
+        assert math.isnan(panel.loc["up", "calmar_ratio"])
+        assert math.isnan(panel.loc["up", "sortino_ratio"])
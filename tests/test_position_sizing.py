@@ -5,8 +5,11 @@ Tests for ATR-based position sizing.
 import unittest
 from unittest.mock import patch, MagicMock
 
+import numpy as np
+
 from algorithmic_trading_utilities.common.position_sizing import (
     calculate_position_size,
+    calculate_position_size_array,
     get_atr,
 )
 
@@ -218,6 +221,39 @@ class TestCalculatePositionSize(unittest.TestCase):
 
         self.assertAlmostEqual(result["notional"], result["quantity"] * 50.0, places=2)
 
+    @patch("algorithmic_trading_utilities.common.position_sizing.get_atr")
+    def test_precomputed_atr_skips_fetch(self, mock_atr):
+        """A supplied ATR (e.g. intraday from live bars) is used as-is."""
+        result = calculate_position_size("TEST", 50.0, 30000.0, 0.01, None, atr=0.5)
+
+        mock_atr.assert_not_called()
+        self.assertEqual(result["atr"], 0.5)
+        self.assertEqual(result["stop_distance"], 1.0)
+
+
+class TestCalculatePositionSizeArray(unittest.TestCase):
+    """Test the vectorized position sizing used by the backtester."""
+
+    def test_matches_scalar(self):
+        """Quantities should equal calculate_position_size element-wise."""
+        rng = np.random.default_rng(1)
+        price = rng.uniform(1.0, 2000.0, 300)
+        atr = np.where(rng.random(300) < 0.1, np.nan, rng.uniform(0.05, 30.0, 300))
+
+        quantity, stop_distance = calculate_position_size_array(
+            price, 30000.0, 0.01, atr
+        )
+
+        for i in range(len(price)):
+            # NaN ATR takes the fallback path, like an unavailable ATR
+            expected = calculate_position_size(
+                "TEST", price[i], 30000.0, 0.01, None, atr=np.nan_to_num(atr[i])
+            )
+            self.assertEqual(quantity[i], expected["quantity"])
+            self.assertAlmostEqual(
+                stop_distance[i], expected["stop_distance"], places=3
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,9 +7,37 @@ from brokers.alpaca.positions import (
     get_positions_without_trailing_stop_loss,
     get_positions_symbol_list,
     close_positions_below_threshold,
+    liquidate_positions_below_threshold,
 )
 from unittest.mock import MagicMock
 
+from alpaca.trading.enums import OrderSide
+from alpaca.trading.models import Order
+from alpaca.trading.requests import TrailingStopOrderRequest
+
+
+def _stop_payload(symbol, order_type, **prices):
+    """Raw API fields of an open sell order resting against a long position."""
+    now = "2026-04-06T14:00:00Z"
+    return {
+        "id": "9b1deb4d-3b7d-4bad-9bdd-2b0d7b3dcb6d",
+        "client_order_id": "client-1",
+        "created_at": now,
+        "updated_at": now,
+        "submitted_at": now,
+        "symbol": symbol,
+        "asset_class": "us_equity",
+        "order_class": "simple",
+        "order_type": order_type,
+        "type": order_type,
+        "side": "sell",
+        "qty": "10",
+        "time_in_force": "gtc",
+        "status": "new",
+        "extended_hours": False,
+        **prices,
+    }
+
 
 class TestGetOpenPositions:
 
@@ -193,6 +221,9 @@ class TestClosePositionsBelowThreshold:
             "brokers.alpaca.positions.trading_client.get_all_positions",
             return_value=mock_positions,
         )
+        mocker.patch(
+            "brokers.alpaca.positions.trading_client.get_orders", return_value=[]
+        )
 
         # Act
         close_positions_below_threshold(mock_threshold)
@@ -242,3 +273,137 @@ class TestClosePositionsBelowThreshold:
 
         # Assert
         mock_close_position.assert_not_called()
+
+
+class TestLiquidatePositionsBelowThreshold:
+
+    # Cancels blocking orders with one fetch and closes breaching positions concurrently
+    def test_liquidates_breaching_positions(self, mocker):
+        # Arrange
+        mock_positions = [
+            MagicMock(symbol=f"S{i}", unrealized_plpc=-0.10) for i in range(6)
+        ] + [MagicMock(symbol="WIN", unrealized_plpc=0.10)]
+        mock_orders = [MagicMock(symbol="S0", id="o0"), MagicMock(symbol="S3", id="o3")]
+        client = mocker.patch("brokers.alpaca.positions.trading_client")
+        client.get_all_positions.return_value = mock_positions
+        client.get_orders.return_value = mock_orders
+
+        # Act
+        report = liquidate_positions_below_threshold(0.05, max_workers=3)
+
+        # Assert
+        client.get_orders.assert_called_once()
+        assert client.get_orders.call_args.kwargs["filter"].symbols == [
+            f"S{i}" for i in range(6)
+        ]
+        assert sorted(c.args[0] for c in client.cancel_order_by_id.call_args_list) == [
+            "o0",
+            "o3",
+        ]
+        assert report["closed"] == 6
+        assert report["failed"] == 0
+        by_symbol = {r["symbol"]: r for r in report["results"]}
+        assert by_symbol["S0"]["cancelled_orders"] == ["o0"]
+        assert all(r["latency_seconds"] >= 0 for r in report["results"])
+        assert "WIN" not in by_symbol
+
+    # Long books are looked up in symbol chunks so no blocking order is missed
+    def test_chunks_order_lookup(self, mocker):
+        # Arrange
+        client = mocker.patch("brokers.alpaca.positions.trading_client")
+        client.get_all_positions.return_value = [
+            MagicMock(symbol=f"S{i}", unrealized_plpc=-0.10) for i in range(150)
+        ]
+        client.get_orders.side_effect = lambda filter: [
+            MagicMock(symbol=s, id=f"o-{s}") for s in filter.symbols
+        ]
+
+        # Act
+        report = liquidate_positions_below_threshold(0.05, max_workers=8)
+
+        # Assert
+        assert [
+            len(c.kwargs["filter"].symbols) for c in client.get_orders.call_args_list
+        ] == [100, 50]
+        assert client.cancel_order_by_id.call_count == 150
+        assert report["closed"] == 150
+
+    # Retries a close that fails and reports persistent failures per symbol
+    def test_retries_and_reports_failures(self, mocker):
+        # Arrange
+        client = mocker.patch("brokers.alpaca.positions.trading_client")
+        client.get_all_positions.return_value = [
+            MagicMock(symbol="AAPL", unrealized_plpc=-0.2),
+            MagicMock(symbol="MSFT", unrealized_plpc=-0.2),
+        ]
+        client.get_orders.return_value = []
+        attempts = {"AAPL": 0}
+
+        def close_position(symbol):
+            if symbol == "MSFT":
+                raise Exception("insufficient qty available")
+            attempts["AAPL"] += 1
+            if attempts["AAPL"] == 1:
+                raise Exception("cancel pending")
+
+        client.close_position.side_effect = close_position
+
+        # Act
+        report = liquidate_positions_below_threshold(0.05, retries=2, retry_delay=0)
+
+        # Assert
+        by_symbol = {r["symbol"]: r for r in report["results"]}
+        assert by_symbol["AAPL"]["status"] == "closed"
+        assert by_symbol["AAPL"]["attempts"] == 2
+        assert by_symbol["MSFT"]["status"] == "failed"
+        assert by_symbol["MSFT"]["attempts"] == 3
+        assert "insufficient" in by_symbol["MSFT"]["error"]
+        assert (report["closed"], report["failed"]) == (1, 1)
+
+    # A failed close puts the cancelled trailing stop back
+    def test_restores_stop_when_close_fails(self, mocker):
+        # Arrange
+        client = mocker.patch("brokers.alpaca.positions.trading_client")
+        client.get_all_positions.return_value = [
+            MagicMock(symbol="AAPL", unrealized_plpc=-0.2)
+        ]
+        client.get_orders.return_value = [
+            Order(**_stop_payload("AAPL", "trailing_stop", trail_percent="5")),
+            Order(**_stop_payload("AAPL", "limit", limit_price="150")),
+        ]
+        client.close_position.side_effect = Exception("market closed")
+        client.submit_order.return_value = MagicMock(id="restored-1")
+
+        # Act
+        report = liquidate_positions_below_threshold(0.05, retries=0)
+
+        # Assert
+        request = client.submit_order.call_args.kwargs["order_data"]
+        assert client.submit_order.call_count == 1
+        assert isinstance(request, TrailingStopOrderRequest)
+        assert (request.symbol, request.qty, request.trail_percent) == ("AAPL", 10, 5)
+        assert request.side == OrderSide.SELL
+        result = report["results"][0]
+        assert result["restored_orders"] == ["restored-1"]
+        assert report["unprotected"] == []
+
+    # A stop that cannot be restored is reported as unprotected
+    def test_reports_unprotected_symbol(self, mocker):
+        # Arrange
+        client = mocker.patch("brokers.alpaca.positions.trading_client")
+        client.get_all_positions.return_value = [
+            MagicMock(symbol="AAPL", unrealized_plpc=-0.2)
+        ]
+        client.get_orders.return_value = [
+            Order(**_stop_payload("AAPL", "stop", stop_price="90"))
+        ]
+        client.close_position.side_effect = Exception("market closed")
+        client.submit_order.side_effect = Exception("rejected")
+
+        # Act
+        report = liquidate_positions_below_threshold(0.05, retries=0)
+
+        # Assert
+        assert report["unprotected"] == ["AAPL"]
+        assert report["results"][0]["unprotected"] is True
+        assert "restore" in report["results"][0]["error"]
@@ -1,7 +1,10 @@
 import sys
 
 sys.path.insert(1, "algorithmic_trading_utilities")
-from common.quantitative_tools import remove_highly_correlated_columns
+from common.quantitative_tools import (
+    remove_highly_correlated_columns,
+    RollingCorrelationTracker,
+)
 
 
 class TestRemoveHighlyCorrelatedColumns:
@@ -19,3 +22,100 @@ class TestRemoveHighlyCorrelatedColumns:
         assert "A" not in result_df.columns
         assert "B" in result_df.columns
         assert "C" in result_df.columns
+
+    # keeps the drop decisions of the original pairwise loop
+    def test_matches_pairwise_loop(self):
+        df = _correlated_frame()
+
+        result_df = remove_highly_correlated_columns(df, 0.8)
+
+        assert list(result_df.columns) == _loop_reference(df, 0.8)
+
+    # blockwise mode makes the same decisions as the full matrix
+    def test_blockwise_matches_full_matrix(self):
+        df = _correlated_frame()
+
+        full = remove_highly_correlated_columns(df, 0.8)
+        for block_size in (1, 7, 64):
+            blockwise = remove_highly_correlated_columns(df, 0.8, block_size=block_size)
+            assert list(blockwise.columns) == list(full.columns)
+
+    # blockwise mode rejects missing values
+    def test_blockwise_rejects_nans(self):
+        import numpy as np
+        import pytest
+
+        df = _correlated_frame()
+        df.iloc[0, 0] = np.nan
+
+        with pytest.raises(ValueError):
+            remove_highly_correlated_columns(df, 0.8, block_size=8)
+
+
+def _correlated_frame():
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(200, 6))
+    cols = {}
+    for i in range(30):
+        sign = -1 if i % 4 == 0 else 1
+        cols[f"c{i}"] = sign * base[:, i % 6] + rng.normal(scale=0.3 + i / 30, size=200)
+    cols["const"] = np.ones(200)
+    return pd.DataFrame(cols)
+
+
+def _loop_reference(df, threshold):
+    corr_matrix = df.corr()
+    dropped = set()
+    for i in range(len(corr_matrix.columns)):
+        for j in range(i + 1, len(corr_matrix.columns)):
+            if abs(corr_matrix.iloc[i, j]) > threshold:
+                dropped.add(
+                    corr_matrix.columns[i]
+                    if corr_matrix.iloc[i, j] > 0
+                    else corr_matrix.columns[j]
+                )
+    return [c for c in df.columns if c not in dropped]
+
+
+class TestRollingCorrelationTracker:
+
+    # streamed correlations match a from-scratch computation on the window
+    def test_matches_window_corr(self):
+        import numpy as np
+
+        df = _correlated_frame().drop(columns="const")
+        tracker = RollingCorrelationTracker(df.columns, window=60, threshold=0.8)
+
+        tracker.extend(df)
+
+        expected = df.tail(60).corr()
+        np.testing.assert_allclose(
+            tracker.correlation_matrix().to_numpy(), expected.to_numpy(), atol=1e-10
+        )
+
+    # pruned set matches remove_highly_correlated_columns on the window
+    def test_pruned_columns_match_batch_pruning(self):
+        df = _correlated_frame()
+        tracker = RollingCorrelationTracker(
+            df.columns, window=50, threshold=0.8, recompute_every=1000
+        )
+
+        for i, (_, row) in enumerate(df.iterrows()):
+            tracker.update(row)
+            if i >= 1 and i % 25 == 0:
+                window = df.iloc[max(0, i - 49) : i + 1]
+                expected = remove_highly_correlated_columns(window, 0.8)
+                assert tracker.pruned_columns() == list(expected.columns)
+
+    # rows with missing values are rejected
+    def test_rejects_nans(self):
+        import numpy as np
+        import pytest
+
+        tracker = RollingCorrelationTracker(["a", "b"], window=5, threshold=0.9)
+
+        with pytest.raises(ValueError):
+            tracker.update([1.0, np.nan])
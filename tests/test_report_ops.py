@@ -1,3 +1,4 @@
+import re
 import sys
 
 sys.path.insert(1, "algorithmic_trading_utilities")
@@ -63,3 +64,67 @@ class TestWritePerformancePdf:
         )
         assert hasattr(result, "exists")
         assert str(result) == str(out)
+
+    def test_writes_page_payloads_in_order(self, tmp_path):
+        """PNG and pickled-figure payloads each become one page."""
+        import io
+        import pickle
+
+        fig1, ax1 = plt.subplots()
+        ax1.plot([1, 2, 3], [1, 4, 9])
+        buffer = io.BytesIO()
+        fig1.savefig(buffer, format="png", dpi=40)
+        fig2, ax2 = plt.subplots()
+        ax2.bar([1, 2, 3], [3, 1, 2])
+        pages = [
+            {"name": "line", "format": "png", "data": buffer.getvalue(), "dpi": 40},
+            {"name": "bar", "format": "pickle", "data": pickle.dumps(fig2)},
+        ]
+        plt.close("all")
+
+        out = tmp_path / "pages.pdf"
+        write_performance_pdf(out, "Payloads", {}, pages)
+
+        content = out.read_bytes()
+        assert content.count(b"/Type /Page\n") + content.count(b"/Type /Page ") == 3
+        assert plt.get_fignums() == []
+
+    def test_generator_keeps_one_page_open(self, tmp_path):
+        """Pages from a generator are closed before the next one is built."""
+        plt.close("all")
+        open_counts = []
+
+        def pages(n):
+            for i in range(n):
+                open_counts.append(len(plt.get_fignums()))
+                fig, ax = plt.subplots()
+                ax.plot(range(100), [i] * 100)
+                yield fig
+
+        out = tmp_path / "streamed.pdf"
+        write_performance_pdf(out, "Streamed", {}, pages(60))
+
+        assert len(open_counts) == 60
+        assert max(open_counts) == 0
+        assert plt.get_fignums() == []
+
+    def test_pages_are_tight_unless_disabled(self, tmp_path):
+        """Figure pages are tight-cropped unless ``bbox_inches=None``."""
+
+        def page_sizes(path):
+            boxes = re.findall(
+                rb"/MediaBox \[ ?0 0 ([\d.]+) ([\d.]+) ?\]", path.read_bytes()
+            )
+            return [(float(w), float(h)) for w, h in boxes][1:]
+
+        sizes = {}
+        for bbox in (None, "default"):
+            fig, ax = plt.subplots(figsize=(10, 5))
+            ax.plot([1, 2, 3], [1, 4, 9])
+            out = tmp_path / f"{bbox}.pdf"
+            kwargs = {} if bbox == "default" else {"bbox_inches": bbox}
+            write_performance_pdf(out, "Sizes", {}, [fig], **kwargs)
+            sizes[bbox] = page_sizes(out)
+
+        assert sizes[None] == [(720.0, 360.0)]
+        assert sizes["default"][0][0] < 720.0
@@ -4,6 +4,7 @@ import sys
 sys.path.insert(1, "algorithmic_trading_utilities")
 
 from brokers.alpaca.performance_ops import (
+    _render_markdown_report,
     generate_strategy_report,
     generate_strategy_report_data,
     load_strategy_snapshot,
@@ -116,6 +117,105 @@ class TestGenerateReport:
         assert report["activities"]["total_activities"] == 2
         assert report["equity_performance"]["metrics_available"] is True
 
+    def test_generate_strategy_report_data_attribution(self):
+        snapshot = {
+            "strategy": "s1",
+            "timestamp": "2026-03-23T00:00:00+00:00",
+            "positions": [
+                {"symbol": "AAPL", "side": "long", "qty": "2", "market_value": "230"}
+            ],
+            "activities": [
+                {
+                    "activity_type": "FILL",
+                    "qty": "2",
+                    "price": "100",
+                    "side": "buy",
+                    "symbol": "AAPL",
+                    "transaction_time": "2026-03-22T00:00:00Z",
+                },
+                {
+                    "activity_type": "FILL",
+                    "qty": "1",
+                    "price": "50",
+                    "side": "buy",
+                    "symbol": "MSFT",
+                    "transaction_time": "2026-03-22T00:00:00Z",
+                },
+                {
+                    "activity_type": "FILL",
+                    "qty": "1",
+                    "price": "45",
+                    "side": "sell",
+                    "symbol": "MSFT",
+                    "transaction_time": "2026-03-22T12:00:00Z",
+                },
+            ],
+            "balances": {},
+            "equity_performance": {
+                "timestamp": [1700000000, 1700086400],
+                "equity": [1000, 1025],
+            },
+        }
+
+        report = generate_strategy_report_data(snapshot)
+
+        attribution = report["attribution"]
+        assert attribution["symbols_traded"] == 2
+        assert attribution["total_pnl"] == 25.0
+        aapl, msft = attribution["symbols"]
+        # AAPL is marked at the position's market value / qty
+        assert aapl["symbol"] == "AAPL"
+        assert aapl["mark_price"] == 115.0
+        assert aapl["contribution"] == 0.03
+        assert aapl["holding_days"] == 1.0
+        assert msft["pnl"] == -5.0
+        assert msft["avg_buy_price"] == 50.0
+        assert msft["first_fill"] == "2026-03-22T00:00:00+00:00"
+        json.dumps(report)
+
+        markdown = _render_markdown_report(report)
+        assert "## Per-Symbol Attribution" in markdown
+        assert "| AAPL | 1 | 2.0 | 115.0 | 30.0 |" in markdown
+
+    def test_generate_strategy_report_data_trades(self):
+        fills = [
+            {
+                "activity_type": "FILL",
+                "symbol": "AAPL",
+                "side": side,
+                "qty": qty,
+                "price": price,
+                "transaction_time": f"2026-03-2{day}T00:00:00Z",
+            }
+            for side, qty, price, day in (
+                ("buy", "1", "100", 0),
+                ("buy", "1", "120", 1),
+                ("sell", "1", "110", 2),
+            )
+        ]
+        snapshot = {"activities": fills, "timestamp": "2026-03-23T00:00:00Z"}
+
+        fifo = generate_strategy_report_data(snapshot)["trades"]
+        lifo = generate_strategy_report_data(snapshot, lot_method="lifo")["trades"]
+
+        assert fifo["lot_method"] == "fifo"
+        assert fifo["statistics"]["realized_pnl"] == 10.0
+        assert fifo["best_trades"][0]["entry_time"] == "2026-03-20T00:00:00+00:00"
+        assert fifo["worst_trades"] == []
+        assert fifo["open_lots"] == 1
+        assert lifo["statistics"]["realized_pnl"] == -10.0
+        assert lifo["worst_trades"][0]["holding_days"] == 1.0
+        assert lifo["by_symbol"] == [
+            {"symbol": "AAPL", "trades": 1, "realized_pnl": -10.0}
+        ]
+
+        markdown = _render_markdown_report(
+            generate_strategy_report_data(snapshot, lot_method="lifo")
+        )
+        assert "## Round-Trip Trades" in markdown
+        assert "- Lot matching: LIFO" in markdown
+        assert "Largest losing trades:" in markdown
+
     def test_generate_strategy_report_writes_markdown_and_json(self, mocker, tmp_path):
         snapshot = {
             "strategy": "s1",
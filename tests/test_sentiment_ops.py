@@ -2,11 +2,16 @@ import unittest
 from unittest.mock import Mock, patch
 import os
 import sys
+import tempfile
 
 # Add the root directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from algorithmic_trading_utilities.common.sentiment_ops import analyze_sentiment
+from algorithmic_trading_utilities.common import sentiment_ops
+from algorithmic_trading_utilities.common.sentiment_ops import (
+    analyze_sentiment,
+    analyze_sentiment_batch,
+)
 
 
 class TestAnalyzeSentiment(unittest.TestCase):
@@ -127,3 +132,139 @@ class TestAnalyzeSentiment(unittest.TestCase):
         self.assertEqual(result[0]["label"], "positive")
         self.assertAlmostEqual(result[0]["score"], 0.87)
         mock_pipe.assert_called_once_with(text)
+
+
+def _fake_pipe(texts, **kwargs):
+    """Score texts containing 'loss' as negative and everything else positive."""
+    return [
+        {"label": "negative" if "loss" in t else "positive", "score": 0.9}
+        for t in texts
+    ]
+
+
+class TestAnalyzeSentimentBatch(unittest.TestCase):
+    """Tests for the analyze_sentiment_batch function."""
+
+    def setUp(self):
+        sentiment_ops._sentiment_caches.clear()
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_results_follow_input_order(self, mock_pipe):
+        """Results are aligned with the input texts."""
+        mock_pipe.side_effect = _fake_pipe
+
+        texts = ["Record profits", "Heavy loss reported", "Record profits"]
+        results, stats = analyze_sentiment_batch(texts, cache_path=None)
+
+        self.assertEqual(
+            [r["label"] for r in results], ["positive", "negative", "positive"]
+        )
+        self.assertEqual(stats["texts"], 3)
+        self.assertIn("texts_per_sec", stats)
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_duplicates_scored_once(self, mock_pipe):
+        """Identical texts reach the model only once, in one batched call."""
+        mock_pipe.side_effect = _fake_pipe
+
+        texts = ["Shares jump", "Shares jump", "Margins shrink", "Shares jump"]
+        _, stats = analyze_sentiment_batch(texts, batch_size=8, cache_path=None)
+
+        mock_pipe.assert_called_once()
+        scored_texts = mock_pipe.call_args[0][0]
+        self.assertEqual(sorted(scored_texts), ["Margins shrink", "Shares jump"])
+        self.assertEqual(mock_pipe.call_args[1]["batch_size"], 8)
+        self.assertTrue(mock_pipe.call_args[1]["truncation"])
+        self.assertEqual(stats["scored"], 2)
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_accepts_generator(self, mock_pipe):
+        """Any iterable of texts is accepted."""
+        mock_pipe.side_effect = _fake_pipe
+
+        results, _ = analyze_sentiment_batch(
+            (f"headline {i}" for i in range(3)), cache_path=None
+        )
+
+        self.assertEqual(len(results), 3)
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_persistent_cache_skips_model(self, mock_pipe):
+        """Scores written to the cache file are reused by a fresh process."""
+        mock_pipe.side_effect = _fake_pipe
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "scores.json")
+            analyze_sentiment_batch(["Guidance raised"], cache_path=cache_path)
+            self.assertTrue(os.path.exists(cache_path))
+
+            # Simulate a new process by dropping the in-memory caches
+            sentiment_ops._sentiment_caches.clear()
+            mock_pipe.reset_mock()
+
+            results, stats = analyze_sentiment_batch(
+                ["Guidance raised"], cache_path=cache_path
+            )
+
+        mock_pipe.assert_not_called()
+        self.assertEqual(results[0]["label"], "positive")
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["scored"], 0)
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_empty_input(self, mock_pipe):
+        """Empty input returns no results without calling the model."""
+        results, stats = analyze_sentiment_batch([], cache_path=None)
+
+        self.assertEqual(results, [])
+        self.assertEqual(stats["texts"], 0)
+        mock_pipe.assert_not_called()
+
+
+class TestSentimentBackends(unittest.TestCase):
+    """Tests for the alternative inference backends."""
+
+    def test_unknown_backend_raises(self):
+        """An unknown backend name is rejected."""
+        with self.assertRaises(ValueError):
+            sentiment_ops._build_pipeline("tpu")
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipeline")
+    @patch("transformers.AutoTokenizer.from_pretrained")
+    @patch("transformers.AutoModelForSequenceClassification.from_pretrained")
+    def test_int8_backend_quantizes_linear_layers(
+        self, mock_model, mock_tokenizer, mock_pipeline
+    ):
+        """The int8 backend hands a dynamically quantized model to the pipeline."""
+        import torch
+
+        mock_model.return_value = torch.nn.Sequential(torch.nn.Linear(4, 3))
+
+        sentiment_ops._build_pipeline("int8")
+
+        model = mock_pipeline.call_args[1]["model"]
+        self.assertIsInstance(model[0], torch.nn.quantized.dynamic.Linear)
+
+    @patch("algorithmic_trading_utilities.common.sentiment_ops._build_pipeline")
+    @patch("algorithmic_trading_utilities.common.sentiment_ops.pipe")
+    def test_compare_backends_reports_agreement(self, mock_pipe, mock_build):
+        """Label agreement and score drift are measured against the baseline."""
+        mock_pipe.side_effect = _fake_pipe
+
+        def candidate(texts, **kwargs):
+            outputs = _fake_pipe(texts)
+            outputs[-1] = {"label": "neutral", "score": 0.5}
+            for output in outputs[:-1]:
+                output["score"] = 0.88
+            return outputs
+
+        mock_build.return_value = candidate
+
+        texts = ["Profit up", "Sales up", "Orders up", "Loss widened"]
+        result = sentiment_ops.compare_sentiment_backends(texts, backend="int8")
+
+        self.assertEqual(result["label_agreement"], 0.75)
+        self.assertAlmostEqual(result["max_score_diff"], 0.02)
+        self.assertFalse(result["within_tolerance"])
+        self.assertIn("speedup", result)
+        mock_build.assert_called_once_with("int8")
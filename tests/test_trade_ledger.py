@@ -0,0 +1,154 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.attribution import compute_position_attribution, fills_frame
+from common.trade_ledger import match_trades, trade_statistics
+
+
+def _fill(symbol, side, qty, price, day):
+    return {
+        "activity_type": "FILL",
+        "symbol": symbol,
+        "side": side,
+        "qty": str(qty),
+        "price": str(price),
+        "transaction_time": f"2026-01-{day:02d}T15:00:00Z",
+    }
+
+
+# Two long lots, a sell that closes one and a half, a sell that flips the
+# position short, a buy that covers it, and an unmatched short in BBB
+ACTIVITIES = [
+    _fill("AAA", "buy", 10, 100, 1),
+    _fill("AAA", "buy", 10, 110, 2),
+    _fill("AAA", "sell", 15, 120, 3),
+    _fill("AAA", "sell", 10, 100, 4),
+    _fill("AAA", "buy", 5, 90, 5),
+    _fill("BBB", "sell_short", 3, 50, 1),
+]
+
+
+def _random_fills(n=2000, n_symbols=10, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "symbol": [f"S{i}" for i in rng.integers(0, n_symbols, n)],
+            "time": pd.date_range("2026-01-01", periods=n, freq="min", tz="UTC"),
+            "side": "",
+            "qty": rng.integers(1, 50, n).astype(float),
+            "price": rng.uniform(10, 100, n),
+        }
+    ).assign(signed_qty=lambda f: np.where(rng.random(n) < 0.5, 1, -1) * f["qty"])
+
+
+class TestMatchTrades:
+
+    # FIFO closes the oldest lot first and flips through flat into a short
+    def test_fifo(self):
+        trades = match_trades(ACTIVITIES, method="fifo")
+
+        assert trades[["side", "qty", "entry_price", "exit_price"]].values.tolist() == [
+            ["long", 10.0, 100.0, 120.0],
+            ["long", 5.0, 110.0, 120.0],
+            ["long", 5.0, 110.0, 100.0],
+            ["short", 5.0, 100.0, 90.0],
+        ]
+        assert trades["pnl"].tolist() == [200.0, 50.0, -50.0, 50.0]
+        assert trades["holding_days"].tolist() == [2.0, 1.0, 2.0, 1.0]
+        open_lots = trades.attrs["open_lots"]
+        assert open_lots[["symbol", "side", "qty"]].values.tolist() == [
+            ["BBB", "short", 3.0]
+        ]
+
+    # LIFO closes the newest lot first
+    def test_lifo(self):
+        trades = match_trades(ACTIVITIES, method="lifo")
+
+        assert trades["entry_price"].tolist() == [110.0, 100.0, 100.0, 100.0]
+        assert trades["pnl"].tolist() == [100.0, 100.0, 0.0, 50.0]
+
+    # realized P&L plus open lots at the last price equals the attribution P&L
+    @pytest.mark.parametrize("method", ["fifo", "lifo"])
+    def test_reconciles_with_attribution(self, method):
+        fills = _random_fills()
+
+        trades = match_trades(fills, method=method)
+
+        last_price = fills.groupby("symbol")["price"].last()
+        open_lots = trades.attrs["open_lots"]
+        signed = np.where(open_lots["side"] == "long", 1, -1) * open_lots["qty"]
+        mark = last_price.loc[open_lots["symbol"]].to_numpy()
+        unrealized = (
+            ((mark - open_lots["entry_price"]) * signed)
+            .groupby(open_lots["symbol"])
+            .sum()
+        )
+        realized = trades.groupby("symbol")["pnl"].sum()
+        total = realized.add(unrealized, fill_value=0.0)
+
+        attribution = compute_position_attribution(fills, as_of=fills["time"].max())
+        pd.testing.assert_series_equal(
+            total.sort_index(),
+            attribution["pnl"].sort_index(),
+            check_names=False,
+        )
+        # Every lot is either closed or still open
+        opened = fills.groupby("symbol")["qty"].sum()
+        matched = trades.groupby("symbol")["qty"].sum() * 2
+        left = open_lots.groupby("symbol")["qty"].sum()
+        assert (matched.add(left, fill_value=0.0) - opened).abs().max() < 1e-6
+
+    # a zero-quantity fill against open lots emits no trade row
+    def test_zero_quantity_fill_ignored(self):
+        activities = ACTIVITIES[:2] + [_fill("AAA", "sell", 0, 105, 3)]
+
+        trades = match_trades(activities, method="fifo")
+
+        assert trades.empty
+        assert trades.attrs["open_lots"]["qty"].tolist() == [10.0, 10.0]
+
+    # ledger is ordered by exit time
+    def test_sorted_by_exit(self):
+        trades = match_trades(_random_fills(), method="fifo")
+
+        assert trades["exit_time"].is_monotonic_increasing
+        assert (trades["entry_time"] <= trades["exit_time"]).all()
+
+    # unknown lot methods are rejected
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            match_trades(ACTIVITIES, method="average")
+
+    # no fills gives an empty ledger
+    def test_empty(self):
+        trades = match_trades([])
+
+        assert trades.empty
+        assert trades.attrs["open_lots"].empty
+
+
+class TestTradeStatistics:
+
+    # win rate, profit factor and holding time of the FIFO ledger
+    def test_statistics(self):
+        stats = trade_statistics(match_trades(ACTIVITIES))
+
+        assert stats["trades"] == 4
+        assert stats["win_rate"] == 0.75
+        assert stats["realized_pnl"] == 250.0
+        assert stats["profit_factor"] == 6.0
+        assert stats["average_loss"] == -50.0
+        assert stats["average_holding_days"] == 1.5
+        assert (stats["long_trades"], stats["short_trades"]) == (3, 1)
+
+    # ratios are None without trades
+    def test_empty(self):
+        stats = trade_statistics(match_trades(fills_frame([])))
+
+        assert stats["trades"] == 0
+        assert stats["win_rate"] is None
+        assert stats["profit_factor"] is None
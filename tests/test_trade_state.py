@@ -0,0 +1,301 @@
+import sys
+
+sys.path.insert(1, "algorithmic_trading_utilities")
+import asyncio
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+import websockets
+from alpaca.trading.enums import PositionSide
+from alpaca.trading.models import Order, Position, TradeUpdate
+
+from brokers.alpaca.trade_state import TradeStateCache
+from brokers.alpaca.orders import get_current_trailing_stop_orders
+from brokers.alpaca.positions import close_positions_below_threshold
+
+
+def _order_payload(symbol, status, order_type="trailing_stop", order_id=None):
+    now = "2026-04-06T14:00:00Z"
+    return {
+        "id": order_id or str(uuid.uuid4()),
+        "client_order_id": str(uuid.uuid4()),
+        "created_at": now,
+        "updated_at": now,
+        "submitted_at": now,
+        "symbol": symbol,
+        "asset_class": "us_equity",
+        "order_class": "simple",
+        "order_type": order_type,
+        "type": order_type,
+        "side": "sell",
+        "qty": "10",
+        "time_in_force": "gtc",
+        "status": status,
+        "extended_hours": False,
+    }
+
+
+def _position(symbol, qty, avg_entry, plpc, side="long"):
+    return Position(
+        asset_id=uuid.uuid4(),
+        symbol=symbol,
+        exchange="NASDAQ",
+        asset_class="us_equity",
+        avg_entry_price=str(avg_entry),
+        qty=str(qty),
+        side=side,
+        cost_basis=str(qty * avg_entry),
+        unrealized_plpc=str(plpc),
+    )
+
+
+def _trade_update(event, order, position_qty=None, price=None):
+    return {
+        "stream": "trade_updates",
+        "data": {
+            "event": event,
+            "order": order,
+            "timestamp": "2026-04-06T14:00:01Z",
+            "position_qty": position_qty,
+            "price": price,
+        },
+    }
+
+
+class _FakeTradingStreamServer:
+    """Local WebSocket server speaking the Alpaca trading stream protocol."""
+
+    def __init__(self, sessions):
+        # One list of messages per connection; the connection is dropped after
+        # its messages are sent, except for the last one which stays open.
+        self.sessions = list(sessions)
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    async def _handler(self, ws, path=None):
+        auth = json.loads(await ws.recv())
+        assert auth["action"] == "authenticate"
+        await ws.send(
+            json.dumps({"stream": "authorization", "data": {"status": "authorized"}})
+        )
+        listen = json.loads(await ws.recv())
+        assert listen["data"]["streams"] == ["trade_updates"]
+        await ws.send(
+            json.dumps({"stream": "listening", "data": {"streams": ["trade_updates"]}})
+        )
+        index = self.connections
+        self.connections += 1
+        for message in self.sessions[min(index, len(self.sessions) - 1)]:
+            await ws.send(json.dumps(message))
+        if index < len(self.sessions) - 1:
+            await ws.close()
+            return
+        await ws.wait_closed()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.server = self.loop.run_until_complete(
+            websockets.serve(self._handler, "127.0.0.1", 0)
+        )
+        self.url = f"ws://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        self.ready.set()
+        self.loop.run_forever()
+
+    def start(self):
+        self.thread.start()
+        self.ready.wait(5)
+        return self.url
+
+    async def _close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._close(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+def _wait_for(predicate, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestTradeStateCache:
+
+    # events update orders and positions without REST polling
+    def test_apply_trade_update(self):
+        client = MagicMock()
+        client.get_all_positions.return_value = [_position("AAPL", 10, 100.0, 0.01)]
+        stop = Order(**_order_payload("AAPL", "new"))
+        client.get_orders.return_value = [stop]
+        state = TradeStateCache(client=client, stream=MagicMock())
+
+        state.resync()
+        state.apply_trade_update(
+            TradeUpdate(
+                **_trade_update(
+                    "fill",
+                    _order_payload("AAPL", "filled", "market"),
+                    position_qty=20,
+                    price=110.0,
+                )["data"]
+            )
+        )
+        state.apply_trade_update(
+            TradeUpdate(
+                **_trade_update(
+                    "canceled",
+                    _order_payload("AAPL", "canceled", order_id=str(stop.id)),
+                )["data"]
+            )
+        )
+
+        position = state.position("AAPL")
+        assert float(position.qty) == 20
+        assert float(position.avg_entry_price) == pytest.approx(105.0)
+        assert float(position.unrealized_plpc) == pytest.approx(5 / 105)
+        assert state.open_orders() == []
+        assert client.get_all_positions.call_count == 1
+
+    # closing fill removes the position; a new symbol is fetched once
+    def test_fill_opens_and_closes_positions(self):
+        client = MagicMock()
+        client.get_all_positions.return_value = [_position("AAPL", 10, 100.0, 0.0)]
+        client.get_orders.return_value = []
+        client.get_open_position.return_value = _position("MSFT", 5, 300.0, 0.0)
+        state = TradeStateCache(client=client, stream=MagicMock())
+
+        for symbol, qty in (("AAPL", 0), ("MSFT", 5)):
+            state.apply_trade_update(
+                TradeUpdate(
+                    **_trade_update(
+                        "fill",
+                        _order_payload(symbol, "filled", "market"),
+                        position_qty=qty,
+                        price=100.0,
+                    )["data"]
+                )
+            )
+
+        assert state.position("AAPL") is None
+        assert state.position("MSFT").symbol == "MSFT"
+        client.get_open_position.assert_called_once_with("MSFT")
+
+    # update_prices marks shorts and longs to market
+    def test_update_prices(self):
+        client = MagicMock()
+        client.get_all_positions.return_value = [
+            _position("AAPL", 10, 100.0, 0.0),
+            _position("TSLA", 4, 200.0, 0.0, side="short"),
+        ]
+        client.get_orders.return_value = []
+        state = TradeStateCache(client=client, stream=MagicMock())
+
+        state.update_prices({"AAPL": 90.0, "TSLA": 210.0})
+
+        assert float(state.position("AAPL").unrealized_plpc) == pytest.approx(-0.1)
+        assert float(state.position("TSLA").unrealized_plpc) == pytest.approx(-0.05)
+        assert state.position("TSLA").side == PositionSide.SHORT
+
+    # resync pages through every open order, not just the first page
+    def test_resync_fetches_all_pages_of_open_orders(self):
+        start = datetime(2026, 4, 6, 14, tzinfo=timezone.utc)
+        orders = [
+            MagicMock(
+                id=f"o{i}", symbol="AAPL", submitted_at=start + timedelta(seconds=i)
+            )
+            for i in range(1200)
+        ]
+
+        def get_orders(filter):
+            rows = [
+                o
+                for o in orders
+                if filter.until is None or o.submitted_at < filter.until
+            ]
+            rows.sort(key=lambda o: o.submitted_at, reverse=True)
+            return rows[: filter.limit]
+
+        client = MagicMock()
+        client.get_all_positions.return_value = []
+        client.get_orders.side_effect = get_orders
+        state = TradeStateCache(client=client, stream=MagicMock())
+
+        state.resync()
+
+        assert len(state.open_orders()) == 1200
+        assert client.get_orders.call_count == 3
+        assert client.get_orders.call_args_list[0].kwargs["filter"].symbols is None
+
+    # helpers read from the state instead of REST
+    def test_helpers_read_from_state(self, mocker):
+        rest = mocker.patch("brokers.alpaca.positions.trading_client")
+        mocker.patch("brokers.alpaca.orders.trading_client", rest)
+        client = MagicMock()
+        client.get_all_positions.return_value = [
+            _position("AAPL", 10, 100.0, -0.08),
+            _position("MSFT", 5, 300.0, 0.02),
+        ]
+        client.get_orders.return_value = [
+            Order(**_order_payload("MSFT", "new")),
+            Order(**_order_payload("MSFT", "new", order_type="limit")),
+        ]
+        state = TradeStateCache(client=client, stream=MagicMock())
+
+        closed = close_positions_below_threshold(0.05, state=state)
+        stops = get_current_trailing_stop_orders(state=state)
+
+        assert closed == 1
+        rest.close_position.assert_called_once_with("AAPL")
+        rest.get_all_positions.assert_not_called()
+        rest.get_orders.assert_not_called()
+        assert [o.symbol for o in stops] == ["MSFT"]
+
+
+class TestTradeStateStream:
+
+    # consumes a local fake stream and resyncs from REST on reconnect
+    def test_stream_updates_and_resync_on_reconnect(self):
+        order = _order_payload("AAPL", "new")
+        server = _FakeTradingStreamServer(
+            [
+                [_trade_update("new", order)],
+                [
+                    _trade_update(
+                        "fill",
+                        _order_payload("AAPL", "filled", "market"),
+                        position_qty=15,
+                        price=100.0,
+                    )
+                ],
+            ]
+        )
+        url = server.start()
+        client = MagicMock()
+        client.get_all_positions.return_value = [_position("AAPL", 10, 100.0, 0.0)]
+        client.get_orders.return_value = []
+        state = TradeStateCache(client=client, url_override=url)
+        state.stream._reconnect_min_backoff = 0.05
+
+        state.start()
+        try:
+            assert _wait_for(lambda: state.event_count >= 2)
+        finally:
+            state.stop()
+            server.stop()
+
+        assert server.connections == 2
+        assert state.sync_count == 2
+        assert float(state.position("AAPL").qty) == 15
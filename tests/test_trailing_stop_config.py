@@ -4,8 +4,13 @@ Tests for adaptive trailing stop calculation.
 
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from algorithmic_trading_utilities.common.trailing_stop_config import (
     calculate_trailing_stop_pct,
+    calculate_trailing_stop_pct_array,
+    simulate_trailing_stops,
 )
 
 
@@ -90,5 +95,104 @@ class TestCalculateTrailingStopPct(unittest.TestCase):
         self.assertAlmostEqual(lower_pct, 0.05, places=3)
 
 
+class TestCalculateTrailingStopPctArray(unittest.TestCase):
+    """Test the vectorized trailing stop percentage calculation."""
+
+    def test_matches_scalar(self):
+        """Array results should equal the scalar function element-wise."""
+        rng = np.random.default_rng(0)
+        atr = rng.uniform(0.01, 5.0, 500)
+        price = rng.uniform(5.0, 300.0, 500)
+
+        result = calculate_trailing_stop_pct_array(atr, price, atr_multiplier=2.0)
+
+        expected = [
+            calculate_trailing_stop_pct(a, p, atr_multiplier=2.0)
+            for a, p in zip(atr, price)
+        ]
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    def test_invalid_inputs_fall_back(self):
+        """NaN or non-positive ATR/price should give the 10% fallback."""
+        result = calculate_trailing_stop_pct_array(
+            [np.nan, 0.0, -1.0, 1.0], [100.0, 100.0, 100.0, 0.0]
+        )
+        np.testing.assert_array_equal(result, [0.10, 0.10, 0.10, 0.10])
+
+
+def _loop_trailing_stop(path, pct, short):
+    """Reference single-position trailing stop on closes."""
+    water = path[0]
+    for t in range(1, len(path)):
+        stop = water * (1 + pct) if short else water * (1 - pct)
+        if (path[t] >= stop) if short else (path[t] <= stop):
+            # Closes only: the bar gapped through, so it fills at the close
+            return t, path[t]
+        water = min(water, path[t]) if short else max(water, path[t])
+    return -1, np.nan
+
+
+class TestSimulateTrailingStops(unittest.TestCase):
+    """Test the vectorized trailing stop simulator."""
+
+    def test_long_exit_at_stop(self):
+        """A long exits when price falls trail_pct below its high-water mark."""
+        prices = pd.DataFrame(
+            {"AAA": [100.0, 105.0, 110.0, 104.0, 100.0]},
+            index=pd.bdate_range("2024-01-01", periods=5),
+        )
+        result = simulate_trailing_stops(prices, trail_pct=0.05)
+
+        self.assertTrue(result["triggered"]["AAA"])
+        self.assertEqual(result["exit_index"]["AAA"], 3)
+        self.assertEqual(result["exit_date"]["AAA"], prices.index[3])
+        # 104 is below the 104.5 stop; closes only, so the fill is the close
+        self.assertAlmostEqual(result["exit_price"]["AAA"], 104.0)
+        self.assertAlmostEqual(result["stop_level"]["AAA"].iloc[2], 104.5)
+        self.assertTrue(np.isnan(result["water_mark"]["AAA"].iloc[4]))
+
+    def test_short_uses_low_water_mark(self):
+        """A short trails above the lowest low and exits at the stop intrabar."""
+        close = np.array([[50.0], [45.0], [44.0], [46.0]])
+        high = close + np.array([[0.0], [0.5], [0.5], [3.0]])
+        low = close - 0.5
+        result = simulate_trailing_stops(
+            close, trail_pct=0.10, side="short", high=high, low=low
+        )
+
+        # Low-water 43.5 on bar 2 -> stop 47.85, hit by bar 3's 49 high
+        self.assertEqual(result["exit_index"][0], 3)
+        self.assertAlmostEqual(result["exit_price"][0], 43.5 * 1.10)
+        self.assertAlmostEqual(result["return"][0], -(43.5 * 1.10 / 50.0 - 1))
+
+    def test_untriggered_return_to_last_close(self):
+        """Positions that never stop out report the return to the last close."""
+        prices = np.array([[100.0, 100.0], [102.0, 101.0], [103.0, np.nan]])
+        result = simulate_trailing_stops(prices, trail_pct=[0.05, 0.05])
+
+        np.testing.assert_array_equal(result["triggered"], [False, False])
+        np.testing.assert_array_equal(result["exit_index"], [-1, -1])
+        np.testing.assert_allclose(result["return"], [0.03, 0.01])
+
+    def test_trail_from_atr_and_matches_loop(self):
+        """Bulk ATR trails match the scalar rule; exits match a per-position loop."""
+        rng = np.random.default_rng(4)
+        n = 400
+        prices = 100 * np.exp(rng.normal(0, 0.02, (120, n)).cumsum(axis=0))
+        prices[0] = 100.0
+        atr = rng.uniform(0.5, 8.0, n)
+        sides = np.where(rng.random(n) < 0.5, "short", "long")
+
+        result = simulate_trailing_stops(prices, atr=atr, side=sides)
+
+        for j in range(n):
+            pct = calculate_trailing_stop_pct(atr[j], 100.0)
+            self.assertAlmostEqual(result["trail_pct"][j], pct)
+            index, price = _loop_trailing_stop(prices[:, j], pct, sides[j] == "short")
+            self.assertEqual(result["exit_index"][j], index)
+            if index >= 0:
+                self.assertAlmostEqual(result["exit_price"][j], price)
+
+
 if __name__ == "__main__":
     unittest.main()
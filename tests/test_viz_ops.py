@@ -3,10 +3,26 @@ import matplotlib
 matplotlib.use("Agg")  # Use non-interactive backend for testing
 import numpy as np
 import pandas as pd
+from algorithmic_trading_utilities.common.attribution import (
+    compute_position_attribution,
+)
 from algorithmic_trading_utilities.common.portfolio_ops import PerformanceMetrics
+import io
+import pickle
+
+import matplotlib.pyplot as plt
+
+import pytest
+
 from algorithmic_trading_utilities.common.viz_ops import (
     PerformanceViz,
     build_performance_figures,
+    downsample_series,
+    iter_attribution_figures,
+    iter_performance_figures,
+    lttb_downsample_indices,
+    minmax_downsample_indices,
+    render_performance_pages,
 )
 
 
@@ -19,6 +35,29 @@ class TestPerformanceViz:
         assert viz.portfolio.index.equals(portfolio.index)
         assert viz.benchmark.index.equals(benchmark.index)
 
+    # raw Series keep their DatetimeIndex when PerformanceViz builds the metrics
+    def test_init_with_series(self, sample_data):
+        _, portfolio, benchmark = sample_data
+        viz = PerformanceViz(portfolio_equity=portfolio, benchmark_equity=benchmark)
+        assert viz.pm.portfolio.index.equals(portfolio.index)
+        assert viz.pm.returns.index.equals(portfolio.index[1:])
+        assert viz.analytics.pm is viz.pm
+
+    # plots sharing a window reuse the same rolling series
+    def test_plots_share_analytics(self, sample_data, mocker):
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+        spy = mocker.spy(pm, "rolling_alpha_beta")
+
+        viz.create_all_plots(show=False)
+        viz.create_all_plots(show=False)
+
+        assert spy.call_count == 1
+        std = viz.analytics.rolling_std(63)
+        viz.plot_rolling_sharpe(show=False)
+        assert viz.analytics.rolling_std(63) is std
+        assert ("rolling_std", 63, True) in viz.analytics._cache
+
     def test_plot_equity_curve(self, sample_data):
         pm, _, _ = sample_data
         viz = PerformanceViz(pm=pm)
@@ -205,3 +244,214 @@ class TestBuildPerformanceFigures:
         )
         # Without alpha/beta we should have 2 fewer figures
         assert len(figs_without) == len(figs_with) - 2
+
+
+class TestIterPerformanceFigures:
+    def test_lazy_and_same_pages(self, sample_data):
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+        titles = [f.axes[0].get_title() for f in build_performance_figures(viz)]
+        plt.close("all")
+
+        pages = iter_performance_figures(viz)
+        assert plt.get_fignums() == []
+        first = next(pages)
+        assert len(plt.get_fignums()) == 1
+
+        streamed = [first.axes[0].get_title()]
+        plt.close(first)
+        for fig in pages:
+            streamed.append(fig.axes[0].get_title())
+            assert len(plt.get_fignums()) <= 2
+            plt.close(fig)
+        assert streamed == titles
+
+
+class TestIterAttributionFigures:
+    def _attribution(self, n_symbols):
+        activities = [
+            {
+                "activity_type": "FILL",
+                "symbol": f"S{i:03d}",
+                "side": side,
+                "qty": "10",
+                "price": str(100 + (i if side == "sell" else 0)),
+                "transaction_time": f"2026-01-0{day}T15:00:00Z",
+            }
+            for i in range(n_symbols)
+            for side, day in (("buy", 1), ("sell", 2))
+        ]
+        return compute_position_attribution(
+            activities, starting_equity=100_000, as_of="2026-01-05"
+        )
+
+    def test_chart_then_table_pages(self):
+        """A contribution chart, then tables of ``rows_per_page`` symbols."""
+        figs = list(iter_attribution_figures(self._attribution(50), rows_per_page=20))
+
+        assert len(figs) == 1 + 3
+        assert len(figs[0].axes[0].patches) == 30
+        assert "S049" in figs[1].texts[-1].get_text()
+        plt.close("all")
+
+    def test_page_count_capped(self):
+        """Past ``max_rows`` the middle symbols fold into one row."""
+        figs = list(
+            iter_attribution_figures(
+                self._attribution(500), rows_per_page=45, max_rows=90
+            )
+        )
+
+        assert len(figs) == 1 + 3
+        text = "".join(f.texts[-1].get_text() for f in figs[1:])
+        assert "(410 other symbols)" in text
+        plt.close("all")
+
+    def test_lists_every_symbol_by_default(self):
+        """Without ``max_rows`` every symbol gets its own table row."""
+        figs = list(iter_attribution_figures(self._attribution(500), rows_per_page=45))
+
+        assert len(figs) == 1 + 12
+        text = "".join(f.texts[-1].get_text() for f in figs[1:])
+        assert "other symbols" not in text
+        assert all(f"S{i:03d}" in text for i in range(500))
+        plt.close("all")
+
+    def test_empty_table_yields_nothing(self):
+        """No fills, no pages."""
+        assert list(iter_attribution_figures(compute_position_attribution([]))) == []
+
+
+class TestRenderPerformancePages:
+    def test_png_pages_match_figures_in_order(self, sample_data):
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+        figs = build_performance_figures(viz, show=False)
+
+        result = render_performance_pages(viz, fmt="png", dpi=50, max_workers=1)
+
+        pages = result["pages"]
+        assert len(pages) == len(figs)
+        assert [p["name"] for p in pages][:2] == ["cumulative_returns", "equity_curve"]
+        assert all(p["data"][:8] == b"\x89PNG\r\n\x1a\n" for p in pages)
+        assert list(result["timings"].index) == list(
+            dict.fromkeys(p["name"] for p in pages)
+        )
+        assert (result["timings"] > 0).all()
+
+    def test_pickle_pages_keep_masking(self, sample_data):
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+
+        pages = render_performance_pages(viz, fmt="pickle", max_workers=1)["pages"]
+
+        equity_fig = pickle.loads(pages[1]["data"])
+        assert len(equity_fig.axes[0].lines) == 1
+        assert viz.benchmark is not None
+
+    def test_in_process_keeps_caller_backend(self, sample_data):
+        """Rendering with max_workers=1 does not switch the caller's backend."""
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+        matplotlib.use("pdf")
+        try:
+            render_performance_pages(viz, dpi=50, max_workers=1)
+
+            assert matplotlib.get_backend() == "pdf"
+        finally:
+            matplotlib.use("Agg")
+
+    def test_process_pool_matches_in_process(self, sample_data):
+        pm, _, _ = sample_data
+        viz = PerformanceViz(pm=pm)
+
+        serial = render_performance_pages(viz, dpi=50, max_workers=1)
+        pooled = render_performance_pages(viz, dpi=50, max_workers=2)
+
+        assert [p["name"] for p in pooled["pages"]] == [
+            p["name"] for p in serial["pages"]
+        ]
+        assert pooled["elapsed_seconds"] > 0
+
+
+def _minute_equity(n=200_000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=n, freq="min")
+    return pd.Series(1e5 * np.exp(np.cumsum(rng.normal(0, 1e-4, n))), index=index)
+
+
+class TestDownsampling:
+    # min/max bucketing keeps every bucket extreme within the budget
+    def test_minmax_keeps_bucket_extremes(self):
+        y = np.random.default_rng(1).normal(size=10_001)
+        keep = minmax_downsample_indices(y, 100)
+
+        assert len(keep) <= 100
+        assert keep[0] == 0 and keep[-1] == len(y) - 1
+        assert y.argmin() in keep and y.argmax() in keep
+        assert np.all(np.diff(keep) > 0)
+
+    # LTTB follows the shape and adds back the global extremes
+    def test_lttb_keeps_endpoints_and_extremes(self):
+        y = np.sin(np.linspace(0, 20, 5_000)) + np.linspace(0, 1, 5_000)
+        y[1234] = -5.0
+        keep = lttb_downsample_indices(y, 200)
+
+        assert len(keep) <= 202
+        assert keep[0] == 0 and keep[-1] == len(y) - 1
+        assert 1234 in keep and y.argmax() in keep
+
+    # short series pass through, NaNs are dropped, unknown methods raise
+    def test_downsample_series_edges(self):
+        series = pd.Series([np.nan, 1.0, 2.0, 3.0])
+
+        assert downsample_series(series, 10).tolist() == [1.0, 2.0, 3.0]
+        assert downsample_series(series, 10, method=None) is series
+        with pytest.raises(ValueError):
+            downsample_series(series, 10, method="every_nth")
+
+
+class TestDownsampledPlots:
+    # the drawdown line is thinned but the deepest point is drawn exactly
+    def test_drawdown_series_keeps_max_drawdown(self):
+        equity = _minute_equity()
+        viz = PerformanceViz(
+            pm=PerformanceMetrics(equity, None), downsample="lttb", max_points=500
+        )
+
+        fig = viz.plot_drawdown_series(show=False)
+
+        line = fig.axes[0].lines[0]
+        expected = (equity / equity.cummax() - 1).min()
+        assert len(line.get_ydata()) <= 502
+        assert line.get_ydata().min() == pytest.approx(expected, abs=1e-12)
+
+    # a dict configures plots by name; downsample=False draws every point
+    def test_per_plot_configuration(self):
+        equity = _minute_equity(n=20_000)
+        viz = PerformanceViz(
+            pm=PerformanceMetrics(equity, None),
+            downsample={"equity_curve": "minmax"},
+            max_points=1000,
+        )
+
+        thinned = viz.plot_equity_curve(show=False).axes[0].lines[0]
+        full = viz.plot_equity_curve(show=False, downsample=False).axes[0].lines[0]
+        returns = viz.plot_cumulative_returns_timeseries(show=False).axes[0].lines[0]
+
+        assert len(thinned.get_ydata()) <= 1000
+        assert len(full.get_ydata()) == len(equity)
+        assert len(returns.get_ydata()) == len(equity)
+
+    # vector output shrinks by orders of magnitude
+    def test_pdf_size_reduction(self):
+        viz_full = PerformanceViz(pm=PerformanceMetrics(_minute_equity(), None))
+        viz_thin = PerformanceViz(pm=viz_full.pm, downsample="minmax")
+
+        sizes = []
+        for viz in (viz_full, viz_thin):
+            buffer = io.BytesIO()
+            viz.plot_drawdown_series(show=False).savefig(buffer, format="pdf")
+            sizes.append(len(buffer.getvalue()))
+
+        assert sizes[1] * 10 < sizes[0]